@@ -0,0 +1,14 @@
+"""
+Build Texture Atlas - InForHell
+Pack semua frame di images/ ke sheet atlas di data/atlas/.
+Game juga build otomatis saat atlas belum ada atau sudah basi.
+"""
+import pygame
+from src.core.atlas import TextureAtlas, ATLAS_DIR
+
+if __name__ == '__main__':
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    atlas = TextureAtlas.build()
+    print(f"Atlas disimpan di {ATLAS_DIR}: {atlas.sheet_count} sheet")
+    pygame.quit()
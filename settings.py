@@ -7,6 +7,24 @@ Konfigurasi dan konstanta global untuk game InForHell.
 WINDOW_WIDTH, WINDOW_HEIGHT = 1280, 720 
 TILE_SIZE = 64
 FPS = 60
+SIM_RATE = 60              # Tick simulasi per detik (fixed timestep, terpisah dari FPS render)
+MAX_SIM_STEPS = 5          # Batas langkah catch-up per frame, sisa waktu dibuang saat hitch
+STEERING_RATE = 15         # Refresh arah pathfinding enemy per detik, dibagi rata antar tick
+STEERING_BUDGET = 2.0      # Budget steering per tick (ms), enemy sisa lanjut di tick berikutnya
+SPAWN_RATE = 10            # Cek spawn enemy per detik
+HUD_RATE = 4               # Update teks HUD per detik
+FLOCKING_PERIOD = 4        # Refresh flocking enemy di layar setiap N tick (15 Hz)
+FLOCKING_LOD_DISTANCE = 640 # Setiap jarak ini (px) di luar layar, period flocking digandakan
+FLOCKING_MAX_PERIOD = 32   # Period flocking maksimum untuk enemy jauh (tick)
+SIM_LOD_DISTANCE = 512     # Enemy lebih jauh dari ini (px) di luar layar disimulasikan kasar
+RENDER_SCALE = 1.0         # Resolusi internal world (0.5 - 0.75 untuk mesin lemah), HUD tetap resolusi penuh
+RENDER_BACKEND = 'software'  # 'software' (Surface.blit) atau 'texture' (pygame._sdl2 Renderer)
+TEXTURE_ACCELERATED = True   # Backend texture: False memaksa software renderer SDL (tanpa GPU)
+CHUNK_SIZE = 512           # Ukuran chunk ground yang di-bake (px)
+CULL_MARGIN = 128          # Margin viewport culling kamera (px)
+DIRTY_RECTS = True         # Present hanya area yang berubah (full flip saat kamera bergeser)
+IDLE_DELAY = 1000          # Jeda tanpa input sebelum loop masuk mode idle (ms)
+IDLE_TIMEOUT = 500         # Timeout event.wait untuk layar statis saat idle (ms)
 
 # Pengaturan Player
 PLAYER_SPEED = 300
@@ -0,0 +1,151 @@
+"""
+Headless Simulation - InForHell
+Jalankan pipeline update Game tanpa window dan tanpa render, secepat CPU mampu.
+Untuk mengukur throughput simulasi dan mereproduksi beban late-game dalam hitungan detik.
+
+Contoh:
+    python simulate.py --seconds 600 --seed 1 --policy wander --immortal
+    python simulate.py --seconds 150 --seed 1 --policy wander --immortal --check
+"""
+import os
+import sys
+import math
+import random
+import argparse
+import subprocess
+from time import perf_counter
+
+# Driver dummy harus di-set sebelum pygame di-import
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+import settings
+
+# Budget steering berbasis waktu nyata membuat hasil tidak deterministik
+settings.STEERING_BUDGET = None
+
+from src.core.game import Game
+from src.core.clock import get_clock
+
+
+def idle_policy(player):
+    """Diam di tempat, skill dipakai setiap ready."""
+    return (0, 0), True
+
+
+def make_circle_policy(period: float = 8.0):
+    """Kiting melingkar: arah berputar penuh setiap period detik."""
+    def policy(player):
+        angle = get_clock().time / period * 2 * math.pi
+        return (math.cos(angle), math.sin(angle)), True
+    return policy
+
+
+def make_wander_policy(rng: random.Random, interval: float = 2.0):
+    """Arah acak (seeded) yang berganti setiap interval detik."""
+    state = {'next': 0.0, 'direction': (0, 0)}
+
+    def policy(player):
+        now = get_clock().time
+        if now >= state['next']:
+            angle = rng.uniform(0, 2 * math.pi)
+            state['direction'] = (math.cos(angle), math.sin(angle))
+            state['next'] = now + interval
+        return state['direction'], True
+    return policy
+
+
+def run(seconds: float, seed: int, policy: str, immortal: bool, interval: float) -> None:
+    random.seed(seed)
+    policies = {
+        'idle': idle_policy,
+        'circle': make_circle_policy(),
+        'wander': make_wander_policy(random.Random(seed)),
+    }
+
+    game = Game()
+    game.start()
+    game.player.controller = policies[policy]
+    clock = get_clock()
+
+    total_ticks = round(seconds / clock.step_time)
+    report_every = max(1, round(interval / clock.step_time))
+    print(f"{'sim_s':>7} {'ticks':>7} {'enemies':>8} {'bullets':>8} {'sprites':>8} {'ticks/s':>9}")
+
+    start = perf_counter()
+    window_start, window_ticks = start, 0
+    for tick in range(1, total_ticks + 1):
+        if immortal:
+            player = game.player
+            player.heal(player.stats.max_health)
+        game.step()
+        window_ticks += 1
+
+        if tick % report_every == 0 or tick == total_ticks or game.is_over:
+            now = perf_counter()
+            counts = game.entity_counts()
+            rate = window_ticks / (now - window_start) if now > window_start else float('inf')
+            print(f"{tick * clock.step_time:7.1f} {tick:7d} {counts['enemies']:8d} {counts['bullets']:8d} "
+                  f"{counts['sprites']:8d} {rate:9.0f}")
+            window_start, window_ticks = now, 0
+        if game.is_over:
+            print(f"Game over di tick {tick} ({game.elapsed_time:.1f} detik simulasi)")
+            break
+
+    wall = perf_counter() - start
+    ticks = min(tick, total_ticks)
+    print(f"\n{ticks} tick dalam {wall:.2f} detik: {ticks / wall:.0f} tick/s "
+          f"({ticks * clock.step_time / wall:.1f}x real-time)")
+    pygame.quit()
+
+
+def simulation_counts(output: str) -> list[str]:
+    """Baris hasil simulasi tanpa kolom ticks/s dan ringkasan waktu nyata (yang boleh berbeda)."""
+    rows = []
+    for line in output.splitlines():
+        fields = line.split()
+        if len(fields) == 6 and fields[1].isdigit():
+            rows.append(' '.join(fields[:5]))
+        elif line.startswith('Game over'):
+            rows.append(line)
+    return rows
+
+
+def check_determinism(argv: list[str]) -> bool:
+    """
+    Regression check: jalankan simulasi yang sama dua kali di proses terpisah
+    (hash seed Python berbeda), jumlah entity harus identik.
+    """
+    outputs = []
+    for hash_seed in ('1', '2'):
+        env = dict(os.environ, PYTHONHASHSEED=hash_seed)
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), *argv],
+                                env=env, capture_output=True, text=True, check=True)
+        outputs.append(simulation_counts(result.stdout))
+
+    first, second = outputs
+    if first == second:
+        print(f"Deterministik: {len(first)} baris laporan identik")
+        return True
+    for row_a, row_b in zip(first, second):
+        if row_a != row_b:
+            print(f"Berbeda: '{row_a}' vs '{row_b}'")
+            break
+    else:
+        print(f"Jumlah baris berbeda: {len(first)} vs {len(second)}")
+    return False
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Simulasi headless InForHell')
+    parser.add_argument('--seconds', type=float, default=120, help='Durasi simulasi (detik waktu game)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed RNG')
+    parser.add_argument('--policy', choices=['idle', 'circle', 'wander'], default='idle', help='Input player terskrip')
+    parser.add_argument('--immortal', action='store_true', help='Player tidak bisa mati (beban late-game)')
+    parser.add_argument('--interval', type=float, default=10, help='Interval laporan jumlah entity (detik simulasi)')
+    parser.add_argument('--check', action='store_true', help='Jalankan dua kali di proses terpisah dan bandingkan hasilnya')
+    args = parser.parse_args()
+    if args.check:
+        sys.exit(0 if check_determinism([arg for arg in sys.argv[1:] if arg != '--check']) else 1)
+    run(args.seconds, args.seed, args.policy, args.immortal, args.interval)
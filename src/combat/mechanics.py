@@ -6,6 +6,7 @@ import pygame
 import math
 from abc import ABC, abstractmethod
 from settings import GUN_COOLDOWN, PLAYER_BASE_DAMAGE, WINDOW_WIDTH, WINDOW_HEIGHT
+from src.core.clock import get_ticks, schedule
 
 
 class Upgrade(ABC):
@@ -55,7 +56,8 @@ class AttackMechanism(Upgrade, ABC):
     def __init__(self, name: str, description: str, cooldown: float, damage: float, max_level: int = 5):
         super().__init__(name, description, max_level)
         self.__base_cooldown = cooldown
-        self.__timer = 0
+        # Cooldown dihitung dari waktu reset terakhir, tanpa timer per frame
+        self.__last_reset = get_ticks()
         self.__damage = damage
         self.__cooldown_modifier = 1.0
     
@@ -73,23 +75,19 @@ class AttackMechanism(Upgrade, ABC):
         """Progress cooldown dari 0.0 sampai 1.0."""
         actual_cooldown = self.cooldown
         if actual_cooldown == 0: return 1.0
-        return min(1.0, self.__timer / actual_cooldown)
+        return min(1.0, (get_ticks() - self.__last_reset) / actual_cooldown)
     
     def can_attack(self) -> bool:
         """Cek apakah attack ready."""
-        return self.__timer >= self.cooldown
+        return get_ticks() - self.__last_reset >= self.cooldown
     
     def set_cooldown_modifier(self, modifier: float):
         """Set modifier cooldown dari player."""
         self.__cooldown_modifier = modifier
     
-    def update(self, dt: float):
-        """Update timer cooldown."""
-        self.__timer += dt * 1000
-    
     def reset_timer(self):
         """Reset timer setelah attack."""
-        self.__timer = 0
+        self.__last_reset = get_ticks()
         
     def _modify_cooldown(self, amount: float):
         """Modify base cooldown (internal)."""
@@ -187,7 +185,6 @@ class Skill(AttackMechanism):
         self.__projectile_count = 1
         self.__duration = 3000
         self.__is_active = False
-        self.__active_timer = 0
     
     @property
     def projectile_count(self):
@@ -201,16 +198,13 @@ class Skill(AttackMechanism):
         """Aktivasi skill jika ready."""
         if self.can_attack():
             self.__is_active = True
-            self.__active_timer = pygame.time.get_ticks()
             self.reset_timer()
+            schedule(self.__duration, self.__deactivate)
             return True
         return False
-            
-    def update_active(self, current_time):
-        """Cek apakah durasi skill sudah habis."""
-        if self.__is_active:
-            if current_time - self.__active_timer >= self.__duration:
-                self.__is_active = False
+    
+    def __deactivate(self):
+        self.__is_active = False
 
     def attack(self):
         """Execute skill attack logic."""
@@ -4,36 +4,31 @@ Implementasi skill aktif seperti Keyboard Rain.
 """
 import pygame
 from random import randint, choice
-from os.path import join
-from os import listdir
 from settings import WINDOW_WIDTH, WINDOW_HEIGHT
+from src.core.atlas import get_atlas
+from src.core.clock import get_ticks, schedule
 
 
-# Cache untuk keyboard images
+# Cache untuk keyboard images, collision mask, dan shadow
 _keyboard_images_cache = None
+_keyboard_masks_cache = {}
+_shadow_cache = {}
 
 def _load_keyboard_images():
-    """Load dan cache semua keyboard images dari folder."""
+    """Load dan cache semua keyboard images (beserta mask) dari folder."""
     global _keyboard_images_cache
     if _keyboard_images_cache is not None:
         return _keyboard_images_cache
     
-    _keyboard_images_cache = []
-    keyboard_folder = join('images', 'keyboard')
-    try:
-        for filename in listdir(keyboard_folder):
-            if filename.endswith('.png'):
-                img = pygame.image.load(join(keyboard_folder, filename)).convert_alpha()
-                # Scale 5x untuk visibility
-                orig_w, orig_h = img.get_size()
-                img = pygame.transform.scale(img, (orig_w * 5, orig_h * 5))
-                _keyboard_images_cache.append(img)
-    except:
+    _keyboard_images_cache = get_atlas().frames('keyboard')
+    if not _keyboard_images_cache:
         # Fallback jika folder tidak ada
         fallback = pygame.Surface((60, 60))
         fallback.fill((200, 200, 200))
         _keyboard_images_cache = [fallback]
     
+    for img in _keyboard_images_cache:
+        _keyboard_masks_cache[img] = pygame.mask.from_surface(img)
     return _keyboard_images_cache
 
 
@@ -41,8 +36,12 @@ class ProjectileShadow(pygame.sprite.Sprite):
     """Bayangan untuk proyektil jatuh."""
     def __init__(self, pos: tuple[int, int], size: tuple[int, int], groups):
         super().__init__(groups)
-        self.image = pygame.Surface(size, pygame.SRCALPHA)
-        pygame.draw.ellipse(self.image, (0, 0, 0, 100), (0, 0, size[0], size[1]))
+        # Surface dan mask shadow di-share per ukuran
+        if size not in _shadow_cache:
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.ellipse(surf, (0, 0, 0, 100), (0, 0, size[0], size[1]))
+            _shadow_cache[size] = (surf, pygame.mask.from_surface(surf))
+        self.image, self.mask = _shadow_cache[size]
         self.rect = self.image.get_frect(center=pos)
 
 
@@ -54,6 +53,7 @@ class KeyboardProjectile(pygame.sprite.Sprite):
         # Load random keyboard image
         keyboard_images = _load_keyboard_images()
         self.image = choice(keyboard_images)
+        self.mask = _keyboard_masks_cache[self.image]
         
         img_w, img_h = self.image.get_size()
         
@@ -69,7 +69,6 @@ class KeyboardProjectile(pygame.sprite.Sprite):
         self.__shadow = ProjectileShadow(target_pos, (img_w, img_h // 2), groups)
         self.__damage = damage
         self.__has_landed = False
-        self.__impact_time = 0
         self.__linger_duration = 200 
     
     @property
@@ -85,11 +84,9 @@ class KeyboardProjectile(pygame.sprite.Sprite):
                 self.__height = 0
                 self.rect.centery = self.__target_pos.y
                 self.__has_landed = True
-                self.__impact_time = pygame.time.get_ticks()
                 self.__shadow.kill()
-        else:
-            if pygame.time.get_ticks() - self.__impact_time >= self.__linger_duration:
-                self.kill()
+                # Linger sebentar setelah impact lalu hilang
+                schedule(self.__linger_duration, self.kill)
     
     def kill(self):
         if self.__shadow.alive():
@@ -102,18 +99,17 @@ class KeyboardRain:
     
     def __init__(self, groups):
         self.__groups = groups
-        self.__spawn_timer = 0
         self.__spawn_interval = 100 
         self.player = None
         
         self.__name = "Keyboard Rain"
         self.__base_cooldown = 20000  # 20 detik
         self.__damage = 100
-        self.__timer = 10000  # Ready di awal
+        # Cooldown dihitung dari waktu pemakaian terakhir (10 detik sudah berjalan di awal)
+        self.__last_used = get_ticks() - 10000
         self.__cooldown_modifier = 1.0
         
         self.__is_active = False
-        self.__active_timer = 0
         self.__duration = 3000  # 3 detik aktif
         
     @property
@@ -134,7 +130,7 @@ class KeyboardRain:
         actual_cooldown = self.cooldown
         if actual_cooldown == 0: 
             return 1.0
-        return min(1.0, self.__timer / actual_cooldown)
+        return min(1.0, (get_ticks() - self.__last_used) / actual_cooldown)
     
     @property
     def is_active(self): 
@@ -142,7 +138,7 @@ class KeyboardRain:
     
     def can_attack(self) -> bool:
         """Cek apakah skill sudah ready."""
-        return self.__timer >= self.cooldown
+        return get_ticks() - self.__last_used >= self.cooldown
 
     @property
     def is_ready(self) -> bool:
@@ -161,28 +157,20 @@ class KeyboardRain:
         """Aktivasi skill jika ready."""
         if self.can_attack():
             self.__is_active = True
-            self.__active_timer = pygame.time.get_ticks()
-            self.__timer = 0
+            self.__last_used = get_ticks()
+            schedule(self.__duration, self.__deactivate)
+            self.__rain()
             return True
         return False
     
-    def update_active(self, current_time):
-        """Update status aktif skill."""
-        if self.__is_active:
-            if current_time - self.__active_timer >= self.__duration:
-                self.__is_active = False
-        
-    def update(self, dt):
-        """Update skill setiap frame."""
-        self.__timer += dt * 1000 
-        current_time = pygame.time.get_ticks()
-        self.update_active(current_time)
-        
-        # Spawn keyboard saat aktif
+    def __deactivate(self):
+        self.__is_active = False
+    
+    def __rain(self):
+        """Spawn keyboard setiap spawn interval selama skill aktif."""
         if self.__is_active:
-            if current_time - self.__spawn_timer >= self.__spawn_interval:
-                self.attack()
-                self.__spawn_timer = current_time
+            self.attack()
+            schedule(self.__spawn_interval, self.__rain)
                 
     def attack(self):
         """Spawn keyboard projectile di sekitar player."""
@@ -4,30 +4,35 @@ Implementasi visualisasi proyektil (Bullet).
 """
 import pygame
 from settings import BULLET_SPEED, BULLET_LIFETIME
+from src.core.clock import schedule
 
 
 class Bullet(pygame.sprite.Sprite):
     """Proyektil peluru."""
     
     def __init__(self, surf: pygame.Surface, pos: tuple, direction: pygame.Vector2, 
-                 groups, damage: int = 10):
+                 groups, damage: int = 10, mask: pygame.Mask = None):
         super().__init__(groups)
         self.image = surf 
+        # Mask dari asset yang sudah di-precompute, fallback buat sekali saat spawn
+        self.mask = mask if mask is not None else pygame.mask.from_surface(surf)
         self.rect = self.image.get_frect(center=pos)
         
-        self.__spawn_time = pygame.time.get_ticks()
         self.__lifetime = BULLET_LIFETIME
         self.__direction = direction 
         self.__speed = BULLET_SPEED
         self.__damage = damage
+        # Lifetime lewat timer wheel, bukan cek waktu setiap frame
+        self.__expiry = schedule(self.__lifetime, self.kill)
     
     @property
     def damage(self) -> int:
         return self.__damage
     
     def update(self, dt: float) -> None:
-        """Update posisi peluru dan cek lifetime."""
+        """Update posisi peluru."""
         self.rect.center += self.__direction * self.__speed * dt
-
-        if pygame.time.get_ticks() - self.__spawn_time >= self.__lifetime:
-            self.kill()
+    
+    def kill(self):
+        self.__expiry.cancel()
+        super().kill()
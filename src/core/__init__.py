@@ -2,3 +2,9 @@
 from .game import Game
 from .groups import AllSprites
 from .pathfinding import Pathfinder
+from .tilemap import ChunkedGround
+from .spatial import SpatialGrid, SpatialGroup
+from .render import RenderQueue, DirtyPresenter
+from .scheduler import Scheduler
+from .clock import SimClock, get_clock, set_clock
+from .texture_render import TextureBackend
@@ -0,0 +1,235 @@
+"""
+Texture Atlas Module
+Pack semua frame (sudah di-crop dan di-scale) dari folder images/ ke beberapa sheet
+dengan index ringkas. Saat startup frame dibuat sebagai subsurface dari sheet.
+"""
+import pygame
+import json
+import os
+from os.path import join
+from os import listdir, walk
+
+ATLAS_DIR = join('data', 'atlas')
+ATLAS_INDEX = join(ATLAS_DIR, 'index.json')
+ATLAS_VERSION = 1
+SHEET_SIZE = 2048
+FRAME_PADDING = 1
+
+# Atlas yang sudah di-load (di-share semua loader)
+_atlas = None
+
+
+def _load_scaled_folder(folder: str, scale: float) -> list[pygame.Surface]:
+    """Load semua png dalam folder (urutan listdir) dan scale."""
+    frames = []
+    for filename in listdir(folder):
+        if filename.endswith('.png'):
+            img = pygame.image.load(join(folder, filename)).convert_alpha()
+            orig_w, orig_h = img.get_size()
+            frames.append(pygame.transform.scale(img, (orig_w * scale, orig_h * scale)))
+    return frames
+
+
+def _load_enemy_folder(folder_path: str) -> list[pygame.Surface]:
+    """Load frame enemy (urut angka) dan auto-crop untuk hitbox yang akurat."""
+    frames = []
+    for _, __, file_names in walk(folder_path):
+        png_files = [f for f in file_names if f.endswith('.png')]
+        try:
+            png_files.sort(key=lambda name: int(name.split('.')[0]))
+        except ValueError:
+            png_files.sort()
+
+        for file_name in png_files:
+            full_path = join(folder_path, file_name)
+            try:
+                surf = pygame.image.load(full_path).convert_alpha()
+                frames.append(surf.subsurface(surf.get_bounding_rect()))
+            except Exception as e:
+                print(f"Gagal load {file_name}: {e}")
+    return frames
+
+
+def _load_player_folder(folder: str) -> list[pygame.Surface]:
+    """Load frame animasi player (urut angka)."""
+    frames = []
+    for folder_path, sub_folders, file_names in walk(folder):
+        if file_names:
+            for file_name in sorted(file_names, key=lambda name: int(name.split('.')[0])):
+                frames.append(pygame.image.load(join(folder_path, file_name)).convert_alpha())
+    return frames
+
+
+def _load_ui_image(file_name: str, scale: float = 1, size: tuple = None) -> list[pygame.Surface]:
+    img = pygame.image.load(join('images', 'ui', file_name)).convert_alpha()
+    if size:
+        img = pygame.transform.scale(img, size)
+    elif scale != 1:
+        orig_w, orig_h = img.get_size()
+        img = pygame.transform.scale(img, (orig_w * scale, orig_h * scale))
+    return [img]
+
+
+def _load_sources() -> dict[str, list[pygame.Surface]]:
+    """
+    Load semua group frame langsung dari file (tanpa atlas).
+    Key group: 'gun', 'keyboard', 'enemies/<tipe>', 'player/<arah>', 'ui/<nama>'.
+    """
+    groups = {}
+    recipes = [
+        ('gun', lambda: _load_scaled_folder(join('images', 'gun'), 2.5)),
+        ('keyboard', lambda: _load_scaled_folder(join('images', 'keyboard'), 5)),
+        ('ui/healthoverlay', lambda: _load_ui_image('healthoverlay.png', 2)),
+        ('ui/expoverlay', lambda: _load_ui_image('expoverlay.png', 2)),
+        ('ui/skillbutton', lambda: _load_ui_image('skillbutton.png')),
+        ('ui/button', lambda: _load_ui_image('button.png')),
+        ('ui/inforhell', lambda: _load_ui_image('inforhell.png', size=(450, 450))),
+    ]
+    for state in ['left', 'right', 'up', 'down']:
+        recipes.append((f'player/{state}', lambda state=state: _load_player_folder(join('images', 'player', state))))
+
+    enemies_path = join('images', 'enemies')
+    enemy_walk = list(walk(enemies_path))
+    if enemy_walk:
+        for folder in enemy_walk[0][1]:
+            recipes.append((f'enemies/{folder}', lambda folder=folder: _load_enemy_folder(join(enemies_path, folder))))
+
+    for name, recipe in recipes:
+        try:
+            groups[name] = recipe()
+        except Exception as e:
+            print(f"Gagal load group {name}: {e}")
+            groups[name] = []
+    return groups
+
+
+def _source_signature() -> list:
+    """Signature file sumber (path, ukuran, mtime) untuk deteksi atlas yang basi."""
+    signature = []
+    for folder_path, sub_folders, file_names in walk('images'):
+        sub_folders.sort()
+        for file_name in sorted(file_names):
+            if file_name.endswith('.png'):
+                full_path = join(folder_path, file_name)
+                stat = os.stat(full_path)
+                signature.append([full_path.replace(os.sep, '/'), stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+class TextureAtlas:
+    """
+    Kumpulan group frame yang disimpan sebagai subsurface dari sheet atlas.
+
+    Usage:
+        atlas = get_atlas()
+        frames = atlas.frames('enemies/burnout')
+    """
+
+    def __init__(self, groups: dict[str, list[pygame.Surface]], sheets: list[pygame.Surface] = None):
+        self.__groups = groups
+        self.__sheets = sheets or []
+
+    @property
+    def sheet_count(self) -> int:
+        return len(self.__sheets)
+
+    def frames(self, name: str) -> list[pygame.Surface]:
+        """List frame sebuah group (di-share, jangan dimodifikasi). List kosong jika tidak ada."""
+        return self.__groups.get(name, [])
+
+    def group_names(self, prefix: str) -> list[str]:
+        """Nama sub-group dengan prefix tertentu, misal group_names('enemies') -> ['burnout', ...]."""
+        start = prefix.rstrip('/') + '/'
+        return [name[len(start):] for name in self.__groups if name.startswith(start)]
+
+    @staticmethod
+    def __pack(groups: dict[str, list[pygame.Surface]]):
+        """Shelf packing semua frame ke sheet SHEET_SIZE x SHEET_SIZE."""
+        entries = [(name, i, surf) for name, frames in groups.items() for i, surf in enumerate(frames)]
+        entries.sort(key=lambda entry: entry[2].get_height(), reverse=True)
+
+        placements = {}
+        sheet_sizes = []
+        sheet, x, y, shelf_height, used_width = -1, 0, 0, 0, 0
+        for name, i, surf in entries:
+            w, h = surf.get_width() + FRAME_PADDING, surf.get_height() + FRAME_PADDING
+            if sheet < 0 or x + w > SHEET_SIZE:
+                x, y, shelf_height = 0, y + shelf_height, 0
+            if sheet < 0 or y + h > SHEET_SIZE:
+                if sheet >= 0:
+                    sheet_sizes[sheet][1] = y
+                sheet, x, y, shelf_height, used_width = sheet + 1, 0, 0, 0, 0
+                sheet_sizes.append([0, 0])
+            placements[(name, i)] = [sheet, x, y, surf.get_width(), surf.get_height()]
+            x += w
+            shelf_height = max(shelf_height, h)
+            used_width = max(used_width, x)
+            sheet_sizes[sheet][0] = used_width
+        if sheet >= 0:
+            sheet_sizes[sheet][1] = y + shelf_height
+        return placements, sheet_sizes
+
+    @classmethod
+    def build(cls, save: bool = True) -> 'TextureAtlas':
+        """Load semua frame dari file, pack ke sheet, dan simpan atlas ke disk."""
+        groups = _load_sources()
+        placements, sheet_sizes = cls.__pack(groups)
+
+        sheets = [pygame.Surface(size, pygame.SRCALPHA).convert_alpha() for size in sheet_sizes]
+        for sheet in sheets:
+            sheet.fill((0, 0, 0, 0))
+        index = {}
+        for name, frames in groups.items():
+            index[name] = []
+            for i, surf in enumerate(frames):
+                sheet, x, y, w, h = placements[(name, i)]
+                sheets[sheet].blit(surf, (x, y))
+                index[name].append(placements[(name, i)])
+
+        atlas = cls(cls.__cut(sheets, index), sheets)
+        if save:
+            try:
+                os.makedirs(ATLAS_DIR, exist_ok=True)
+                sheet_files = []
+                for i, sheet in enumerate(sheets):
+                    sheet_files.append(f'sheet_{i}.png')
+                    pygame.image.save(sheet, join(ATLAS_DIR, sheet_files[-1]))
+                with open(ATLAS_INDEX, 'w') as f:
+                    json.dump({
+                        'version': ATLAS_VERSION,
+                        'signature': _source_signature(),
+                        'sheets': sheet_files,
+                        'groups': index
+                    }, f, separators=(',', ':'))
+            except (IOError, pygame.error) as e:
+                print(f"Gagal menyimpan atlas: {e}")
+        return atlas
+
+    @classmethod
+    def load(cls) -> 'TextureAtlas':
+        """Load atlas dari disk. Return None jika tidak ada atau sudah basi."""
+        try:
+            with open(ATLAS_INDEX, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != ATLAS_VERSION or data.get('signature') != _source_signature():
+                return None
+            sheets = [pygame.image.load(join(ATLAS_DIR, name)).convert_alpha() for name in data['sheets']]
+            return cls(cls.__cut(sheets, data['groups']), sheets)
+        except (IOError, ValueError, KeyError, IndexError, pygame.error):
+            return None
+
+    @staticmethod
+    def __cut(sheets: list[pygame.Surface], index: dict) -> dict[str, list[pygame.Surface]]:
+        """Buat frame sebagai subsurface dari sheet berdasarkan index."""
+        return {
+            name: [sheets[sheet].subsurface((x, y, w, h)) for sheet, x, y, w, h in entries]
+            for name, entries in index.items()
+        }
+
+
+def get_atlas() -> TextureAtlas:
+    """Atlas global: load dari disk, atau build ulang jika belum ada / basi."""
+    global _atlas
+    if _atlas is None:
+        _atlas = TextureAtlas.load() or TextureAtlas.build()
+    return _atlas
@@ -0,0 +1,142 @@
+"""
+Clock Module
+Jam simulasi yang dibaca semua sistem game sebagai pengganti pygame.time.get_ticks().
+Waktu hanya maju per tick simulasi, sehingga bisa di-scale, di-pause, dan di-step manual.
+Expiry dan cooldown dijadwalkan lewat schedule() ke timer wheel milik jam.
+"""
+from math import ceil
+from settings import SIM_RATE, MAX_SIM_STEPS
+from src.core.timers import TimerWheel, Timer
+
+# Jam global (bisa diganti lewat set_clock, misal untuk runner headless)
+_clock = None
+
+
+class SimClock:
+    """
+    Jam simulasi dengan fixed timestep.
+    advance() mengubah waktu nyata menjadi jumlah tick yang harus dijalankan,
+    tick() memajukan waktu simulasi satu langkah.
+
+    Usage:
+        clock = get_clock()
+        for _ in range(clock.advance(frame_time)):
+            clock.tick()
+            update(clock.step_time)
+        alpha = clock.alpha
+    """
+
+    def __init__(self, tick_rate: int = SIM_RATE, max_steps: int = MAX_SIM_STEPS):
+        self.__step_time = 1 / tick_rate
+        self.__max_steps = max_steps
+        self.__tick_count = 0
+        self.__time_scale = 1.0
+        self.__paused = False
+        self.__pending_steps = 0
+        self.__accumulator = 0.0
+        self.__timers = TimerWheel()
+
+    @property
+    def step_time(self) -> float:
+        """Durasi satu tick simulasi (detik)."""
+        return self.__step_time
+
+    @property
+    def tick_count(self) -> int:
+        return self.__tick_count
+
+    @property
+    def time(self) -> float:
+        """Waktu simulasi (detik)."""
+        return self.__tick_count * self.__step_time
+
+    @property
+    def ticks(self) -> int:
+        """Waktu simulasi (ms), padanan pygame.time.get_ticks()."""
+        return int(self.__tick_count * self.__step_time * 1000)
+
+    @property
+    def timers(self) -> TimerWheel:
+        return self.__timers
+
+    @property
+    def alpha(self) -> float:
+        """Posisi render di antara dua tick terakhir (0.0 - 1.0)."""
+        return self.__accumulator / self.__step_time
+
+    @property
+    def time_scale(self) -> float:
+        return self.__time_scale
+
+    @time_scale.setter
+    def time_scale(self, value: float) -> None:
+        """Kecepatan simulasi relatif waktu nyata (2.0 = fast-forward 2x)."""
+        self.__time_scale = max(0.0, value)
+
+    @property
+    def paused(self) -> bool:
+        return self.__paused
+
+    def pause(self) -> None:
+        self.__paused = True
+
+    def resume(self) -> None:
+        self.__paused = False
+
+    def step(self, count: int = 1) -> None:
+        """Jadwalkan tick manual, tetap jalan walau jam di-pause."""
+        self.__pending_steps += count
+
+    def advance(self, frame_time: float) -> int:
+        """
+        Tambahkan waktu nyata sebuah frame, return jumlah tick yang jatuh tempo.
+        Batas catch-up ikut di-scale agar fast-forward tidak terpotong.
+        """
+        steps = self.__pending_steps
+        self.__pending_steps = 0
+        if self.__paused:
+            return steps
+
+        self.__accumulator += frame_time * self.__time_scale
+        due = int(self.__accumulator // self.__step_time)
+        limit = ceil(self.__max_steps * max(1.0, self.__time_scale))
+        if due > limit:
+            # Tertinggal terlalu jauh, simulasi melambat sesaat daripada freeze
+            due = limit
+            self.__accumulator %= self.__step_time
+        else:
+            self.__accumulator -= due * self.__step_time
+        return steps + due
+
+    def tick(self) -> None:
+        """Majukan waktu simulasi satu tick dan jalankan timer yang jatuh tempo."""
+        self.__tick_count += 1
+        self.__timers.advance(self.__tick_count)
+
+    def schedule(self, delay: float, callback) -> Timer:
+        """Jadwalkan callback() setelah delay ms waktu simulasi (dibulatkan ke atas per tick)."""
+        return self.__timers.schedule(ceil(delay / (self.__step_time * 1000) - 1e-9), callback)
+
+
+def get_clock() -> SimClock:
+    """Jam simulasi global, dibuat saat pertama kali dipakai."""
+    global _clock
+    if _clock is None:
+        _clock = SimClock()
+    return _clock
+
+
+def set_clock(clock: SimClock) -> None:
+    """Ganti jam global (harus sebelum objek game dibuat)."""
+    global _clock
+    _clock = clock
+
+
+def get_ticks() -> int:
+    """Waktu simulasi (ms) dari jam global."""
+    return get_clock().ticks
+
+
+def schedule(delay: float, callback) -> Timer:
+    """Jadwalkan callback() setelah delay ms di jam global."""
+    return get_clock().schedule(delay, callback)
@@ -8,7 +8,15 @@ Tiga aturan utama:
 3. Cohesion - Tetap berkelompok dengan musuh terdekat
 """
 import pygame
+from math import ceil
 from typing import List, TYPE_CHECKING
+from settings import FLOCKING_PERIOD, FLOCKING_LOD_DISTANCE, FLOCKING_MAX_PERIOD
+from src.core.spatial import view_distance
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 if TYPE_CHECKING:
     from src.entities.enemies import Enemy
@@ -58,7 +66,13 @@ class FlockingBehavior:
         neighbors = []
         my_pos = pygame.Vector2(self.enemy.rect.center)
         
-        for sprite in self.enemy_sprites:
+        # SpatialGroup: cukup kandidat di sekitar perception radius
+        if hasattr(self.enemy_sprites, 'query_radius'):
+            candidates = self.enemy_sprites.query_radius(self.enemy.rect.center, self.perception_radius)
+        else:
+            candidates = self.enemy_sprites
+        
+        for sprite in candidates:
             if sprite == self.enemy:
                 continue
             
@@ -168,3 +182,85 @@ class FlockingBehavior:
             total_force = total_force.normalize()
         
         return total_force
+
+
+def flocking_period(position, view_rect) -> int:
+    """
+    Period refresh flocking force (tick) berdasarkan jarak ke layar.
+    Di dalam layar FLOCKING_PERIOD, digandakan setiap FLOCKING_LOD_DISTANCE di luar layar.
+    """
+    level = ceil(view_distance(position, view_rect) / FLOCKING_LOD_DISTANCE)
+    return min(FLOCKING_MAX_PERIOD, FLOCKING_PERIOD << min(level, 16))
+
+
+def _normalized(vectors: 'np.ndarray') -> 'np.ndarray':
+    """Normalisasi per baris, vektor nol tetap nol."""
+    length = np.hypot(vectors[:, 0], vectors[:, 1])
+    moving = length > 0
+    vectors[moving] /= length[moving, None]
+    return vectors
+
+
+def flocking_forces(positions: 'np.ndarray', directions: 'np.ndarray', subjects: 'np.ndarray',
+                    perception_radius: 'np.ndarray', separation_weight: 'np.ndarray',
+                    alignment_weight: 'np.ndarray', cohesion_weight: 'np.ndarray',
+                    candidates: 'np.ndarray' = None, block: int = None) -> 'np.ndarray':
+    """
+    Kernel Boids batch (butuh NumPy): hasil sama dengan FlockingBehavior.calculate()
+    untuk banyak enemy sekaligus.
+    
+    Args:
+        positions: (N, 2) center semua enemy (kandidat neighbor)
+        directions: (N, 2) arah pathfinding semua enemy (untuk alignment)
+        subjects: (K,) index baris positions yang dihitung force-nya
+        perception_radius, separation_weight, alignment_weight, cohesion_weight: (K,) parameter per subject
+        candidates: (K, C) index kandidat neighbor per subject (-1 = kosong), default semua N
+        block: jumlah subject per blok (membatasi memori matriks jarak K x C)
+    
+    Returns:
+        np.ndarray: (K, 2) flocking force per subject (normalized, nol jika tanpa neighbor)
+    """
+    forces = np.zeros((len(subjects), 2))
+    width = len(positions) if candidates is None else candidates.shape[1]
+    block = block or max(1, 65536 // max(1, width))
+    for start in range(0, len(subjects), block):
+        rows = slice(start, start + block)
+        me = positions[subjects[rows]]
+        if candidates is None:
+            valid = True
+            others, other_directions = positions[None], directions[None]
+        else:
+            valid = candidates[rows] >= 0
+            index = np.where(valid, candidates[rows], 0)
+            others, other_directions = positions[index], directions[index]
+        
+        # Neighbor: 0 < jarak < perception radius (diri sendiri otomatis terbuang)
+        diff_x = me[:, 0, None] - others[..., 0]
+        diff_y = me[:, 1, None] - others[..., 1]
+        dist_sq = diff_x * diff_x + diff_y * diff_y
+        radius = perception_radius[rows, None]
+        neighbor = valid & (dist_sq > 0) & (dist_sq < radius * radius)
+        count = neighbor.sum(axis=1)
+        if not count.any():
+            continue
+        weight = neighbor.astype(np.float64)
+        
+        # Separation: dorongan menjauh dengan inverse square falloff
+        dist = np.sqrt(np.where(neighbor, dist_sq, 1.0))
+        push = weight / (dist * dist * dist) * 100
+        separation = _normalized(np.stack(((diff_x * push).sum(axis=1), (diff_y * push).sum(axis=1)), axis=1))
+        
+        # Alignment: rata-rata arah neighbor, Cohesion: menuju rata-rata posisi neighbor
+        divisor = np.maximum(count, 1)[:, None]
+        if candidates is None:
+            alignment = _normalized(weight @ directions / divisor)
+            cohesion = _normalized(weight @ positions / divisor - me)
+        else:
+            alignment = _normalized(np.einsum('kc,kcd->kd', weight, other_directions) / divisor)
+            cohesion = _normalized(np.einsum('kc,kcd->kd', weight, others) / divisor - me)
+        
+        total = (separation * separation_weight[rows, None] + alignment * alignment_weight[rows, None] +
+                 cohesion * cohesion_weight[rows, None])
+        total[count == 0] = 0
+        forces[rows] = _normalized(total)
+    return forces
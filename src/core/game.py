@@ -5,15 +5,24 @@ Class utama yang mengatur jalannya game InForHell.
 import pygame
 import random
 from os.path import join
-from os import listdir, walk
 from pytmx.util_pygame import load_pygame
 
-from settings import WINDOW_WIDTH, WINDOW_HEIGHT, FPS, TILE_SIZE, GUN_COOLDOWN
+from settings import (WINDOW_WIDTH, WINDOW_HEIGHT, FPS, SIM_RATE, TILE_SIZE, GUN_COOLDOWN,
+                      STEERING_RATE, STEERING_BUDGET, SPAWN_RATE, HUD_RATE, IDLE_DELAY, IDLE_TIMEOUT,
+                      DIRTY_RECTS, RENDER_BACKEND, TEXTURE_ACCELERATED)
 from src.core.groups import AllSprites
 from src.core.pathfinding import Pathfinder
+from src.core.tilemap import ChunkedGround
+from src.core.atlas import get_atlas
+from src.core.render import DirtyPresenter
+from src.core.scheduler import Scheduler
+from src.core.clock import get_clock
+from src.core.texture_render import TextureBackend
+from src.core.spatial import SpatialGroup
 from src.entities.player import Player
-from src.entities.sprites import Sprite, CollisionSprite
-from src.entities.enemies import EnemyFactory 
+from src.entities.sprites import CollisionSprite
+from src.entities.enemies import Enemy, EnemyFactory
+from src.entities.enemy_store import EnemyGroup
 from src.combat.weapons import Bullet
 from src.combat.skills import KeyboardRain
 from src.combat.mechanics import WeaponDefault
@@ -36,9 +45,26 @@ class Game:
     
     def __init__(self):
         pygame.init()
-        self.__display_surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption('InForHell')
+        
+        # Backend texture (opsional): UI digambar ke layer Surface, world lewat Renderer SDL2
+        self.__texture_backend = None
+        if RENDER_BACKEND == 'texture':
+            self.__texture_backend = TextureBackend.create((WINDOW_WIDTH, WINDOW_HEIGHT), 'InForHell', TEXTURE_ACCELERATED)
+        if self.__texture_backend:
+            self.__display_surface = self.__texture_backend.ui_surface
+        else:
+            self.__display_surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+            pygame.display.set_caption('InForHell')
         self.__clock = pygame.time.Clock()
+        self.__last_input_time = 0
+        
+        # Jam simulasi (fixed timestep), waktu hanya maju saat gameplay berjalan
+        self.__sim_clock = get_clock()
+        
+        # Present dirty-rect: full flip saat layar aktif berganti atau kamera bergeser
+        self.__presenter = DirtyPresenter(DIRTY_RECTS and not self.__texture_backend)
+        self.__presented_screen = None
+        self.__presented_offset = None
         
         self.__score_manager = ScoreManager()
         self.__in_menu = True
@@ -49,14 +75,22 @@ class Game:
 
     def __setup_game_components(self):
         """Inisialisasi semua komponen game"""
+        # Timer dari sesi sebelumnya tidak boleh jalan di sesi baru
+        self.__sim_clock.timers.clear()
         self.__game_state = GameState()
-        self.__all_sprites = AllSprites()
-        self.__collision_sprites = pygame.sprite.Group()
-        self.__bullet_sprites = pygame.sprite.Group()
-        self.__enemy_sprites = pygame.sprite.Group()
+        self.__all_sprites = AllSprites(texture_backend=self.__texture_backend)
+        # Group ter-index spatial grid untuk query collision, flocking, dan spawn
+        self.__collision_sprites = SpatialGroup()
+        self.__bullet_sprites = SpatialGroup()
+        self.__enemy_sprites = EnemyGroup(self.__collision_sprites)
+        self.__all_sprites.batch_groups.append(self.__enemy_sprites)
         
         self.__can_shoot = True
-        self.__shoot_time = 0 
+        
+        # Frame gameplay yang dibekukan saat pause / level up / game over
+        self.__frozen_frame = None
+        self.__backdrop = None
+        self.__backdrop_overlay = None
         
         # Inisialisasi UI
         self.__ui = GameUI(self.__display_surface)
@@ -90,54 +124,36 @@ class Game:
             self.__all_sprites.map_height
         )
         self.__collision_manager = CollisionManager(self.__impact_sound)
+        self.__setup_scheduler()
+
+    def __setup_scheduler(self) -> None:
+        """Subsystem simulasi dengan rate masing-masing (urutan = urutan eksekusi per tick)"""
+        self.__scheduler = Scheduler(SIM_RATE)
+        self.__scheduler.add_sliced('steering', self.__enemy_sprites.sprites, Enemy.steer, STEERING_RATE, STEERING_BUDGET)
+        self.__scheduler.add('flocking', self.__update_flocking, SIM_RATE)
+        self.__scheduler.add('physics', self.__update_physics, SIM_RATE)
+        self.__scheduler.add('spawn', self.__update_spawn, SPAWN_RATE)
+        self.__scheduler.add('hud', self.__update_hud, HUD_RATE)
 
     def __load_images(self) -> None:
-        """Memuat gambar bullet dan enemy sprites"""
-        # Load gambar peluru dari folder gun
-        gun_folder = join('images', 'gun')
-        self.__bullet_images = []
-        try:
-            for filename in listdir(gun_folder):
-                if filename.endswith('.png'):
-                    img = pygame.image.load(join(gun_folder, filename)).convert_alpha()
-                    orig_w, orig_h = img.get_size()
-                    img = pygame.transform.scale(img, (orig_w * 2.5, orig_h * 2.5))
-                    self.__bullet_images.append(img)
-        except:
+        """Memuat gambar bullet dan enemy sprites dari texture atlas"""
+        atlas = get_atlas()
+        
+        # Gambar peluru dari folder gun
+        self.__bullet_images = atlas.frames('gun')
+        if not self.__bullet_images:
             # Fallback jika folder tidak ada
             fallback = pygame.Surface((50, 50))
             fallback.fill((255, 255, 0))
             self.__bullet_images = [fallback]
+        
+        # Collision mask per gambar peluru
+        self.__bullet_masks = {img: pygame.mask.from_surface(img) for img in self.__bullet_images}
 
-        # Load gambar enemy dari folder enemies
-        enemies_path = join('images', 'enemies')
+        # Gambar enemy per folder di images/enemies (sudah auto-crop)
         self.__enemy_frames = {}
-
-        if not list(walk(enemies_path)):
-            return
-        
-        folders = list(walk(enemies_path))[0][1]
-
-        for folder in folders:
-            folder_path = join(enemies_path, folder)
-            self.__enemy_frames[folder] = []
-            
-            for _, __, file_names in walk(folder_path):
-                png_files = [f for f in file_names if f.endswith('.png')]
-                try:
-                    png_files.sort(key=lambda name: int(name.split('.')[0]))
-                except ValueError:
-                    png_files.sort()
-
-                for file_name in png_files:
-                    full_path = join(folder_path, file_name)
-                    try:
-                        # Load dan auto-crop untuk hitbox yang akurat
-                        surf = pygame.image.load(full_path).convert_alpha()
-                        cropped_surf = surf.subsurface(surf.get_bounding_rect())
-                        self.__enemy_frames[folder].append(cropped_surf)
-                    except Exception as e:
-                        print(f"Gagal load {file_name}: {e}")
+        for enemy_type in atlas.group_names('enemies'):
+            self.__enemy_frames[enemy_type] = atlas.frames(f'enemies/{enemy_type}')
 
     def __setup(self) -> None:
         """Setup dunia game dari TMX map"""
@@ -149,22 +165,25 @@ class Game:
         
         # Inisialisasi pathfinder untuk AI enemy
         self.__pathfinder = Pathfinder(map)
+        self.__enemy_sprites.set_pathfinder(self.__pathfinder)
 
-        # Load layer ground
+        # Bake layer ground ke chunk surface
+        ground_layer = ChunkedGround(self.__all_sprites.map_width, self.__all_sprites.map_height)
         try:
             for x, y, image in map.get_layer_by_name('ground').tiles():
-                Sprite((x * TILE_SIZE, y * TILE_SIZE), image, self.__all_sprites)
+                ground_layer.add_tile((x * TILE_SIZE, y * TILE_SIZE), image)
         except ValueError:
             if 'Ground' in map.layernames:
                 for x, y, image in map.get_layer_by_name('Ground').tiles():
-                    Sprite((x * TILE_SIZE, y * TILE_SIZE), image, self.__all_sprites)
+                    ground_layer.add_tile((x * TILE_SIZE, y * TILE_SIZE), image)
         
-        # Load layer wall jika ada
+        # Bake layer wall jika ada (di atas ground)
         try:
             for x, y, image in map.get_layer_by_name('Wall').tiles():
-                Sprite((x * TILE_SIZE, y * TILE_SIZE), image, self.__all_sprites)
+                ground_layer.add_tile((x * TILE_SIZE, y * TILE_SIZE), image)
         except ValueError:
             pass
+        self.__all_sprites.ground_layer = ground_layer
 
         # Load layer object (collision)
         try:
@@ -209,9 +228,12 @@ class Game:
     def __handle_events(self) -> None:
         """Menangani input dari player"""
         event_list = pygame.event.get()
+        if event_list:
+            self.__last_input_time = pygame.time.get_ticks()
         
         for event in event_list:
-            if event.type == pygame.QUIT:
+            # Backend texture punya window display tersembunyi, jadi QUIT tidak otomatis terkirim
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 self.__game_state.stop_game()
                 return
 
@@ -219,9 +241,7 @@ class Game:
         if self.__level_up_menu.is_active:
             selected_upgrade_id = self.__level_up_menu.update(event_list)
             if selected_upgrade_id:
-                self.__upgrade_db.apply_upgrade(selected_upgrade_id, self.__player)
-                self.__level_up_menu.hide()
-                self.__game_state.resume()
+                self.__select_upgrade(selected_upgrade_id)
             return
 
         # Handle name input screen
@@ -281,6 +301,12 @@ class Game:
             elif action == "exit":
                 self.__game_state.stop_game()
 
+    def __select_upgrade(self, upgrade_id: str) -> None:
+        """Terapkan upgrade pilihan lalu lanjutkan game"""
+        self.__upgrade_db.apply_upgrade(upgrade_id, self.__player)
+        self.__level_up_menu.hide()
+        self.__game_state.resume()
+
     def __restart_game(self) -> None:
         """Restart game dari awal"""
         self.__score_manager.clear_last_player()
@@ -299,49 +325,57 @@ class Game:
         self.__name_input_screen.show(self.__game_state.score, final_stats)
 
     def __update_game(self, dt: float) -> None:
-        """Update logic game setiap frame"""
+        """Update logic game satu tick simulasi (subsystem dijadwalkan oleh scheduler)"""
         if self.__in_menu or self.__game_state.is_paused or self.__level_up_menu.is_active:
             return
 
         if not self.__game_state.is_game_over:
-            self.__gun_timer()
-            self.__auto_shoot()
-            
-            # Update skill cooldown
-            if self.__player.active_skill:
-                self.__player.active_skill.set_cooldown_modifier(self.__player.stat_modifiers.get('cooldown', 1.0))
-                self.__player.active_skill.update(dt)
-            
-            self.__all_sprites.update(dt)
-            self.__bullet_collision()
-            self.__player_collision()
-            
-            # Update spawn manager berdasarkan waktu
-            elapsed_time = self.__game_state.elapsed_time
-            self.__spawn_manager.update_difficulty(elapsed_time)
-            
-            if self.__spawn_manager.should_spawn():
-                self.__spawn_manager.spawn_enemy(
-                    (self.__all_sprites, self.__enemy_sprites),
-                    self.__player,
-                    self.__collision_sprites,
-                    EnemyFactory
-                )
-            
-            # Update UI
-            self.__ui.update_player_stats(self.__player.stats)
-            self.__ui.update_time(elapsed_time)
-            score = self.__game_state.calculate_score(self.__player.stats)
-            self.__ui.update_score(score)
-            self.__level_up_notification.update()
+            self.__sim_clock.tick()
+            # Area layar untuk LOD enemy (dihitung dari player, tetap valid tanpa render)
+            self.__enemy_sprites.view_rect = self.__all_sprites.camera_rect(self.__player.rect.center)
+            self.__scheduler.tick()
     
-    def __gun_timer(self) -> None:
-        """Timer untuk cooldown tembakan"""
-        if not self.__can_shoot:
-            current_time = pygame.time.get_ticks()
-            cooldown = self.__player.weapon.cooldown if self.__player.weapon else GUN_COOLDOWN
-            if current_time - self.__shoot_time >= cooldown:
-                self.__can_shoot = True
+    def __update_physics(self, dt: float) -> None:
+        """Tembakan, skill, movement, dan collision (setiap tick)"""
+        self.__auto_shoot()
+        
+        # Modifier cooldown skill dari upgrade (durasi skill berjalan di timer wheel)
+        if self.__player.active_skill:
+            self.__player.active_skill.set_cooldown_modifier(self.__player.stat_modifiers.get('cooldown', 1.0))
+        
+        self.__all_sprites.update(dt)
+        self.__enemy_sprites.sync()
+        self.__bullet_sprites.sync()
+        self.__bullet_collision()
+        self.__player_collision()
+        self.__level_up_notification.update()
+    
+    def __update_flocking(self, dt: float) -> None:
+        """Flocking force enemy yang jatuh tempo (LOD berdasarkan jarak ke layar)"""
+        self.__enemy_sprites.update_flocking()
+    
+    def __update_spawn(self, dt: float) -> None:
+        """Update difficulty dan spawn enemy berdasarkan waktu"""
+        self.__spawn_manager.update_difficulty(self.__game_state.elapsed_time)
+        
+        if self.__spawn_manager.should_spawn():
+            self.__spawn_manager.spawn_enemy(
+                (self.__all_sprites, self.__enemy_sprites),
+                self.__player,
+                self.__collision_sprites,
+                EnemyFactory
+            )
+    
+    def __update_hud(self, dt: float = 0.0) -> None:
+        """Update nilai HUD (stats, waktu, score), juga dipanggil langsung sebelum game dibekukan"""
+        self.__ui.update_player_stats(self.__player.stats)
+        self.__ui.update_time(self.__game_state.elapsed_time)
+        score = self.__game_state.calculate_score(self.__player.stats)
+        self.__ui.update_score(score)
+    
+    def __reload(self) -> None:
+        """Cooldown tembakan selesai (dipanggil timer wheel)"""
+        self.__can_shoot = True
 
     def __auto_shoot(self) -> None:
         """Auto shoot ke enemy terdekat"""
@@ -354,13 +388,16 @@ class Game:
                     for bullet_data in shoot_info['bullets']:
                         bullet_surf = random.choice(self.__bullet_images)
                         Bullet(bullet_surf, bullet_data['position'], bullet_data['direction'], 
-                               (self.__all_sprites, self.__bullet_sprites), bullet_data['damage'])
+                               (self.__all_sprites, self.__bullet_sprites), bullet_data['damage'],
+                               self.__bullet_masks[bullet_surf])
                 else:
                     bullet_surf = random.choice(self.__bullet_images)
                     Bullet(bullet_surf, shoot_info['position'], shoot_info['direction'], 
-                           (self.__all_sprites, self.__bullet_sprites), shoot_info['damage'])
+                           (self.__all_sprites, self.__bullet_sprites), shoot_info['damage'],
+                           self.__bullet_masks[bullet_surf])
             self.__can_shoot = False
-            self.__shoot_time = pygame.time.get_ticks()
+            cooldown = self.__player.weapon.cooldown if self.__player.weapon else GUN_COOLDOWN
+            self.__sim_clock.schedule(cooldown, self.__reload)
 
     def __bullet_collision(self) -> None:
         """Cek collision antara bullet dan enemy"""
@@ -373,6 +410,8 @@ class Game:
     def __trigger_level_up(self) -> None:
         """Tampilkan menu pilihan upgrade saat level up"""
         self.__game_state.pause()
+        # Task HUD hanya 4 Hz: sinkronkan dulu agar backdrop level up memakai stats terbaru
+        self.__update_hud()
         upgrade_cards = self.__upgrade_db.get_available_upgrades(count=3)
         self.__level_up_menu.show(upgrade_cards)
         self.__level_up_notification.trigger(self.__player.stats.level)
@@ -381,50 +420,205 @@ class Game:
         """Cek collision antara player dan enemy"""
         took_damage = self.__collision_manager.check_player_enemy(self.__player, self.__enemy_sprites)
         if took_damage and not self.__player.stats.is_alive:
+            # Score final (leaderboard dan layar game over) dihitung dari state tick terakhir
+            self.__update_hud()
             self.__game_state.set_game_over()
 
+    def __draw_gameplay(self) -> None:
+        """Render world, HUD, dan notifikasi level up"""
+        alpha = self.__sim_clock.alpha
+        camera_target = self.__all_sprites.interpolated_center(self.__player, alpha)
+        self.__all_sprites.draw(camera_target, alpha)
+        
+        # Health bar boss jika ada
+        boss = None
+        for enemy in self.__enemy_sprites:
+            if getattr(enemy, 'is_boss', False) and not enemy.is_dead:
+                boss = enemy
+                break
+        self.__ui.update_boss_health(boss)
+        self.__ui.update_skill_icon(self.__player.active_skill)
+        
+        # HUD di-cache, hanya di-render ulang jika ada nilai yang berubah
+        self.__ui.draw()
+        self.__level_up_notification.draw(self.__display_surface)
+        
+        self.__presenter.add(self.__all_sprites.dirty_rects)
+        self.__presenter.add(self.__ui.dirty_rects())
+        self.__presenter.add(self.__level_up_notification.dirty_rects())
+
+    def __draw_backdrop(self, overlay) -> None:
+        """
+        Backdrop untuk state beku (pause, level up, game over): frame gameplay
+        terakhir di-capture sekali lalu di-dim sesuai overlay yang aktif.
+        """
+        if self.__frozen_frame is None:
+            self.__clear_frame()
+            self.__draw_gameplay()
+            if self.__texture_backend:
+                self.__frozen_frame = self.__texture_backend.capture().convert()
+            else:
+                self.__frozen_frame = self.__display_surface.copy()
+        
+        if self.__backdrop_overlay is not overlay:
+            self.__backdrop = self.__frozen_frame.copy()
+            dim = pygame.Surface(self.__backdrop.get_size(), pygame.SRCALPHA)
+            dim.fill(overlay.BACKDROP_DIM)
+            self.__backdrop.blit(dim, (0, 0))
+            self.__backdrop_overlay = overlay
+        self.__display_surface.blit(self.__backdrop, (0, 0))
+
+    def __clear_frame(self) -> None:
+        """Kosongkan layar sebelum gameplay digambar (layer UI transparan di backend texture)"""
+        if self.__texture_backend:
+            self.__display_surface.fill((0, 0, 0, 0))
+        else:
+            self.__display_surface.fill('black')
+
+    def __release_backdrop(self) -> None:
+        self.__frozen_frame = None
+        self.__backdrop = None
+        self.__backdrop_overlay = None
+
     def __draw_game(self) -> None:
         """Render semua elemen game ke layar"""
-        self.__display_surface.fill('black')
+        if self.__texture_backend:
+            self.__texture_backend.begin_frame()
+        
+        screen = self.__active_screen()
+        if screen is not self.__presented_screen:
+            self.__presenter.invalidate()
+            self.__presented_screen = screen
+        
         if self.__in_menu:
+            self.__release_backdrop()
             self.__main_menu.draw()
+        # Overlay menu sesuai state, di atas backdrop yang dibekukan
+        elif self.__level_up_menu.is_active:
+            self.__draw_backdrop(self.__level_up_menu)
+            self.__level_up_menu.draw()
+        elif self.__name_input_screen.is_active:
+            self.__draw_backdrop(self.__name_input_screen)
+            self.__name_input_screen.draw()
+        elif self.__game_state.is_paused:
+            self.__draw_backdrop(self.__pause_menu)
+            self.__pause_menu.draw()
+        elif self.__game_state.is_game_over:
+            self.__draw_backdrop(self.__game_over_screen)
+            final_stats = {
+                'score': self.__game_state.score,
+                'level': self.__player.stats.level,
+                'kills': self.__player.stats.kills,
+                'time': f"{int(self.__game_state.elapsed_time // 60)}:{int(self.__game_state.elapsed_time % 60):02d}"
+            }
+            self.__game_over_screen.draw(final_stats)
         else:
-            self.__all_sprites.draw(self.__player.rect.center)
-            self.__ui.draw()
-            
-            # Gambar health bar boss jika ada
-            for enemy in self.__enemy_sprites:
-                if getattr(enemy, 'is_boss', False) and not enemy.is_dead:
-                    if hasattr(self.__ui, 'draw_boss_health'):
-                        self.__ui.draw_boss_health(enemy)
-                    break 
-
-            self.__ui.draw_skill_icon(self.__player.active_skill)
-            self.__level_up_notification.draw(self.__display_surface)
-            
-            # Gambar overlay menu sesuai state
-            if self.__level_up_menu.is_active:
-                self.__level_up_menu.draw()
-            elif self.__name_input_screen.is_active:
-                self.__name_input_screen.draw()
-            elif self.__game_state.is_paused:
-                self.__pause_menu.draw()
-            elif self.__game_state.is_game_over:
-                final_stats = {
-                    'score': self.__game_state.score,
-                    'level': self.__player.stats.level,
-                    'kills': self.__player.stats.kills,
-                    'time': f"{int(self.__game_state.elapsed_time // 60)}:{int(self.__game_state.elapsed_time % 60):02d}"
-                }
-                self.__game_over_screen.draw(final_stats)
+            self.__release_backdrop()
+            self.__clear_frame()
+            self.__draw_gameplay()
         
-        pygame.display.update()
+        if self.__texture_backend:
+            self.__texture_backend.present()
+            return
+        
+        if screen is None:
+            # Kamera bergeser = seluruh world berubah
+            offset = tuple(self.__all_sprites.offset)
+            if offset != self.__presented_offset:
+                self.__presenter.invalidate()
+                self.__presented_offset = offset
+        else:
+            rects = screen.dirty_rects()
+            if rects is None:
+                self.__presenter.invalidate()
+            else:
+                self.__presenter.add(rects)
+        self.__presenter.present()
     
+    def __active_screen(self):
+        """Layar menu/overlay yang sedang aktif, None saat gameplay berjalan"""
+        if self.__in_menu:
+            return self.__main_menu
+        if self.__level_up_menu.is_active:
+            return self.__level_up_menu
+        if self.__name_input_screen.is_active:
+            return self.__name_input_screen
+        if self.__game_state.is_paused:
+            return self.__pause_menu
+        if self.__game_state.is_game_over:
+            return self.__game_over_screen
+        return None
+
+    # API headless (dipakai simulate.py): gameplay tanpa event dan render
+    @property
+    def player(self) -> Player:
+        return self.__player
+
+    @property
+    def is_over(self) -> bool:
+        return self.__game_state.is_game_over or not self.__game_state.is_running
+
+    @property
+    def elapsed_time(self) -> float:
+        return self.__game_state.elapsed_time
+
+    def entity_counts(self) -> dict[str, int]:
+        """Jumlah entity hidup saat ini"""
+        return {
+            'enemies': len(self.__enemy_sprites),
+            'bullets': len(self.__bullet_sprites),
+            'sprites': len(self.__all_sprites),
+        }
+
+    def start(self) -> None:
+        """Mulai gameplay langsung tanpa main menu"""
+        self.__in_menu = False
+        self.__restart_game()
+
+    def step(self) -> None:
+        """Satu tick simulasi. Menu level up otomatis memilih kartu pertama."""
+        if self.__level_up_menu.is_active:
+            upgrade_ids = self.__level_up_menu.upgrade_ids
+            if upgrade_ids:
+                self.__select_upgrade(upgrade_ids[0])
+            else:
+                self.__level_up_menu.hide()
+                self.__game_state.resume()
+        self.__update_game(self.__sim_clock.step_time)
+
+    def __step_simulation(self, frame_time: float) -> None:
+        """
+        Jalankan tick simulasi dengan langkah tetap 1/SIM_RATE detik, berapapun dt frame.
+        Jumlah tick per frame diatur jam simulasi (time scale, pause, step manual, batas catch-up).
+        """
+        for _ in range(self.__sim_clock.advance(frame_time)):
+            self.__update_game(self.__sim_clock.step_time)
+
+    def __idle_timeout(self):
+        """
+        Timeout event.wait (ms) jika layar aktif tidak perlu 60 FPS dan tidak ada
+        input selama IDLE_DELAY. None berarti loop jalan penuh di FPS.
+        """
+        screen = self.__active_screen()
+        if screen is None or pygame.time.get_ticks() - self.__last_input_time < IDLE_DELAY:
+            return None
+        idle_fps = screen.idle_fps
+        return IDLE_TIMEOUT if idle_fps <= 0 else 1000 // idle_fps
+
     def run(self) -> None:
         """Main game loop"""
         while self.__game_state.is_running:
-            dt = self.__clock.tick(FPS) / 1000
+            idle_timeout = self.__idle_timeout()
+            if idle_timeout is None:
+                dt = self.__clock.tick(FPS) / 1000
+            else:
+                # Mode idle: blok sampai ada input atau timeout, bukan busy loop di FPS
+                event = pygame.event.wait(idle_timeout)
+                if event.type != pygame.NOEVENT:
+                    pygame.event.post(event)
+                self.__clock.tick()
+                dt = 0
             self.__handle_events()
-            self.__update_game(dt)
+            self.__step_simulation(dt)
             self.__draw_game()
         pygame.quit()
\ No newline at end of file
@@ -3,31 +3,217 @@ GROUPS MODULE
 Custom sprite group untuk rendering dengan camera offset
 """
 import pygame
-from settings import WINDOW_WIDTH, WINDOW_HEIGHT
+from heapq import merge
+from operator import attrgetter
+from weakref import WeakKeyDictionary
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT, CULL_MARGIN, RENDER_SCALE, DIRTY_RECTS
+from src.core.spatial import SpatialGrid
+from src.core.render import RenderQueue
+
+# Urutan kedalaman (y-sort) berdasarkan centery
+depth_key = attrgetter('rect.centery')
 
 
 class AllSprites(pygame.sprite.Group):
-    def __init__(self):
+    def __init__(self, render_scale: float = RENDER_SCALE, texture_backend=None):
         super().__init__()
         self.display_surface = pygame.display.get_surface()
         self.offset = pygame.Vector2()
         self.map_width = 0
         self.map_height = 0
+        self.ground_layer = None
+        # Rect layar sprite bergerak yang digambar frame ini (untuk dirty-rect present)
+        self.dirty_rects = []
+        # Posisi sprite bergerak sebelum tick simulasi terakhir (untuk interpolasi render)
+        self.__previous = {}
+        # Group dengan update batch (misal EnemyGroup) yang dijalankan setelah update per sprite
+        self.batch_groups = []
+        
+        # Backend texture: world digambar lewat Renderer SDL2, render scale tidak dipakai
+        self.__texture_backend = texture_backend
+        if texture_backend:
+            render_scale = 1.0
+        
+        # World di-render ke surface logis (WINDOW_SIZE * scale) lalu di-scale sekali ke layar
+        self.__render_scale = max(0.25, min(1.0, render_scale))
+        if self.__render_scale < 1:
+            world_size = (round(WINDOW_WIDTH * self.__render_scale), round(WINDOW_HEIGHT * self.__render_scale))
+            self.__world_surface = pygame.Surface(world_size).convert()
+            self.__scaled_images = WeakKeyDictionary()
+        else:
+            self.__world_surface = None
+        if texture_backend:
+            self.__render_queue = texture_backend.queue
+        else:
+            self.__render_queue = RenderQueue(self.__world_surface or self.display_surface)
+        
+        # Spatial index untuk viewport culling
+        self.__index = SpatialGrid()
+        self.__pending = {}
+        
+        # Partisi statis/dinamis untuk depth ordering
+        self.__static_sorted = []
+        self.__static_rank = {}
+        self.__dynamic = set()
+        self.__dynamic_sorted = []
+        self.__dynamic_removed = False
+    
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        # Rect belum tentu ada saat sprite masuk group, index di-sync nanti
+        self.__pending[sprite] = None
+    
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.__pending.pop(sprite, None)
+        self.__index.remove(sprite)
+        if sprite in self.__dynamic:
+            self.__dynamic.discard(sprite)
+            self.__dynamic_removed = True
+        elif sprite in self.__static_rank:
+            self.__static_sorted.remove(sprite)
+            self.__rank_static()
+    
+    def __rank_static(self) -> None:
+        """Urutan statis dihitung sekali, hanya diulang jika ada sprite statis baru."""
+        self.__static_rank = {sprite: rank for rank, sprite in enumerate(self.__static_sorted)}
+    
+    def __flush_pending(self) -> None:
+        """Masukkan sprite baru ke spatial index dan partisi depth."""
+        if not self.__pending:
+            return
+        
+        new_static = False
+        for sprite in self.__pending:
+            self.__index.insert(sprite)
+            if getattr(sprite, 'static', False):
+                self.__static_sorted.append(sprite)
+                new_static = True
+            else:
+                self.__dynamic.add(sprite)
+                self.__dynamic_sorted.append(sprite)
+        self.__pending.clear()
+        
+        if new_static:
+            self.__static_sorted.sort(key=depth_key)
+            self.__rank_static()
+    
+    def update(self, *args, **kwargs):
+        self.__previous = {sprite: sprite.rect.topleft for sprite in self.__dynamic}
+        super().update(*args, **kwargs)
+        for group in self.batch_groups:
+            group.update(*args, **kwargs)
+        self.__flush_pending()
+        for sprite in self.__dynamic:
+            self.__index.update(sprite)
+    
+    @property
+    def render_scale(self) -> float:
+        return self.__render_scale
     
-    def draw(self, target_pos):
-        self.offset.x = -(target_pos[0] - WINDOW_WIDTH / 2)
-        self.offset.y = -(target_pos[1] - WINDOW_HEIGHT / 2)
+    def interpolated_center(self, sprite, alpha: float) -> tuple[int, int]:
+        """Center sprite di antara dua state simulasi terakhir (alpha 0 = tick lalu, 1 = sekarang)."""
+        x, y = self.__interpolated_topleft(sprite, alpha)
+        return x + sprite.rect.width // 2, y + sprite.rect.height // 2
+    
+    def __interpolated_topleft(self, sprite, alpha: float) -> tuple[int, int]:
+        x, y = sprite.rect.topleft
+        previous = self.__previous.get(sprite)
+        if previous is None or alpha >= 1:
+            return x, y
+        prev_x, prev_y = previous
+        return round(prev_x + (x - prev_x) * alpha), round(prev_y + (y - prev_y) * alpha)
+    
+    def __scaled_image(self, surf: pygame.Surface) -> pygame.Surface:
+        """Versi downscale dari image sprite (di-cache per surface, alpha ikut disinkronkan)."""
+        scaled = self.__scaled_images.get(surf)
+        if scaled is None:
+            width, height = surf.get_size()
+            size = (max(1, round(width * self.__render_scale)), max(1, round(height * self.__render_scale)))
+            try:
+                scaled = pygame.transform.smoothscale(surf, size)
+            except ValueError:
+                scaled = pygame.transform.scale(surf, size)
+            self.__scaled_images[surf] = scaled
+        alpha = surf.get_alpha()
+        if scaled.get_alpha() != alpha:
+            scaled.set_alpha(alpha)
+        return scaled
+    
+    def __sort_dynamic(self) -> None:
+        """Re-sort list sprite bergerak. Data hampir urut, jadi timsort mendekati O(n)."""
+        if self.__dynamic_removed:
+            self.__dynamic_sorted = [sprite for sprite in self.__dynamic_sorted if sprite in self.__dynamic]
+            self.__dynamic_removed = False
+        self.__dynamic_sorted.sort(key=depth_key)
+    
+    def __camera_offset(self, target_pos) -> pygame.Vector2:
+        """Offset kamera yang mengikuti target_pos, dibatasi tepi map."""
+        offset = pygame.Vector2(-(target_pos[0] - WINDOW_WIDTH // 2), -(target_pos[1] - WINDOW_HEIGHT // 2))
 
         # Camera constraints
         if self.map_width and self.map_height:
-            if self.offset.x > 0: self.offset.x = 0
-            if self.offset.x < -(self.map_width - WINDOW_WIDTH): self.offset.x = -(self.map_width - WINDOW_WIDTH)
-            if self.offset.y > 0: self.offset.y = 0
-            if self.offset.y < -(self.map_height - WINDOW_HEIGHT): self.offset.y = -(self.map_height - WINDOW_HEIGHT)
+            if offset.x > 0: offset.x = 0
+            if offset.x < -(self.map_width - WINDOW_WIDTH): offset.x = -(self.map_width - WINDOW_WIDTH)
+            if offset.y > 0: offset.y = 0
+            if offset.y < -(self.map_height - WINDOW_HEIGHT): offset.y = -(self.map_height - WINDOW_HEIGHT)
+        return offset
+    
+    def camera_rect(self, target_pos) -> pygame.FRect:
+        """Area world yang terlihat jika kamera di target_pos (juga untuk simulasi tanpa render)."""
+        offset = self.__camera_offset(target_pos)
+        return pygame.FRect(-offset.x, -offset.y, WINDOW_WIDTH, WINDOW_HEIGHT)
+    
+    def draw(self, target_pos, alpha: float = 1.0):
+        """
+        Gambar world dengan kamera di target_pos. Sprite bergerak diinterpolasi
+        sebesar alpha antara posisi tick sebelumnya dan posisi sekarang.
+        """
+        self.offset.update(self.__camera_offset(target_pos))
 
-        ground_sprites = [sprite for sprite in self if hasattr(sprite, 'ground')] 
-        object_sprites = [sprite for sprite in self if not hasattr(sprite, 'ground')] 
+        # Ground statis yang sudah di-bake ke chunk
+        queue = self.__render_queue
+        if self.ground_layer:
+            self.ground_layer.draw(queue, self.offset, self.__render_scale)
+
+        # Culling: hanya sprite yang overlap kamera (+ margin)
+        self.__flush_pending()
+        offset_x, offset_y = self.offset
+        camera_rect = pygame.FRect(-offset_x, -offset_y, WINDOW_WIDTH, WINDOW_HEIGHT).inflate(CULL_MARGIN * 2, CULL_MARGIN * 2)
+        visible_sprites = set(self.__index.query_rect(camera_rect))
+
+        # Depth ordering: statis (urutan tetap) di-merge dengan dinamis (re-sort inkremental)
+        static_rank = self.__static_rank
+        static_sprites = sorted((sprite for sprite in visible_sprites if sprite in static_rank), key=static_rank.__getitem__)
+        self.__sort_dynamic()
+        dynamic_sprites = [sprite for sprite in self.__dynamic_sorted if sprite in visible_sprites]
+        
+        # Posisi gambar sprite bergerak (interpolasi), sprite statis langsung pakai rect
+        positions = {sprite: self.__interpolated_topleft(sprite, alpha) for sprite in dynamic_sprites}
+        position = lambda sprite: positions.get(sprite) or sprite.rect.topleft
+
+        if DIRTY_RECTS and not self.__texture_backend:
+            # Sprite statis tidak berubah selama kamera diam, cukup sprite bergerak (margin untuk pembulatan)
+            # Image bisa lebih besar dari rect (frame animasi beda ukuran), jadi pakai ukuran image
+            self.dirty_rects = [pygame.Rect(x + offset_x, y + offset_y, *sprite.image.get_size()).inflate(4, 4)
+                                for sprite, (x, y) in positions.items()]
+
+        # Tile ground sudah di-bake ke ground_layer, jadi semua sprite cukup satu urutan depth
+        object_sprites = merge(static_sprites, dynamic_sprites, key=depth_key)
         
-        for layer in [ground_sprites, object_sprites]:
-            for sprite in sorted(layer, key = lambda sprite: sprite.rect.centery):
-                self.display_surface.blit(sprite.image, sprite.rect.topleft + self.offset)
+        if self.__world_surface is None:
+            for sprite in object_sprites:
+                x, y = position(sprite)
+                queue.blit(sprite.image, (x + offset_x, y + offset_y))
+            queue.flush()
+            return
+
+        # Render scale < 1: posisi dan image di-skala, lalu satu scale akhir ke layar
+        scale = self.__render_scale
+        scaled_x, scaled_y = round(offset_x * scale), round(offset_y * scale)
+        scaled_image = self.__scaled_image
+        for sprite in object_sprites:
+            x, y = position(sprite)
+            queue.blit(scaled_image(sprite.image), (x * scale + scaled_x, y * scale + scaled_y))
+        queue.flush()
+        pygame.transform.scale(self.__world_surface, self.display_surface.get_size(), self.display_surface)
@@ -1,6 +1,7 @@
 """
 Pathfinding Module
 Algoritma BFS untuk enemy biasa dan A* untuk boss.
+Flow field (BFS dari target) sebagai jalur kasar untuk enemy jauh di luar layar.
 """
 import pygame
 import heapq
@@ -15,6 +16,9 @@ class Pathfinder:
         self.matrix = self.__create_grid(tmx_map)
         self.width = len(self.matrix[0])
         self.height = len(self.matrix)
+        # Flow field: tile -> tile berikutnya menuju target, di-cache per tile target
+        self.__flow_target = None
+        self.__flow = {}
         
     def __create_grid(self, tmx_map):
         """Buat grid dari TMX map untuk pathfinding."""
@@ -84,6 +88,68 @@ class Pathfinder:
         pixel_pos = pygame.Vector2(next_step[0]*TILE_SIZE + TILE_SIZE//2, next_step[1]*TILE_SIZE + TILE_SIZE//2)
         return (pixel_pos - pygame.Vector2(start_pos)).normalize()
 
+    def is_walkable(self, pos) -> bool:
+        """Tile di posisi pixel pos berada di dalam map dan tidak terhalang."""
+        col, row = int(pos[0] // TILE_SIZE), int(pos[1] // TILE_SIZE)
+        return 0 <= col < self.width and 0 <= row < self.height and self.matrix[row][col] == 0
+
+    def walkable_center(self, pos) -> pygame.Vector2:
+        """Center tile walkable terdekat dari pos (BFS 8 arah mulai dari tile pos)."""
+        col = min(max(int(pos[0] // TILE_SIZE), 0), self.width - 1)
+        row = min(max(int(pos[1] // TILE_SIZE), 0), self.height - 1)
+        queue = deque([(col, row)])
+        visited = {(col, row)}
+        while queue:
+            current = queue.popleft()
+            if self.matrix[current[1]][current[0]] == 0:
+                return pygame.Vector2(current[0]*TILE_SIZE + TILE_SIZE//2, current[1]*TILE_SIZE + TILE_SIZE//2)
+            for dx, dy in [(0,1), (0,-1), (1,0), (-1,0), (1,1), (1,-1), (-1,1), (-1,-1)]:
+                next_node = (current[0] + dx, current[1] + dy)
+                if (0 <= next_node[0] < self.width and 
+                    0 <= next_node[1] < self.height and 
+                    next_node not in visited):
+                    visited.add(next_node)
+                    queue.append(next_node)
+        return pygame.Vector2(pos)
+
+    def __build_flow(self, end) -> dict:
+        """BFS dari target ke seluruh grid: setiap tile menunjuk tetangga yang lebih dekat ke target."""
+        flow = {end: None}
+        queue = deque([end])
+        while queue:
+            current = queue.popleft()
+            for dx, dy in [(0,1), (0,-1), (1,0), (-1,0)]:
+                next_node = (current[0] + dx, current[1] + dy)
+                if (0 <= next_node[0] < self.width and 
+                    0 <= next_node[1] < self.height and 
+                    self.matrix[next_node[1]][next_node[0]] == 0 and 
+                    next_node not in flow):
+                    queue.append(next_node)
+                    flow[next_node] = current
+        return flow
+
+    def get_path_flow(self, start_pos, target_pos):
+        """
+        Arah kasar lewat flow field untuk enemy jauh: satu BFS per tile target
+        dipakai semua enemy, sehingga setiap query cukup lookup O(1).
+        """
+        start = (int(start_pos[0] // TILE_SIZE), int(start_pos[1] // TILE_SIZE))
+        end = (int(target_pos[0] // TILE_SIZE), int(target_pos[1] // TILE_SIZE))
+        
+        if start == end: 
+            return pygame.Vector2()
+        
+        if end != self.__flow_target:
+            self.__flow = self.__build_flow(end)
+            self.__flow_target = end
+        
+        next_step = self.__flow.get(start)
+        if next_step is None: 
+            return pygame.Vector2()
+        pixel_pos = pygame.Vector2(next_step[0]*TILE_SIZE + TILE_SIZE//2, next_step[1]*TILE_SIZE + TILE_SIZE//2)
+        direction = pixel_pos - pygame.Vector2(start_pos)
+        return direction.normalize() if direction.length() > 0 else pygame.Vector2()
+
     def get_path_astar(self, start_pos, target_pos):
         """A* pathfinding untuk boss (lebih optimal)."""
         start = (int(start_pos[0] // TILE_SIZE), int(start_pos[1] // TILE_SIZE))
@@ -0,0 +1,97 @@
+"""
+Render Module
+RenderQueue untuk mengumpulkan blit satu frame dan submit sekaligus,
+dan DirtyPresenter untuk present hanya area layar yang berubah.
+"""
+import pygame
+
+# pygame-ce punya fblits (lebih cepat), pygame biasa hanya blits
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+
+class RenderQueue:
+    """
+    Kumpulkan pasangan (surface, posisi) lalu kirim ke target dengan satu
+    panggilan Surface.fblits/blits, bukan satu Surface.blit per sprite.
+
+    Usage:
+        queue = RenderQueue(display_surface)
+        queue.blit(image, (x, y))
+        queue.flush()
+    """
+
+    def __init__(self, target: pygame.Surface):
+        self.target = target
+        # List yang sama dipakai ulang setiap frame
+        self.__batch = []
+
+    def __len__(self) -> int:
+        return len(self.__batch)
+
+    def blit(self, surf: pygame.Surface, dest) -> None:
+        """Tambahkan satu blit ke antrian (signature sama dengan Surface.blit)."""
+        self.__batch.append((surf, dest))
+
+    def extend(self, pairs) -> None:
+        """Tambahkan banyak pasangan (surface, posisi) sekaligus."""
+        self.__batch.extend(pairs)
+
+    def flush(self) -> None:
+        """Submit semua blit ke target lalu kosongkan antrian."""
+        if not self.__batch:
+            return
+        if _HAS_FBLITS:
+            self.target.fblits(self.__batch)
+        else:
+            self.target.blits(self.__batch, doreturn=False)
+        self.__batch.clear()
+
+
+class DirtyPresenter:
+    """
+    Present frame ke layar lewat display.update(rects) dengan area yang berubah saja.
+    Rect frame sebelumnya ikut di-present agar posisi lama (sprite yang pindah/hilang) terhapus.
+    Full flip jika di-invalidate (kamera bergeser, ganti layar) atau area dirty terlalu besar.
+
+    Usage:
+        presenter.add(rects)
+        presenter.present()
+    """
+
+    # Di atas rasio area layar ini, full flip lebih murah
+    FULL_PRESENT_RATIO = 0.5
+
+    def __init__(self, enabled: bool = True):
+        self.__enabled = enabled
+        self.__rects = []
+        self.__previous = []
+        self.__full = True
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    def add(self, rects) -> None:
+        """Tandai rect (koordinat layar) yang berubah frame ini."""
+        if self.__enabled:
+            self.__rects.extend(rects)
+
+    def invalidate(self) -> None:
+        """Paksa full flip untuk frame ini."""
+        self.__full = True
+
+    def present(self) -> None:
+        if not self.__enabled:
+            pygame.display.update()
+            return
+
+        rects = self.__previous + self.__rects
+        width, height = pygame.display.get_surface().get_size()
+        if self.__full or sum(rect[2] * rect[3] for rect in rects) > width * height * self.FULL_PRESENT_RATIO:
+            pygame.display.update()
+        elif rects:
+            pygame.display.update(rects)
+
+        self.__previous = self.__rects
+        self.__rects = []
+        self.__full = False
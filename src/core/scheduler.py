@@ -0,0 +1,112 @@
+"""
+Scheduler Module
+Menjalankan subsystem simulasi dengan tick rate masing-masing di atas tick tetap game.
+"""
+from math import ceil
+from time import perf_counter
+
+
+class _Task:
+    """Subsystem periodik: callback(dt) setiap period tick."""
+
+    def __init__(self, name: str, callback, period: int, offset: int, tick_rate: int):
+        self.name = name
+        self.callback = callback
+        self.period = period
+        self.offset = offset
+        self.dt = period / tick_rate
+        self.cost = 0.0
+
+
+class _SlicedTask:
+    """
+    Subsystem per item (misal steering per enemy): satu putaran penuh semua item
+    setiap 1/rate detik, dibagi rata ke tick di antaranya dan dibatasi budget.
+    """
+
+    def __init__(self, name: str, source, work, rate: float, tick_rate: int, budget: float = None):
+        self.name = name
+        self.source = source
+        self.work = work
+        self.slices = max(1, round(tick_rate / rate))
+        self.budget = budget / 1000 if budget else None
+        self.items = []
+        self.cursor = 0
+        self.cost = 0.0
+
+
+class Scheduler:
+    """
+    Multi-rate scheduler untuk satu tick simulasi tetap.
+    Task periodik dengan rate sama digeser (offset) agar tidak jalan di tick yang sama,
+    task sliced menyebar item ke beberapa tick sehingga tidak ada tick yang menanggung semuanya.
+
+    Usage:
+        scheduler = Scheduler(SIM_RATE)
+        scheduler.add_sliced('steering', enemy_sprites.sprites, Enemy.steer, rate=15, budget=2.0)
+        scheduler.add('physics', update_physics, rate=60)
+        scheduler.add('hud', update_hud, rate=4)
+        scheduler.tick()  # sekali per tick simulasi
+    """
+
+    def __init__(self, tick_rate: int):
+        self.__tick_rate = tick_rate
+        self.__tick = 0
+        # Urutan registrasi = urutan eksekusi dalam satu tick
+        self.__tasks = []
+
+    @property
+    def tick_count(self) -> int:
+        return self.__tick
+
+    def add(self, name: str, callback, rate: float) -> None:
+        """Daftarkan callback(dt) yang jalan rate kali per detik (maksimal tick rate)."""
+        period = max(1, round(self.__tick_rate / rate))
+        # Offset berbeda per task agar subsystem berrate rendah tidak menumpuk di tick yang sama
+        offset = sum(1 for task in self.__tasks if isinstance(task, _Task)) % period
+        self.__tasks.append(_Task(name, callback, period, offset, self.__tick_rate))
+
+    def add_sliced(self, name: str, source, work, rate: float, budget: float = None) -> None:
+        """
+        Daftarkan work(item) untuk setiap item dari source() sebanyak rate kali per detik.
+        budget (ms) membatasi waktu per tick, item sisa dilanjutkan tick berikutnya.
+        """
+        self.__tasks.append(_SlicedTask(name, source, work, rate, self.__tick_rate, budget))
+
+    def costs(self) -> dict[str, float]:
+        """Waktu eksekusi terakhir per subsystem (ms)."""
+        return {task.name: task.cost * 1000 for task in self.__tasks}
+
+    def tick(self) -> None:
+        """Jalankan semua subsystem yang jatuh tempo di tick ini."""
+        tick = self.__tick
+        for task in self.__tasks:
+            start = perf_counter()
+            if isinstance(task, _SlicedTask):
+                self.__run_slice(task)
+            elif tick % task.period == task.offset:
+                task.callback(task.dt)
+            else:
+                continue
+            task.cost = perf_counter() - start
+        self.__tick += 1
+
+    @staticmethod
+    def __run_slice(task: _SlicedTask) -> None:
+        if task.cursor >= len(task.items):
+            # Putaran baru: snapshot item saat ini
+            task.items = list(task.source())
+            task.cursor = 0
+            if not task.items:
+                return
+
+        quota = ceil(len(task.items) / task.slices)
+        end = min(len(task.items), task.cursor + quota)
+        deadline = perf_counter() + task.budget if task.budget else None
+        items, work = task.items, task.work
+        for i in range(task.cursor, end):
+            work(items[i])
+            if deadline and perf_counter() > deadline:
+                end = i + 1
+                break
+        task.cursor = end
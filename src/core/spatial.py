@@ -0,0 +1,213 @@
+"""
+Spatial Module
+Uniform grid spatial hash untuk query sprite berdasarkan area, radius, dan k-nearest.
+SpatialGroup menjadikannya service bersama: group enemy, bullet, dan collider
+di-index sekali per tick lalu dipakai flocking, collision, dan validasi spawn.
+"""
+import pygame
+from math import hypot
+
+# Ukuran cell grid (px): culling kamera dan query entity
+SPATIAL_CELL_SIZE = 256
+QUERY_CELL_SIZE = 128
+
+
+class SpatialGrid:
+    """
+    Spatial hash berbasis grid seragam.
+    Setiap sprite disimpan di semua cell yang di-overlap oleh rect-nya.
+    Hasil query berurutan sesuai urutan insert per cell (deterministik).
+    """
+
+    def __init__(self, cell_size: int = SPATIAL_CELL_SIZE):
+        self.__cell_size = cell_size
+        self.__cells = {}
+        self.__sprite_cells = {}
+
+    @property
+    def cell_size(self) -> int:
+        return self.__cell_size
+
+    def __len__(self) -> int:
+        return len(self.__sprite_cells)
+
+    def __contains__(self, sprite) -> bool:
+        return sprite in self.__sprite_cells
+
+    def __cell_range(self, rect) -> tuple[int, int, int, int]:
+        """Range cell (col awal, row awal, col akhir, row akhir) untuk sebuah rect."""
+        size = self.__cell_size
+        return (int(rect.left // size), int(rect.top // size),
+                int(rect.right // size), int(rect.bottom // size))
+
+    def insert(self, sprite) -> None:
+        """Masukkan sprite ke semua cell yang di-overlap."""
+        cell_range = self.__cell_range(sprite.rect)
+        self.__sprite_cells[sprite] = cell_range
+        first_col, first_row, last_col, last_row = cell_range
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                self.__cells.setdefault((col, row), {})[sprite] = None
+
+    def remove(self, sprite) -> None:
+        """Hapus sprite dari grid."""
+        cell_range = self.__sprite_cells.pop(sprite, None)
+        if cell_range is None:
+            return
+        first_col, first_row, last_col, last_row = cell_range
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cell = self.__cells.get((col, row))
+                if cell is not None:
+                    cell.pop(sprite, None)
+                    if not cell:
+                        del self.__cells[(col, row)]
+
+    def update(self, sprite) -> None:
+        """Pindahkan sprite ke cell baru jika rect-nya berpindah cell."""
+        if self.__sprite_cells.get(sprite) != self.__cell_range(sprite.rect):
+            self.remove(sprite)
+            self.insert(sprite)
+
+    def __candidates(self, rect) -> dict:
+        """Sprite di semua cell yang di-overlap rect (tanpa duplikat, urutan tetap)."""
+        result = {}
+        first_col, first_row, last_col, last_row = self.__cell_range(rect)
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                cell = self.__cells.get((col, row))
+                if cell:
+                    result.update(cell)
+        return result
+
+    def query_rect(self, rect) -> list:
+        """Semua sprite yang rect-nya overlap dengan rect yang diberikan."""
+        return [sprite for sprite in self.__candidates(rect) if sprite.rect.colliderect(rect)]
+
+    def query_radius(self, center, radius: float) -> list:
+        """Semua sprite yang center-nya berjarak <= radius dari center."""
+        x, y = center
+        bounds = pygame.FRect(x - radius, y - radius, radius * 2, radius * 2)
+        radius_sq = radius * radius
+        result = []
+        for sprite in self.__candidates(bounds):
+            dx, dy = sprite.rect.centerx - x, sprite.rect.centery - y
+            if dx * dx + dy * dy <= radius_sq:
+                result.append(sprite)
+        return result
+
+    def query_nearest(self, center, k: int = 1, max_radius: float = None) -> list:
+        """
+        k sprite terdekat dari center (urut jarak), opsional dibatasi max_radius.
+        Radius pencarian digandakan mulai dari satu cell sampai cukup kandidat.
+        """
+        if k <= 0 or not self.__sprite_cells:
+            return []
+        x, y = center
+        radius = self.__cell_size
+        while True:
+            limit = radius if max_radius is None else min(radius, max_radius)
+            found = self.query_radius(center, limit)
+            # Semua k terdekat pasti di dalam radius jika sudah ada >= k kandidat di dalamnya
+            if len(found) >= k or limit == max_radius or len(found) == len(self.__sprite_cells):
+                break
+            radius *= 2
+        found.sort(key=lambda sprite: (sprite.rect.centerx - x) ** 2 + (sprite.rect.centery - y) ** 2)
+        return found[:k]
+
+    def clear(self) -> None:
+        self.__cells.clear()
+        self.__sprite_cells.clear()
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """
+    Sprite group yang di-index SpatialGrid.
+    Sprite baru di-index saat sync() atau query pertama (rect belum ada saat sprite masuk group),
+    posisi sprite bergerak di-sync sekali per tick setelah movement.
+
+    Usage:
+        enemy_sprites = SpatialGroup()
+        enemy_sprites.sync()  # setelah semua sprite bergerak
+        hits = enemy_sprites.query_rect(bullet.rect)
+        neighbors = enemy_sprites.query_radius(enemy.rect.center, 100)
+        target = enemy_sprites.query_nearest(player.rect.center)
+    """
+
+    def __init__(self, *sprites, cell_size: int = QUERY_CELL_SIZE):
+        self.spatial = SpatialGrid(cell_size)
+        self.__pending = {}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.__pending[sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.__pending.pop(sprite, None)
+        self.spatial.remove(sprite)
+
+    def __flush_pending(self) -> None:
+        if self.__pending:
+            for sprite in self.__pending:
+                self.spatial.insert(sprite)
+            self.__pending.clear()
+
+    def sync(self) -> None:
+        """Index sprite baru dan pindahkan sprite yang berpindah cell."""
+        self.__flush_pending()
+        for sprite in self.sprites():
+            self.spatial.update(sprite)
+
+    def query_rect(self, rect) -> list:
+        self.__flush_pending()
+        return self.spatial.query_rect(rect)
+
+    def query_radius(self, center, radius: float) -> list:
+        self.__flush_pending()
+        return self.spatial.query_radius(center, radius)
+
+    def query_nearest(self, center, k: int = 1, max_radius: float = None) -> list:
+        self.__flush_pending()
+        return self.spatial.query_nearest(center, k, max_radius)
+
+
+def view_distance(position, view_rect) -> float:
+    """Jarak position ke tepi view_rect (0 jika di dalam atau view_rect None)."""
+    if view_rect is None:
+        return 0.0
+    x, y = position
+    dx = max(view_rect.left - x, x - view_rect.right, 0)
+    dy = max(view_rect.top - y, y - view_rect.bottom, 0)
+    return hypot(dx, dy)
+
+
+def push_out(rect, group, iterations: int = 4) -> bool:
+    """
+    Keluarkan rect dari sprite yang di-overlap lewat sumbu penetrasi terkecil
+    (tidak bergantung arah gerak). Return True jika rect sudah bebas overlap.
+    """
+    for _ in range(iterations):
+        hits = [sprite.rect for sprite in nearby(group, rect) if sprite.rect.colliderect(rect)]
+        if not hits:
+            return True
+        for other in hits:
+            if not other.colliderect(rect):
+                continue
+            left, right = rect.right - other.left, other.right - rect.left
+            up, down = rect.bottom - other.top, other.bottom - rect.top
+            push_x = -left if left < right else right
+            push_y = -up if up < down else down
+            if abs(push_x) < abs(push_y):
+                rect.x += push_x
+            else:
+                rect.y += push_y
+    return not any(sprite.rect.colliderect(rect) for sprite in nearby(group, rect))
+
+
+def nearby(group, rect):
+    """Sprite group yang mungkin overlap rect: query grid untuk SpatialGroup, seluruh group untuk group biasa."""
+    if isinstance(group, SpatialGroup):
+        return group.query_rect(rect)
+    return group
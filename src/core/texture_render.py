@@ -0,0 +1,125 @@
+"""
+Texture Render Module
+Backend render alternatif lewat pygame._sdl2.video (Renderer/Texture).
+World digambar sebagai Texture di GPU (atau software renderer SDL),
+HUD dan menu tetap digambar ke Surface lalu di-upload sebagai satu layer.
+"""
+import os
+import pygame
+from weakref import WeakKeyDictionary
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture, Image
+    HAS_SDL2_VIDEO = True
+except ImportError:
+    HAS_SDL2_VIDEO = False
+
+
+class TextureQueue:
+    """
+    Pengganti RenderQueue untuk Renderer: interface sama (blit, extend, flush).
+    Setiap Surface di-upload sekali sebagai Texture. Subsurface (frame atlas)
+    memakai Texture sheet induknya, jadi satu sheet atlas = satu upload.
+    """
+
+    def __init__(self, renderer):
+        self.__renderer = renderer
+        self.__batch = []
+        # Surface -> Image (Texture + source rect), Texture per sheet induk
+        self.__images = WeakKeyDictionary()
+        self.__sheets = WeakKeyDictionary()
+
+    def __len__(self) -> int:
+        return len(self.__batch)
+
+    def blit(self, surf: pygame.Surface, dest) -> None:
+        self.__batch.append((surf, dest))
+
+    def extend(self, pairs) -> None:
+        self.__batch.extend(pairs)
+
+    def __load(self, surf: pygame.Surface):
+        """Buat Image untuk sebuah Surface (texture sheet di-share antar subsurface)."""
+        parent = surf.get_abs_parent()
+        texture = self.__sheets.get(parent)
+        if texture is None:
+            texture = Texture.from_surface(self.__renderer, parent)
+            self.__sheets[parent] = texture
+        image = Image(texture, pygame.Rect(surf.get_abs_offset(), surf.get_size()))
+        self.__images[surf] = image
+        return image
+
+    def flush(self) -> None:
+        """Kirim semua draw ke Renderer (di-batch oleh SDL sampai present)."""
+        images = self.__images
+        for surf, dest in self.__batch:
+            image = images.get(surf)
+            if image is None:
+                image = self.__load(surf)
+            # Alpha per-surface (misal flash player) ikut ke Image
+            alpha = surf.get_alpha()
+            if alpha is not None and image.alpha != alpha:
+                image.alpha = alpha
+            # dstrect harus lengkap, posisi saja akan di-stretch ke ukuran texture sheet
+            width, height = image.srcrect.size
+            image.draw(dstrect=(dest[0], dest[1], width, height))
+        self.__batch.clear()
+
+
+class TextureBackend:
+    """
+    Window + Renderer SDL2. World lewat TextureQueue, UI lewat ui_surface (SRCALPHA)
+    yang di-upload ke satu streaming Texture setiap present.
+
+    Usage:
+        backend = TextureBackend.create((WINDOW_WIDTH, WINDOW_HEIGHT), 'InForHell')
+        backend.begin_frame()
+        ...  # AllSprites.draw lewat backend.queue, UI ke backend.ui_surface
+        backend.present()
+    """
+
+    def __init__(self, size: tuple[int, int], title: str, accelerated: bool = True):
+        # Display tersembunyi tetap dibutuhkan untuk convert()/convert_alpha()
+        pygame.display.set_mode(size, pygame.HIDDEN)
+        os.environ.setdefault('SDL_RENDER_BATCHING', '1')
+
+        self.__window = Window(title, size)
+        self.__renderer = Renderer(self.__window, accelerated=-1 if accelerated else 0)
+        self.__renderer.draw_color = (0, 0, 0, 255)
+
+        self.ui_surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.__ui_texture = Texture(self.__renderer, size, streaming=True)
+        self.__ui_texture.blend_mode = pygame.BLENDMODE_BLEND
+        self.queue = TextureQueue(self.__renderer)
+
+    @classmethod
+    def create(cls, size: tuple[int, int], title: str, accelerated: bool = True):
+        """Buat backend, atau None jika pygame._sdl2 tidak tersedia / Renderer gagal dibuat."""
+        if not HAS_SDL2_VIDEO:
+            print("pygame._sdl2.video tidak tersedia, kembali ke render software")
+            return None
+        try:
+            return cls(size, title, accelerated)
+        except (pygame.error, RuntimeError) as e:
+            print(f"Gagal membuat Renderer SDL2 ({e}), kembali ke render software")
+            return None
+
+    def begin_frame(self) -> None:
+        """Bersihkan render target di awal frame."""
+        self.__renderer.clear()
+
+    def __draw_ui(self) -> None:
+        self.__ui_texture.update(self.ui_surface)
+        self.__ui_texture.draw()
+
+    def capture(self) -> pygame.Surface:
+        """Baca frame saat ini (world + UI) sebagai Surface, untuk backdrop yang dibekukan."""
+        self.__draw_ui()
+        frame = self.__renderer.to_surface()
+        self.__renderer.clear()
+        return frame
+
+    def present(self) -> None:
+        """Gambar layer UI di atas world lalu tampilkan ke window."""
+        self.__draw_ui()
+        self.__renderer.present()
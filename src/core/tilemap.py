@@ -0,0 +1,103 @@
+"""
+Tilemap Module
+Layer tile statis (ground, wall) yang di-bake ke chunk surface saat map di-load.
+"""
+import pygame
+from math import ceil
+from settings import WINDOW_WIDTH, WINDOW_HEIGHT, CHUNK_SIZE
+
+
+class ChunkedGround:
+    """
+    Layer ground yang dipecah menjadi grid chunk surface.
+    Tile di-blit sekali ke chunk, kamera hanya blit chunk yang terlihat.
+    """
+
+    def __init__(self, map_width: int, map_height: int, chunk_size: int = CHUNK_SIZE):
+        self.__map_width = map_width
+        self.__map_height = map_height
+        self.__chunk_size = chunk_size
+        self.__cols = ceil(map_width / chunk_size)
+        self.__rows = ceil(map_height / chunk_size)
+        self.__chunks = {}
+        # Salinan chunk untuk render scale < 1 (dibuat sekali per skala)
+        self.__scaled_chunks = {}
+        self.__scaled_for = None
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self.__chunks)
+
+    def __get_chunk(self, col: int, row: int) -> pygame.Surface:
+        """Ambil chunk surface, buat baru jika belum ada."""
+        chunk = self.__chunks.get((col, row))
+        if chunk is None:
+            width = min(self.__chunk_size, self.__map_width - col * self.__chunk_size)
+            height = min(self.__chunk_size, self.__map_height - row * self.__chunk_size)
+            chunk = pygame.Surface((width, height)).convert()
+            chunk.fill('black')
+            self.__chunks[(col, row)] = chunk
+        return chunk
+
+    def add_tile(self, pos: tuple[int, int], surf: pygame.Surface) -> None:
+        """Bake tile ke semua chunk yang dilewatinya (urutan add = urutan layer)."""
+        x, y = int(pos[0]), int(pos[1])
+        width, height = surf.get_size()
+        size = self.__chunk_size
+
+        first_col, last_col = max(0, x // size), min(self.__cols - 1, (x + width - 1) // size)
+        first_row, last_row = max(0, y // size), min(self.__rows - 1, (y + height - 1) // size)
+
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                self.__get_chunk(col, row).blit(surf, (x - col * size, y - row * size))
+
+    def __scaled_chunk(self, col: int, row: int, scale: float) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Chunk yang sudah di-downscale beserta posisinya di world ter-skala."""
+        if self.__scaled_for != scale:
+            self.__scaled_chunks.clear()
+            self.__scaled_for = scale
+        
+        entry = self.__scaled_chunks.get((col, row))
+        if entry is None:
+            chunk = self.__chunks[(col, row)]
+            size = self.__chunk_size
+            # Batas dibulatkan dari koordinat world agar antar chunk tidak ada celah
+            x0, y0 = round(col * size * scale), round(row * size * scale)
+            x1 = round((col * size + chunk.get_width()) * scale)
+            y1 = round((row * size + chunk.get_height()) * scale)
+            try:
+                scaled = pygame.transform.smoothscale(chunk, (x1 - x0, y1 - y0))
+            except ValueError:
+                scaled = pygame.transform.scale(chunk, (x1 - x0, y1 - y0))
+            entry = (scaled, (x0, y0))
+            self.__scaled_chunks[(col, row)] = entry
+        return entry
+
+    def draw(self, target, offset: pygame.Vector2, scale: float = 1.0) -> None:
+        """
+        Blit chunk yang overlap dengan viewport kamera ke Surface atau RenderQueue.
+        Dengan scale < 1 target adalah world surface beresolusi WINDOW_SIZE * scale.
+        """
+        size = self.__chunk_size
+        view_left, view_top = -offset.x, -offset.y
+
+        first_col = max(0, int(view_left // size))
+        last_col = min(self.__cols - 1, int((view_left + WINDOW_WIDTH) // size))
+        first_row = max(0, int(view_top // size))
+        last_row = min(self.__rows - 1, int((view_top + WINDOW_HEIGHT) // size))
+
+        if scale != 1:
+            offset_x, offset_y = round(offset.x * scale), round(offset.y * scale)
+            for row in range(first_row, last_row + 1):
+                for col in range(first_col, last_col + 1):
+                    if (col, row) in self.__chunks:
+                        scaled, (x, y) = self.__scaled_chunk(col, row, scale)
+                        target.blit(scaled, (x + offset_x, y + offset_y))
+            return
+
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                chunk = self.__chunks.get((col, row))
+                if chunk:
+                    target.blit(chunk, (col * size + offset.x, row * size + offset.y))
@@ -0,0 +1,98 @@
+"""
+Timers Module
+Hierarchical timer wheel: callback dijadwalkan per tick simulasi dan hanya timer
+yang jatuh tempo yang disentuh, bukan setiap objek mengecek waktunya sendiri.
+"""
+
+# 4 level x 64 slot: jangkauan 64^4 tick (~77 jam pada 60 Hz)
+WHEEL_BITS = 6
+WHEEL_SLOTS = 1 << WHEEL_BITS
+WHEEL_MASK = WHEEL_SLOTS - 1
+WHEEL_LEVELS = 4
+
+
+class Timer:
+    """Handle timer yang dijadwalkan, bisa di-cancel sebelum jatuh tempo."""
+
+    def __init__(self, due: int, callback):
+        self.due = due
+        self.callback = callback
+
+    @property
+    def active(self) -> bool:
+        return self.callback is not None
+
+    def cancel(self) -> None:
+        # Cancel lazy: entry dibuang saat slot-nya diproses
+        self.callback = None
+
+
+class TimerWheel:
+    """
+    Timer wheel bertingkat dengan resolusi satu tick.
+    Level 0 menyimpan timer per tick untuk 64 tick ke depan, level di atasnya
+    menyimpan rentang 64x lebih kasar dan di-cascade turun saat rentangnya tiba.
+
+    Usage:
+        wheel = TimerWheel()
+        timer = wheel.schedule(30, on_expire)  # 30 tick lagi
+        wheel.advance(now_tick)                # panggil callback yang jatuh tempo
+    """
+
+    def __init__(self, now: int = 0):
+        self.__now = now
+        self.__levels = [[[] for _ in range(WHEEL_SLOTS)] for _ in range(WHEEL_LEVELS)]
+
+    @property
+    def now(self) -> int:
+        return self.__now
+
+    def schedule(self, delay: int, callback) -> Timer:
+        """Jadwalkan callback() setelah delay tick (minimal 1)."""
+        max_delay = (1 << (WHEEL_BITS * WHEEL_LEVELS)) - 1
+        timer = Timer(self.__now + min(max(1, delay), max_delay), callback)
+        self.__place(timer)
+        return timer
+
+    def clear(self) -> None:
+        """Buang semua timer yang tertunda."""
+        for level in self.__levels:
+            for slot in level:
+                slot.clear()
+
+    def __place(self, timer: Timer) -> None:
+        """Level = digit tertinggi yang berbeda antara waktu jatuh tempo dan sekarang."""
+        due, now = timer.due, self.__now
+        level = 0
+        while level < WHEEL_LEVELS - 1 and (due >> (WHEEL_BITS * (level + 1))) != (now >> (WHEEL_BITS * (level + 1))):
+            level += 1
+        self.__levels[level][(due >> (WHEEL_BITS * level)) & WHEEL_MASK].append(timer)
+
+    def advance(self, now: int) -> None:
+        """Majukan wheel sampai tick now, callback dipanggil urut waktu jatuh tempo."""
+        levels = self.__levels
+        while self.__now < now:
+            self.__now += 1
+            tick = self.__now
+
+            # Cascade dari level atas saat tick melewati batas rentangnya
+            for level in range(WHEEL_LEVELS - 1, 0, -1):
+                if tick & ((1 << (WHEEL_BITS * level)) - 1):
+                    continue
+                index = (tick >> (WHEEL_BITS * level)) & WHEEL_MASK
+                bucket = levels[level][index]
+                if bucket:
+                    levels[level][index] = []
+                    for timer in bucket:
+                        if timer.callback is not None:
+                            self.__place(timer)
+
+            index = tick & WHEEL_MASK
+            bucket = levels[0][index]
+            if bucket:
+                levels[0][index] = []
+                for timer in bucket:
+                    callback = timer.callback
+                    if callback is not None:
+                        timer.callback = None
+                        callback()
@@ -1,4 +1,5 @@
 # Entities Package
 from .player import Player, PlayerStats
-from .enemies import Enemy, EnemyFactory, Glitchslime, Dinointernet, Burnout, Evilpaper, Procrastinatemonster
+from .enemies import Enemy, EnemyVisuals, EnemyFactory, Glitchslime, Dinointernet, Burnout, Evilpaper, Procrastinatemonster
+from .enemy_store import EnemyStore, EnemyGroup
 from .sprites import Sprite, CollisionSprite
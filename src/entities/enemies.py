@@ -6,16 +6,86 @@ Menggunakan Pathfinding untuk mengejar player dan Flocking untuk pergerakan natu
 import pygame
 from abc import ABC
 import random
-from src.core.flocking import FlockingBehavior
+from settings import SIM_LOD_DISTANCE
+from src.core.flocking import FlockingBehavior, flocking_period
+from src.core.clock import get_clock, get_ticks, schedule
+from src.core.spatial import nearby, push_out, view_distance
+
+
+class EnemyVisuals:
+    """
+    Bundle grafik per tipe enemy (immutable).
+    Dibangun sekali oleh EnemyFactory dan di-share semua instance tipe tersebut.
+    """
+    
+    BOSS_SCALE = 5
+    
+    def __init__(self, frames: list[pygame.Surface]):
+        self.__source = frames
+        self.__frames = tuple(frames)
+        self.__flipped = tuple(pygame.transform.flip(f, True, False) for f in frames)
+        
+        # Boss: 5x ukuran sprite
+        self.__boss_frames = tuple(
+            pygame.transform.scale(f, (f.get_width() * self.BOSS_SCALE, f.get_height() * self.BOSS_SCALE))
+            for f in frames
+        )
+        self.__boss_flipped = tuple(pygame.transform.flip(f, True, False) for f in self.__boss_frames)
+        
+        # Siluet putih untuk animasi mati
+        self.__death = self.__silhouette(self.__frames[0]) if frames else None
+        self.__boss_death = self.__silhouette(self.__boss_frames[0]) if frames else None
+        
+        # Collision mask per frame (siluet mati pakai mask frame pertama)
+        self.__masks = tuple(pygame.mask.from_surface(f) for f in self.__frames)
+        self.__flipped_masks = tuple(pygame.mask.from_surface(f) for f in self.__flipped)
+        self.__boss_masks = tuple(pygame.mask.from_surface(f) for f in self.__boss_frames)
+        self.__boss_flipped_masks = tuple(pygame.mask.from_surface(f) for f in self.__boss_flipped)
+    
+    @staticmethod
+    def __silhouette(frame: pygame.Surface) -> pygame.Surface:
+        surf = pygame.mask.from_surface(frame).to_surface()
+        surf.set_colorkey('black')
+        return surf
+    
+    @property
+    def source(self) -> list[pygame.Surface]:
+        """List frame asli yang dipakai untuk membangun bundle."""
+        return self.__source
+    
+    def frames(self, is_boss: bool = False) -> tuple[pygame.Surface, ...]:
+        return self.__boss_frames if is_boss else self.__frames
+    
+    def flipped_frames(self, is_boss: bool = False) -> tuple[pygame.Surface, ...]:
+        return self.__boss_flipped if is_boss else self.__flipped
+    
+    def death_surface(self, is_boss: bool = False) -> pygame.Surface:
+        return self.__boss_death if is_boss else self.__death
+    
+    def masks(self, is_boss: bool = False) -> tuple[pygame.Mask, ...]:
+        return self.__boss_masks if is_boss else self.__masks
+    
+    def flipped_masks(self, is_boss: bool = False) -> tuple[pygame.Mask, ...]:
+        return self.__boss_flipped_masks if is_boss else self.__flipped_masks
 
 
 class Enemy(pygame.sprite.Sprite, ABC):
     """
     Abstract base class untuk semua enemy.
     Menggunakan Pathfinding untuk chase dan Flocking untuk natural movement.
+    Jika group enemy punya EnemyStore, movement dan animasi dihitung batch oleh store.
+    Enemy jauh di luar layar disimulasikan kasar: tanpa animasi, flocking, dan collision wall.
     """
     
-    def __init__(self, pos: tuple[int, int], frames: list[pygame.Surface], groups: tuple[pygame.sprite.Group, ...], 
+    # Arah hadap yang memakai frame flipped: 'left', 'right', atau None (tanpa flip)
+    FLIP_TOWARD = None
+    
+    # Bobot arah final: 70% pathfinding, 30% flocking (10% untuk boss)
+    PATHFINDING_WEIGHT = 0.7
+    FLOCKING_WEIGHT = 0.3
+    BOSS_FLOCKING_WEIGHT = 0.1
+    
+    def __init__(self, pos: tuple[int, int], visuals: EnemyVisuals, groups: tuple[pygame.sprite.Group, ...], 
                  player: pygame.sprite.Sprite, collision_sprites: pygame.sprite.Group, enemy_sprites: pygame.sprite.Group,
                  pathfinder,
                  health: int, speed: int, damage: int, exp_value: int, 
@@ -28,16 +98,16 @@ class Enemy(pygame.sprite.Sprite, ABC):
         self.pathfinder = pathfinder
         self.is_boss = is_boss
         
-        # Grafik dan scaling
-        self._frames = frames
+        # Grafik dari bundle shared (boss sudah di-scale 5x)
+        self._visuals = visuals
+        self._frames = visuals.frames(is_boss)
+        self._flipped_frames = visuals.flipped_frames(is_boss)
+        self._masks = visuals.masks(is_boss)
+        self._flipped_masks = visuals.flipped_masks(is_boss)
         self._frame_index = 0.0
+        self._flipped = False
         
-        # Boss: 5x ukuran sprite
         if self.is_boss:
-            self._frames = [
-                pygame.transform.scale(f, (f.get_width() * 5, f.get_height() * 5)) 
-                for f in self._frames
-            ]
             self._animation_speed = 4
             shrink_x = -50
             shrink_y = -50
@@ -47,6 +117,7 @@ class Enemy(pygame.sprite.Sprite, ABC):
             shrink_y = -40
             
         self.image = self._frames[int(self._frame_index)]
+        self.mask = self._masks[int(self._frame_index)]
         
         # Movement dan collision
         self.rect = self.image.get_frect(center=pos)
@@ -73,7 +144,6 @@ class Enemy(pygame.sprite.Sprite, ABC):
             self.__exp_value = scaled_exp
         
         self.__is_dead = False
-        self.__death_time = 0
         self.__death_duration = 400
         self.__exp_given = False
 
@@ -90,7 +160,24 @@ class Enemy(pygame.sprite.Sprite, ABC):
             alignment_weight=1.0,
             cohesion_weight=0.8
         )
-        self.use_flocking = True
+        self.__use_flocking = True
+        # Flocking force di-cache, di-refresh sesuai LOD jarak ke layar
+        self.__flocking_force = pygame.Vector2()
+        self.__flocking_tick = None
+        # Tier simulasi tick sebelumnya (untuk penempatan ulang saat kembali ke tier penuh)
+        self.__was_far = False
+        
+        # Arah gerak final (pathfinding + flocking), di-refresh oleh scheduler steering
+        self._steering = None
+        
+        # Slot di EnemyStore (struct-of-arrays) jika tersedia
+        self._store = getattr(enemy_sprites, 'store', None)
+        self._slot = None
+        if self._store is not None:
+            self._slot = self._store.add(
+                self, self._hitbox_rect, self.__speed, self._animation_speed, len(self._frames),
+                self.FLIP_TOWARD, self.PATHFINDING_WEIGHT, self.__flocking_weight(), self.flocking
+            )
 
     # Properties
     @property
@@ -109,6 +196,16 @@ class Enemy(pygame.sprite.Sprite, ABC):
     def exp_given(self) -> bool: 
         return self.__exp_given
     
+    @property
+    def use_flocking(self) -> bool:
+        return self.__use_flocking
+    
+    @use_flocking.setter
+    def use_flocking(self, value: bool) -> None:
+        self.__use_flocking = value
+        if self._store is not None:
+            self._store.set_flocking(self._slot, value)
+    
     @property
     def health_percentage(self) -> float: 
         return self.__current_health / self.__max_health if self.__max_health > 0 else 0
@@ -123,13 +220,31 @@ class Enemy(pygame.sprite.Sprite, ABC):
         return False
     
     def animate(self, dt: float) -> None:
-        """Animasi sprite enemy."""
+        """Animasi sprite enemy, flip sesuai FLIP_TOWARD dan arah gerak."""
         self._frame_index += self._animation_speed * dt
-        self.image = self._frames[int(self._frame_index) % len(self._frames)]
+        index = int(self._frame_index) % len(self._frames)
+        if self.FLIP_TOWARD and self._direction.x:
+            self._flipped = (self._direction.x < 0) == (self.FLIP_TOWARD == 'left')
+        self.show_frame(index, self._flipped)
+    
+    def show_frame(self, index: int, flipped: bool) -> None:
+        """Pasang image dan mask frame animasi (juga dipanggil EnemyStore)."""
+        if flipped:
+            self.image = self._flipped_frames[index]
+            self.mask = self._flipped_masks[index]
+        else:
+            self.image = self._frames[index]
+            self.mask = self._masks[index]
+    
+    def _is_far(self) -> bool:
+        """Enemy lebih dari SIM_LOD_DISTANCE di luar layar (tier simulasi kasar)."""
+        if self._store is not None:
+            return self._store.is_far(self._slot)
+        return view_distance(self.rect.center, getattr(self._enemy_sprites, 'view_rect', None)) > SIM_LOD_DISTANCE
     
     def _calculate_direction(self) -> None:
-        """Hitung arah ke player menggunakan pathfinding."""
-        current_time = pygame.time.get_ticks()
+        """Hitung arah ke player menggunakan pathfinding (flow field kasar untuk enemy jauh)."""
+        current_time = get_ticks()
         start_pos = self.rect.center
         target_pos = self._player.rect.center
         
@@ -141,7 +256,9 @@ class Enemy(pygame.sprite.Sprite, ABC):
         if current_time - self.path_timer > self.path_cooldown:
             self.path_timer = current_time
             
-            if self.is_boss:
+            if self._is_far():
+                pathfind_result = self.pathfinder.get_path_flow(start_pos, target_pos)
+            elif self.is_boss:
                 pathfind_result = self.pathfinder.get_path_astar(start_pos, target_pos)
             else:
                 pathfind_result = self.pathfinder.get_path_bfs(start_pos, target_pos)
@@ -155,34 +272,75 @@ class Enemy(pygame.sprite.Sprite, ABC):
             self._direction = direct_direction
     
     def _calculate_flocking_force(self) -> pygame.Vector2:
-        """Hitung flocking force dari enemy sekitar."""
-        if not self.use_flocking:
+        """Flocking force dari enemy sekitar (cache, makin jauh dari layar makin jarang di-refresh)."""
+        if not self.use_flocking or self._is_far():
             return pygame.Vector2()
-        return self.flocking.calculate()
+        tick = get_clock().tick_count
+        period = flocking_period(self.rect.center, getattr(self._enemy_sprites, 'view_rect', None))
+        if self.__flocking_tick is None or tick - self.__flocking_tick >= period:
+            self.__flocking_tick = tick
+            self.__flocking_force = self.flocking.calculate()
+        return self.__flocking_force
     
-    def move(self, dt: float) -> None:
-        """Movement dengan pathfinding + flocking."""
+    def __flocking_weight(self) -> float:
+        return self.BOSS_FLOCKING_WEIGHT if self.is_boss else self.FLOCKING_WEIGHT
+    
+    def steer(self) -> None:
+        """Hitung arah gerak dari pathfinding + flocking (tidak perlu setiap tick)."""
+        if self.__is_dead:
+            return
         self._calculate_direction()
-        flocking_force = self._calculate_flocking_force()
-        
-        # Bobot: 70% pathfinding, 30% flocking (10% untuk boss)
-        pathfinding_weight = 0.7
-        flocking_weight = 0.3 if not self.is_boss else 0.1
+        if self._store is not None:
+            # Flocking, blend, dan normalisasi dilakukan batch oleh store
+            if self.alive():
+                self._store.set_direction(self._slot, self._direction)
+            return
         
-        final_direction = (self._direction * pathfinding_weight) + (flocking_force * flocking_weight)
+        flocking_force = self._calculate_flocking_force()
+        final_direction = (self._direction * self.PATHFINDING_WEIGHT) + (flocking_force * self.__flocking_weight())
         
         if final_direction.length() > 0:
             final_direction = final_direction.normalize()
-
-        self._hitbox_rect.x += final_direction.x * self.__speed * dt
-        self._collision('horizontal')
-        self._hitbox_rect.y += final_direction.y * self.__speed * dt
-        self._collision('vertical')
+        self._steering = final_direction
+    
+    def move(self, dt: float) -> None:
+        """Movement mengikuti arah steering terakhir."""
+        if self._steering is None:
+            self.steer()
+        final_direction = self._steering
+        far = self._is_far()
+        if far:
+            self._move_coarse(final_direction * self.__speed * dt)
+        else:
+            if self.__was_far:
+                self._place_promoted()
+            self._hitbox_rect.x += final_direction.x * self.__speed * dt
+            self._collision('horizontal')
+            self._hitbox_rect.y += final_direction.y * self.__speed * dt
+            self._collision('vertical')
+        self.__was_far = far
         self.rect.center = self._hitbox_rect.center
     
+    def _move_coarse(self, velocity: pygame.Vector2) -> None:
+        """Gerak tier kasar: collision per tile, langkah per axis dari tile walkable ke tile terhalang dibatalkan."""
+        center = pygame.Vector2(self._hitbox_rect.center)
+        walkable = self.pathfinder.is_walkable(center)
+        if not walkable or self.pathfinder.is_walkable((center.x + velocity.x, center.y)):
+            center.x += velocity.x
+        walkable = self.pathfinder.is_walkable(center)
+        if not walkable or self.pathfinder.is_walkable((center.x, center.y + velocity.y)):
+            center.y += velocity.y
+        self._hitbox_rect.center = center
+    
+    def _place_promoted(self) -> None:
+        """Kembali ke tier penuh sambil overlap wall: pindah ke tile walkable terdekat lalu dorong keluar."""
+        if any(sprite.rect.colliderect(self._hitbox_rect) for sprite in nearby(self._collision_sprites, self._hitbox_rect)):
+            self._hitbox_rect.center = self.pathfinder.walkable_center(self._hitbox_rect.center)
+            push_out(self._hitbox_rect, self._collision_sprites)
+    
     def _collision(self, direction: str) -> None:
         """Handle collision dengan obstacle."""
-        for sprite in self._collision_sprites:
+        for sprite in nearby(self._collision_sprites, self._hitbox_rect):
             if sprite.rect.colliderect(self._hitbox_rect):
                 if direction == 'horizontal':
                     if self._direction.x > 0: self._hitbox_rect.right = sprite.rect.left
@@ -194,10 +352,12 @@ class Enemy(pygame.sprite.Sprite, ABC):
     def destroy(self) -> None:
         """Menandai enemy sebagai mati."""
         self.__is_dead = True
-        self.__death_time = pygame.time.get_ticks()
-        surf = pygame.mask.from_surface(self._frames[0]).to_surface()
-        surf.set_colorkey('black')
-        self.image = surf
+        if self._store is not None:
+            self._store.deactivate(self._slot)
+        # Sprite dihapus setelah animasi mati selesai
+        schedule(self.__death_duration, self.kill)
+        self.image = self._visuals.death_surface(self.is_boss)
+        self.mask = self._masks[0]
     
     def give_exp_reward(self) -> int:
         """Memberikan exp reward sekali saja."""
@@ -206,146 +366,70 @@ class Enemy(pygame.sprite.Sprite, ABC):
             return self.__exp_value
         return 0
     
-    def _death_timer(self) -> None:
-        """Timer untuk death animation."""
-        if pygame.time.get_ticks() - self.__death_time >= self.__death_duration:
-            self.kill()
-    
     def update(self, dt: float) -> None:
-        """Update enemy setiap frame."""
-        if not self.__is_dead:
+        """Update enemy setiap frame (enemy mati menunggu timer death animation)."""
+        if not self.__is_dead and self._store is None:
             self.move(dt)
-            self.animate(dt)
-        else:
-            self._death_timer()
+            if not self._is_far():
+                self.animate(dt)
 
 
 # Concrete Enemy Classes - Setiap class sesuai dengan nama folder di images/enemies/
 
 class Glitchslime(Enemy):
     """Slime digital yang berglitch, balanced stats."""
-    def __init__(self, pos, frames, groups, player, collision_sprites, enemy_sprites, pathfinder, 
+    FLIP_TOWARD = 'left'
+    
+    def __init__(self, pos, visuals, groups, player, collision_sprites, enemy_sprites, pathfinder, 
                  is_boss=False, difficulty_multiplier=1.0):
-        super().__init__(pos, frames, groups, player, collision_sprites, enemy_sprites, pathfinder,
+        super().__init__(pos, visuals, groups, player, collision_sprites, enemy_sprites, pathfinder,
                          health=50, speed=120, damage=8, exp_value=10, 
                          is_boss=is_boss, difficulty_multiplier=difficulty_multiplier)
-        self.__facing_left = False
-    
-    def animate(self, dt: float) -> None:
-        """Flip sprite berdasarkan arah gerak."""
-        self._frame_index += self._animation_speed * dt
-        current_frame = self._frames[int(self._frame_index) % len(self._frames)]
-        
-        if self._direction.x < 0 and not self.__facing_left:
-            self.__facing_left = True
-        elif self._direction.x > 0 and self.__facing_left:
-            self.__facing_left = False
-        
-        if self.__facing_left:
-            self.image = pygame.transform.flip(current_frame, True, False)
-        else:
-            self.image = current_frame
 
 
 class Dinointernet(Enemy):
     """Dinosaurus dari era internet mati, sedikit lebih kuat."""
-    def __init__(self, pos, frames, groups, player, collision_sprites, enemy_sprites, pathfinder, 
+    FLIP_TOWARD = 'left'
+    
+    def __init__(self, pos, visuals, groups, player, collision_sprites, enemy_sprites, pathfinder, 
                  is_boss=False, difficulty_multiplier=1.0):
-        super().__init__(pos, frames, groups, player, collision_sprites, enemy_sprites, pathfinder,
+        super().__init__(pos, visuals, groups, player, collision_sprites, enemy_sprites, pathfinder,
                          health=60, speed=130, damage=10, exp_value=12, 
                          is_boss=is_boss, difficulty_multiplier=difficulty_multiplier)
-        self.__facing_left = False
-    
-    def animate(self, dt: float) -> None:
-        """Flip sprite berdasarkan arah gerak."""
-        self._frame_index += self._animation_speed * dt
-        current_frame = self._frames[int(self._frame_index) % len(self._frames)]
-        
-        if self._direction.x < 0 and not self.__facing_left:
-            self.__facing_left = True
-        elif self._direction.x > 0 and self.__facing_left:
-            self.__facing_left = False
-        
-        if self.__facing_left:
-            self.image = pygame.transform.flip(current_frame, True, False)
-        else:
-            self.image = current_frame
 
 
 class Burnout(Enemy):
     """Mahasiswa yang kelelahan, cepat tapi lemah."""
-    def __init__(self, pos, frames, groups, player, collision_sprites, enemy_sprites, pathfinder, 
+    FLIP_TOWARD = 'right'
+    
+    def __init__(self, pos, visuals, groups, player, collision_sprites, enemy_sprites, pathfinder, 
                  is_boss=False, difficulty_multiplier=1.0):
-        super().__init__(pos, frames, groups, player, collision_sprites, enemy_sprites, pathfinder,
+        super().__init__(pos, visuals, groups, player, collision_sprites, enemy_sprites, pathfinder,
                          health=35, speed=200, damage=12, exp_value=15, 
                          is_boss=is_boss, difficulty_multiplier=difficulty_multiplier)
-        self.__facing_right = False
-    
-    def animate(self, dt: float) -> None:
-        """Flip sprite berdasarkan arah gerak (flip ke kanan)."""
-        self._frame_index += self._animation_speed * dt
-        current_frame = self._frames[int(self._frame_index) % len(self._frames)]
-        
-        if self._direction.x > 0 and not self.__facing_right:
-            self.__facing_right = True
-        elif self._direction.x < 0 and self.__facing_right:
-            self.__facing_right = False
-        
-        if self.__facing_right:
-            self.image = pygame.transform.flip(current_frame, True, False)
-        else:
-            self.image = current_frame
 
 
 class Evilpaper(Enemy):
     """Kertas tugas yang menyerang balik, ringan dan cepat."""
-    def __init__(self, pos, frames, groups, player, collision_sprites, enemy_sprites, pathfinder, 
+    FLIP_TOWARD = 'left'
+    
+    def __init__(self, pos, visuals, groups, player, collision_sprites, enemy_sprites, pathfinder, 
                  is_boss=False, difficulty_multiplier=1.0):
-        super().__init__(pos, frames, groups, player, collision_sprites, enemy_sprites, pathfinder,
+        super().__init__(pos, visuals, groups, player, collision_sprites, enemy_sprites, pathfinder,
                          health=40, speed=160, damage=10, exp_value=14, 
                          is_boss=is_boss, difficulty_multiplier=difficulty_multiplier)
-        self.__facing_left = False
-    
-    def animate(self, dt: float) -> None:
-        """Flip sprite berdasarkan arah gerak."""
-        self._frame_index += self._animation_speed * dt
-        current_frame = self._frames[int(self._frame_index) % len(self._frames)]
-        
-        if self._direction.x < 0 and not self.__facing_left:
-            self.__facing_left = True
-        elif self._direction.x > 0 and self.__facing_left:
-            self.__facing_left = False
-        
-        if self.__facing_left:
-            self.image = pygame.transform.flip(current_frame, True, False)
-        else:
-            self.image = current_frame
 
 
 class Procrastinatemonster(Enemy):
     """Monster prokrastinasi, tank lambat tapi kuat."""
-    def __init__(self, pos, frames, groups, player, collision_sprites, enemy_sprites, pathfinder, 
+    FLIP_TOWARD = 'left'
+    
+    def __init__(self, pos, visuals, groups, player, collision_sprites, enemy_sprites, pathfinder, 
                  is_boss=False, difficulty_multiplier=1.0):
-        super().__init__(pos, frames, groups, player, collision_sprites, enemy_sprites, pathfinder,
+        super().__init__(pos, visuals, groups, player, collision_sprites, enemy_sprites, pathfinder,
                          health=120, speed=100, damage=20, exp_value=25, 
                          is_boss=is_boss, difficulty_multiplier=difficulty_multiplier)
         self.use_flocking = False  # Tank bergerak sendiri
-        self.__facing_left = False
-    
-    def animate(self, dt: float) -> None:
-        """Flip sprite berdasarkan arah gerak."""
-        self._frame_index += self._animation_speed * dt
-        current_frame = self._frames[int(self._frame_index) % len(self._frames)]
-        
-        if self._direction.x < 0 and not self.__facing_left:
-            self.__facing_left = True
-        elif self._direction.x > 0 and self.__facing_left:
-            self.__facing_left = False
-        
-        if self.__facing_left:
-            self.image = pygame.transform.flip(current_frame, True, False)
-        else:
-            self.image = current_frame
 
 
 class EnemyFactory:
@@ -359,6 +443,17 @@ class EnemyFactory:
         'procrastinatemonster': Procrastinatemonster,
     }
     
+    _visuals_cache = {}
+    
+    @staticmethod
+    def get_visuals(enemy_type: str, frames: list[pygame.Surface]) -> EnemyVisuals:
+        """Ambil bundle grafik tipe enemy, dibangun sekali lalu di-cache."""
+        visuals = EnemyFactory._visuals_cache.get(enemy_type)
+        if visuals is None or visuals.source is not frames:
+            visuals = EnemyVisuals(frames)
+            EnemyFactory._visuals_cache[enemy_type] = visuals
+        return visuals
+    
     @staticmethod
     def create_enemy(enemy_type: str, pos: tuple[int, int], frames_dict: dict, 
                      groups: tuple[pygame.sprite.Group, ...], player: pygame.sprite.Sprite, 
@@ -370,8 +465,11 @@ class EnemyFactory:
         """
         enemy_class = EnemyFactory.ENEMY_MAPPING.get(enemy_type, Glitchslime)
         frames = frames_dict.get(enemy_type)
+        visuals_type = enemy_type
         if not frames:
             frames = list(frames_dict.values())[0] if frames_dict else []
+            visuals_type = next(iter(frames_dict), enemy_type)
+        visuals = EnemyFactory.get_visuals(visuals_type, frames)
         enemy_sprites_group = groups[1]
-        return enemy_class(pos, frames, groups, player, collision_sprites, enemy_sprites_group, 
+        return enemy_class(pos, visuals, groups, player, collision_sprites, enemy_sprites_group, 
                           pathfinder, is_boss, difficulty_multiplier)
@@ -0,0 +1,387 @@
+"""
+Enemy Store Module
+Data enemy dalam bentuk struct-of-arrays (NumPy): posisi, arah, speed, fase animasi.
+Movement, collision wall, dan pemilihan frame animasi dihitung untuk semua enemy sekaligus,
+sprite Enemy hanya menjadi view untuk render dan collision mask.
+Enemy jauh di luar layar disimulasikan kasar (tanpa animasi, flocking, dan collision wall).
+NumPy opsional: tanpa NumPy setiap Enemy bergerak sendiri seperti biasa.
+"""
+import pygame
+from settings import FLOCKING_PERIOD, FLOCKING_LOD_DISTANCE, FLOCKING_MAX_PERIOD, SIM_LOD_DISTANCE, TILE_SIZE
+from src.core.flocking import flocking_forces
+from src.core.clock import get_clock
+from src.core.spatial import SpatialGroup, nearby, push_out
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Aturan flip frame berdasarkan arah gerak horizontal
+FLIP_NONE, FLIP_LEFT, FLIP_RIGHT = 0, 1, 2
+_FLIP_RULES = {None: FLIP_NONE, 'left': FLIP_LEFT, 'right': FLIP_RIGHT}
+
+
+class EnemyStore:
+    """
+    Struct-of-arrays untuk semua enemy hidup. Setiap enemy menempati satu slot,
+    slot yang dilepas dipakai ulang. Kapasitas digandakan saat penuh.
+
+    Usage:
+        store = EnemyStore(collision_sprites)
+        slot = store.add(enemy, hitbox, speed, ...)
+        store.set_direction(slot, path_direction)
+        store.update_flocking(tick, view_rect)  # flocking enemy yang jatuh tempo (setiap tick)
+        store.update(dt, view_rect)             # sekali per tick untuk semua enemy
+    """
+
+    INITIAL_CAPACITY = 256
+    # Ukuran bin flocking (px): neighbor hanya dicari di bin sendiri dan bin sekitarnya
+    FLOCKING_CELL_SIZE = 100
+
+    def __init__(self, collision_sprites: pygame.sprite.Group, capacity: int = INITIAL_CAPACITY):
+        self.__collision_sprites = collision_sprites
+        # Grid tile walkable dari Pathfinder (collision murah untuk tier kasar)
+        self.__pathfinder = None
+        self.__walkable = None
+        self.__colliders = None
+        self.__collider_count = -1
+        self.__sprites = [None] * capacity
+        self.__free = list(range(capacity - 1, -1, -1))
+        # Enemy baru di-steer sekali sebelum gerakan pertamanya
+        self.__unsteered = []
+        self.__capacity = 0
+        self.__grow(capacity)
+
+    def __len__(self) -> int:
+        return self.__capacity - len(self.__free)
+
+    def __grow(self, capacity: int) -> None:
+        """Alokasi ulang semua array ke kapasitas baru (isi lama disalin)."""
+        old = self.__capacity
+        fields = {
+            'center': (2, np.float64), 'half': (2, np.float64),
+            'path': (2, np.float64), 'flock': (2, np.float64),
+            'path_weight': (None, np.float64), 'flock_weight': (None, np.float64),
+            'speed': (None, np.float64), 'frame': (None, np.float64), 'anim_speed': (None, np.float64),
+            'radius': (None, np.float64), 'separation': (None, np.float64),
+            'alignment': (None, np.float64), 'cohesion': (None, np.float64), 'flocking': (None, np.bool_),
+            'frame_count': (None, np.int64), 'shown': (None, np.int64),
+            'flip_rule': (None, np.int8), 'flipped': (None, np.bool_), 'active': (None, np.bool_),
+            'far': (None, np.bool_),
+        }
+        for name, (width, dtype) in fields.items():
+            shape = (capacity, width) if width else (capacity,)
+            array = np.zeros(shape, dtype)
+            if old:
+                array[:old] = getattr(self, f'_{name}')
+            setattr(self, f'_{name}', array)
+        if old:
+            self.__sprites.extend([None] * (capacity - old))
+            self.__free.extend(range(capacity - 1, old - 1, -1))
+        self.__capacity = capacity
+
+    def add(self, enemy, hitbox: pygame.FRect, speed: float, animation_speed: float, frame_count: int,
+            flip_toward: str = None, path_weight: float = 0.7, flock_weight: float = 0.3,
+            flocking=None) -> int:
+        """Daftarkan enemy baru (flocking: FlockingBehavior sumber parameter Boids), return index slot."""
+        if not self.__free:
+            self.__grow(self.__capacity * 2)
+        slot = self.__free.pop()
+        self.__sprites[slot] = enemy
+        self._center[slot] = hitbox.center
+        self._half[slot] = (hitbox.width / 2, hitbox.height / 2)
+        self._path[slot] = (0, 0)
+        self._flock[slot] = (0, 0)
+        self._path_weight[slot] = path_weight
+        self._flock_weight[slot] = flock_weight
+        self._speed[slot] = speed
+        self._frame[slot] = 0
+        self._anim_speed[slot] = animation_speed
+        self._frame_count[slot] = max(1, frame_count)
+        self._shown[slot] = 0
+        self._flocking[slot] = flocking is not None
+        if flocking is not None:
+            self._radius[slot] = flocking.perception_radius
+            self._separation[slot] = flocking.separation_weight
+            self._alignment[slot] = flocking.alignment_weight
+            self._cohesion[slot] = flocking.cohesion_weight
+        self._flip_rule[slot] = _FLIP_RULES.get(flip_toward, FLIP_NONE)
+        self._flipped[slot] = False
+        self._active[slot] = True
+        self._far[slot] = False
+        self.__unsteered.append(enemy)
+        return slot
+
+    def deactivate(self, slot: int) -> None:
+        """Enemy mati: berhenti bergerak dan beranimasi, slot masih dipegang sprite."""
+        self._active[slot] = False
+
+    def release(self, slot: int, enemy) -> None:
+        """Lepas slot milik enemy saat sprite di-kill."""
+        if self.__sprites[slot] is enemy:
+            self.__sprites[slot] = None
+            self._active[slot] = False
+            self.__free.append(slot)
+
+    def set_direction(self, slot: int, path_direction) -> None:
+        """Simpan arah pathfinding terbaru untuk di-blend saat update."""
+        self._path[slot] = path_direction
+
+    def set_flocking(self, slot: int, enabled: bool) -> None:
+        """Aktif/nonaktifkan flocking enemy (force lama dibuang)."""
+        self._flocking[slot] = enabled
+        if not enabled:
+            self._flock[slot] = (0, 0)
+
+    def set_pathfinder(self, pathfinder) -> None:
+        """Pakai grid pathfinder untuk collision tier kasar dan penempatan ulang saat promosi."""
+        self.__pathfinder = pathfinder
+        self.__walkable = np.array(pathfinder.matrix) == 0
+
+    def __walkable_at(self, points):
+        """Mask titik (K, 2) yang berada di tile walkable."""
+        cols = np.floor(points[:, 0] / TILE_SIZE).astype(np.int64)
+        rows = np.floor(points[:, 1] / TILE_SIZE).astype(np.int64)
+        height, width = self.__walkable.shape
+        inside = (cols >= 0) & (cols < width) & (rows >= 0) & (rows < height)
+        result = np.zeros(len(points), dtype=np.bool_)
+        result[inside] = self.__walkable[rows[inside], cols[inside]]
+        return result
+
+    def __move_coarse(self, center, velocity) -> None:
+        """
+        Gerak tier kasar: per axis, langkah dari tile walkable ke tile terhalang dibatalkan.
+        Grid pathfinder lebih konservatif dari collider, jadi enemy yang sudah berada di tile
+        terhalang tetap boleh bergerak keluar.
+        """
+        if self.__walkable is None:
+            center += velocity
+            return
+        for axis in (0, 1):
+            moved = center.copy()
+            moved[:, axis] += velocity[:, axis]
+            allowed = self.__walkable_at(moved) | ~self.__walkable_at(center)
+            center[allowed, axis] = moved[allowed, axis]
+
+    def __place_promoted(self, slots) -> None:
+        """
+        Enemy yang baru kembali ke tier penuh dan hitbox-nya overlap collider dipindah ke center
+        tile walkable terdekat lalu didorong keluar lewat penetrasi terkecil, sebelum resolve per axis.
+        """
+        if self.__pathfinder is None:
+            return
+        for slot in slots.tolist():
+            half_w, half_h = self._half[slot]
+            hitbox = pygame.FRect(0, 0, half_w * 2, half_h * 2)
+            hitbox.center = tuple(self._center[slot])
+            if not any(sprite.rect.colliderect(hitbox) for sprite in nearby(self.__collision_sprites, hitbox)):
+                continue
+            hitbox.center = self.__pathfinder.walkable_center(hitbox.center)
+            push_out(hitbox, self.__collision_sprites)
+            self._center[slot] = hitbox.center
+
+    def is_far(self, slot: int) -> bool:
+        """Enemy sedang disimulasikan kasar (jauh di luar layar)."""
+        return bool(self._far[slot])
+
+    def __view_distances(self, active, view_rect):
+        """Jarak center enemy ke tepi layar (view_distance() versi vectorized)."""
+        if view_rect is None:
+            return np.zeros(active.size)
+        x, y = self._center[active, 0], self._center[active, 1]
+        dx = np.maximum(np.maximum(view_rect.left - x, x - view_rect.right), 0)
+        dy = np.maximum(np.maximum(view_rect.top - y, y - view_rect.bottom), 0)
+        return np.hypot(dx, dy)
+
+    @staticmethod
+    def __flocking_periods(distance):
+        """Period refresh flocking per enemy (tick), sama dengan flocking_period() versi vectorized."""
+        level = np.minimum(np.ceil(distance / FLOCKING_LOD_DISTANCE), 16).astype(np.int64)
+        return np.minimum(FLOCKING_MAX_PERIOD, FLOCKING_PERIOD << level)
+
+    def update_flocking(self, tick: int, view_rect=None) -> None:
+        """
+        Hitung flocking force enemy yang jatuh tempo di tick ini secara vectorized.
+        Enemy di layar di-refresh setiap FLOCKING_PERIOD tick, makin jauh makin jarang;
+        fase per slot menyebar refresh rata ke semua tick. Force lama dipakai di antaranya.
+        Enemy yang disimulasikan kasar tidak flocking.
+        Enemy di-bin per cell grid, tiap bin hanya dibandingkan dengan enemy
+        di bin dalam jangkauan perception radius (biaya ikut kepadatan lokal).
+        """
+        active = np.flatnonzero(self._active)
+        # Period kelipatan 2: tick refresh period besar selalu subset period kecil
+        periods = self.__flocking_periods(self.__view_distances(active, view_rect))
+        due = self._flocking[active] & ~self._far[active] & ((tick + active) % periods == 0)
+        subjects = np.flatnonzero(due)
+        if not subjects.size:
+            return
+        center, path = self._center[active], self._path[active]
+        size = self.FLOCKING_CELL_SIZE
+        cell = np.floor(center / size).astype(np.int64)
+        reach = int(np.ceil(self._radius[active[subjects]].max() / size))
+
+        # Key cell kolom-major: cell row - reach .. row + reach di satu kolom = satu range key
+        cell -= cell.min(axis=0) - reach
+        rows = int(cell[:, 1].max()) + reach + 1
+        key = cell[:, 0] * rows + cell[:, 1]
+        order = np.argsort(key, kind='stable')
+        sorted_key = key[order]
+
+        # Range [start, end) enemy di setiap kolom tetangga, per subject
+        base = key[subjects, None] + np.arange(-reach, reach + 1)[None, :] * rows
+        starts = np.searchsorted(sorted_key, base - reach, 'left')
+        lengths = np.searchsorted(sorted_key, base + reach, 'right') - starts
+        totals = lengths.cumsum(axis=1)
+
+        # Gabungkan range menjadi daftar kandidat neighbor (K, C), -1 untuk padding
+        offset = np.arange(int(totals[:, -1].max()))
+        part = np.minimum((offset[None, :, None] >= totals[:, None, :]).sum(axis=2), totals.shape[1] - 1)
+        row_index = np.arange(len(subjects))[:, None]
+        index = starts[row_index, part] + offset[None, :] - (totals - lengths)[row_index, part]
+        candidates = np.where(offset[None, :] < totals[:, -1:], order[np.minimum(index, len(order) - 1)], -1)
+
+        slots = active[subjects]
+        self._flock[slots] = flocking_forces(
+            center, path, subjects, self._radius[slots],
+            self._separation[slots], self._alignment[slots], self._cohesion[slots], candidates
+        )
+
+    def __get_colliders(self):
+        """Array (M, 4) left, top, right, bottom dari collision sprite (dibangun ulang jika jumlahnya berubah)."""
+        if self.__collider_count != len(self.__collision_sprites):
+            rects = [sprite.rect for sprite in self.__collision_sprites]
+            self.__colliders = np.array([(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.float64).reshape(-1, 4)
+            self.__collider_count = len(rects)
+        return self.__colliders
+
+    @staticmethod
+    def __resolve(center, half, direction, axis: int, colliders) -> None:
+        """
+        Collision per axis terhadap semua collider sekaligus: hitbox yang overlap
+        didorong ke sisi collider sesuai tanda arah pathfinding (sama seperti Enemy._collision).
+        """
+        if not len(colliders):
+            return
+        left, top = center[:, 0] - half[:, 0], center[:, 1] - half[:, 1]
+        right, bottom = center[:, 0] + half[:, 0], center[:, 1] + half[:, 1]
+        overlap = ((left[:, None] < colliders[:, 2]) & (right[:, None] > colliders[:, 0]) &
+                   (top[:, None] < colliders[:, 3]) & (bottom[:, None] > colliders[:, 1]))
+        hit = overlap.any(axis=1)
+        if not hit.any():
+            return
+
+        near, far = (0, 2) if axis == 0 else (1, 3)
+        forward = np.flatnonzero(hit & (direction > 0))
+        if forward.size:
+            edge = np.where(overlap[forward], colliders[:, near], np.inf).min(axis=1)
+            center[forward, axis] = edge - half[forward, axis]
+        backward = np.flatnonzero(hit & (direction < 0))
+        if backward.size:
+            edge = np.where(overlap[backward], colliders[:, far], -np.inf).max(axis=1)
+            center[backward, axis] = edge + half[backward, axis]
+
+    def update(self, dt: float, view_rect=None) -> None:
+        """
+        Blend steering, integrasi posisi + collision wall, dan animasi untuk semua enemy aktif.
+        Enemy lebih dari SIM_LOD_DISTANCE di luar layar masuk tier kasar: hanya bergerak mengikuti
+        arah pathfinding dengan collision per tile. Tier dihitung ulang setiap tick, jadi enemy sudah
+        kembali ke simulasi penuh (dan ditempatkan ulang jika overlap wall) jauh sebelum masuk layar.
+        """
+        if self.__unsteered:
+            for enemy in self.__unsteered:
+                if enemy.alive():
+                    enemy.steer()
+            self.__unsteered.clear()
+        
+        active = np.flatnonzero(self._active)
+        if not active.size:
+            return
+
+        # Tier simulasi: far = kasar, full = simulasi penuh
+        far = self.__view_distances(active, view_rect) > SIM_LOD_DISTANCE
+        promoted = active[self._far[active] & ~far]
+        self._far[active] = far
+        full = np.flatnonzero(~far)
+        if promoted.size:
+            self.__place_promoted(promoted)
+        if far.any():
+            # Force flocking lama tidak dipakai lagi saat enemy kembali ke tier penuh
+            self._flock[active[far]] = 0
+
+        # Arah final: bobot pathfinding + flocking, dinormalisasi
+        path = self._path[active]
+        direction = path * self._path_weight[active, None] + self._flock[active] * self._flock_weight[active, None]
+        length = np.hypot(direction[:, 0], direction[:, 1])
+        moving = length > 0
+        direction[moving] /= length[moving, None]
+        velocity = direction * (self._speed[active] * dt)[:, None]
+
+        # Integrasi per axis: collision wall untuk tier penuh, collision tile untuk tier kasar
+        center = self._center[active]
+        near, near_half, near_path = center[full], self._half[active[full]], path[full]
+        colliders = self.__get_colliders()
+        near[:, 0] += velocity[full, 0]
+        self.__resolve(near, near_half, near_path[:, 0], 0, colliders)
+        near[:, 1] += velocity[full, 1]
+        self.__resolve(near, near_half, near_path[:, 1], 1, colliders)
+        center[full] = near
+        coarse = center[far]
+        self.__move_coarse(coarse, velocity[far])
+        center[far] = coarse
+        self._center[active] = center
+
+        # Animasi tier penuh: index frame dari fase, flip mengikuti arah pathfinding (tetap jika x = 0)
+        animated = active[full]
+        frame = self._frame[animated] + self._anim_speed[animated] * dt
+        self._frame[animated] = frame
+        shown = frame.astype(np.int64) % self._frame_count[animated]
+        rule, path_x = self._flip_rule[animated], near_path[:, 0]
+        flipped = self._flipped[animated]
+        flipped = np.where(((rule == FLIP_LEFT) & (path_x < 0)) | ((rule == FLIP_RIGHT) & (path_x > 0)), True,
+                           np.where(((rule == FLIP_LEFT) & (path_x > 0)) | ((rule == FLIP_RIGHT) & (path_x < 0)), False, flipped))
+        changed = animated[(shown != self._shown[animated]) | (flipped != self._flipped[animated])]
+        self._shown[animated] = shown
+        self._flipped[animated] = flipped
+
+        # Sync ke sprite view: posisi semua enemy aktif, image hanya yang frame-nya berganti
+        sprites = self.__sprites
+        for slot, x, y in zip(active.tolist(), center[:, 0].tolist(), center[:, 1].tolist()):
+            sprites[slot].rect.center = (x, y)
+        for slot in changed.tolist():
+            sprites[slot].show_frame(int(self._shown[slot]), bool(self._flipped[slot]))
+
+
+class EnemyGroup(SpatialGroup):
+    """
+    Group enemy ter-index spatial grid yang memiliki EnemyStore (jika NumPy tersedia).
+    update(dt) menjalankan movement batch lewat store; update per sprite tetap lewat AllSprites.
+    """
+
+    def __init__(self, collision_sprites: pygame.sprite.Group, *sprites):
+        super().__init__(*sprites)
+        self.store = EnemyStore(collision_sprites) if HAS_NUMPY else None
+        # Area layar untuk LOD flocking dan tier simulasi (di-set Game setiap tick)
+        self.view_rect = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        slot = getattr(sprite, '_slot', None)
+        if self.store is not None and slot is not None:
+            self.store.release(slot, sprite)
+
+    def update(self, dt: float) -> None:
+        if self.store is not None:
+            self.store.update(dt, self.view_rect)
+
+    def set_pathfinder(self, pathfinder) -> None:
+        """Grid pathfinder untuk collision tier kasar (dipanggil setelah map dimuat)."""
+        if self.store is not None:
+            self.store.set_pathfinder(pathfinder)
+
+    def update_flocking(self) -> None:
+        """Flocking batch dengan LOD; tanpa store flocking dihitung per enemy saat steer()."""
+        if self.store is not None:
+            self.store.update_flocking(get_clock().tick_count, self.view_rect)
@@ -3,12 +3,13 @@ Player Module
 Implementasi Player dengan PlayerStats untuk encapsulation.
 """
 import pygame
-from os.path import join
-from os import walk
 from settings import (
     PLAYER_MAX_HEALTH, PLAYER_BASE_DAMAGE, PLAYER_SPEED,
     EXP_BASE, EXP_MULTIPLIER, HEALTH_PER_LEVEL, DAMAGE_PER_LEVEL, SPEED_PER_LEVEL
 )
+from src.core.atlas import get_atlas
+from src.core.clock import get_ticks, schedule
+from src.core.spatial import nearby
 
 
 class PlayerStats:
@@ -161,21 +162,23 @@ class Player(pygame.sprite.Sprite):
         # Grafik
         self.load_images()
         self.state, self.frame_index = 'down', 0
-        self.image = pygame.image.load(join('images', 'player', 'down', '0.png')).convert_alpha()
+        self.image = self.frames['down'][0]
+        self.mask = self.masks['down'][0]
         self.rect = self.image.get_frect(center=pos)
         self.hitbox_rect = self.rect.inflate(-60, -90)
         
         # Movement
         self.direction = pygame.Vector2()
+        # Sumber input: None = keyboard, atau callable(player) -> (direction, use_skill) untuk input terskrip
+        self.controller = None
         
         # Timer invulnerability
         self.__is_invulnerable = False
-        self.__invulnerable_time = 0
         self.__invulnerable_duration = 500
         
         # Timer dash
         self.__is_dashing = False
-        self.__dash_time = 0
+        self.__dash_timer = None
         self.__dash_duration = 200
         self.__dash_speed = 0
         
@@ -197,19 +200,22 @@ class Player(pygame.sprite.Sprite):
         return self.__stats.base_damage * self.stat_modifiers['damage']
     
     def load_images(self):
-        """Load sprite animasi."""
-        self.frames = {'left': [], 'right': [], 'up': [], 'down': []}
-
-        for state in self.frames.keys():
-            for folder_path, sub_folders, file_names in walk(join('images', 'player', state)):
-                if file_names:
-                    for file_name in sorted(file_names, key=lambda name: int(name.split('.')[0])):
-                        full_path = join(folder_path, file_name)
-                        surf = pygame.image.load(full_path).convert_alpha()
-                        self.frames[state].append(surf)
+        """Load sprite animasi dari texture atlas beserta collision mask per frame."""
+        atlas = get_atlas()
+        self.frames = {state: atlas.frames(f'player/{state}') for state in ['left', 'right', 'up', 'down']}
+        self.masks = {state: [pygame.mask.from_surface(surf) for surf in frames] for state, frames in self.frames.items()}
 
     def input(self):
-        """Handle input keyboard."""
+        """Handle input keyboard (atau controller terskrip jika di-set)."""
+        if self.controller:
+            direction, use_skill = self.controller(self)
+            self.direction = pygame.Vector2(direction)
+            if self.direction:
+                self.direction = self.direction.normalize()
+            if use_skill and self.active_skill:
+                self.active_skill.activate()
+            return
+        
         keys = pygame.key.get_pressed()
         self.direction.x = int(keys[pygame.K_RIGHT] or keys[pygame.K_d]) - int(keys[pygame.K_LEFT] or keys[pygame.K_a])
         self.direction.y = int(keys[pygame.K_DOWN] or keys[pygame.K_s]) - int(keys[pygame.K_UP] or keys[pygame.K_w])
@@ -225,7 +231,7 @@ class Player(pygame.sprite.Sprite):
         if not self.__is_invulnerable:
             self.__stats.take_damage(damage)
             self.__is_invulnerable = True
-            self.__invulnerable_time = pygame.time.get_ticks()
+            schedule(self.__invulnerable_duration, self.__end_invulnerability)
     
     def heal(self, amount: int):
         """Heal player."""
@@ -239,8 +245,17 @@ class Player(pygame.sprite.Sprite):
         """Aktivasi dash."""
         self.__is_dashing = True
         self.__dash_speed = speed
-        self.__dash_time = pygame.time.get_ticks()
         self.__dash_duration = duration
+        # Dash baru memperpanjang dash yang sedang berjalan
+        if self.__dash_timer:
+            self.__dash_timer.cancel()
+        self.__dash_timer = schedule(duration, self.__end_dash)
+    
+    def __end_dash(self):
+        self.__is_dashing = False
+    
+    def __end_invulnerability(self):
+        self.__is_invulnerable = False
     
     def move(self, dt):
         """Movement dengan collision detection."""
@@ -265,7 +280,7 @@ class Player(pygame.sprite.Sprite):
 
     def collision(self, direction):
         """Handle collision dengan obstacle."""
-        for sprite in self.collision_sprites:
+        for sprite in nearby(self.collision_sprites, self.hitbox_rect):
             if sprite.rect.colliderect(self.hitbox_rect):
                 if direction == 'horizontal':
                     if self.direction.x > 0: self.hitbox_rect.right = sprite.rect.left
@@ -282,31 +297,20 @@ class Player(pygame.sprite.Sprite):
             self.state = 'down' if self.direction.y > 0 else 'up'
 
         self.frame_index = self.frame_index + 5 * dt if self.direction else 0
-        self.image = self.frames[self.state][int(self.frame_index) % len(self.frames[self.state])]
+        index = int(self.frame_index) % len(self.frames[self.state])
+        self.image = self.frames[self.state][index]
+        self.mask = self.masks[self.state][index]
         
         # Flash effect saat invulnerable
         if self.__is_invulnerable:
-            alpha = 128 if (pygame.time.get_ticks() // 100) % 2 == 0 else 255
+            alpha = 128 if (get_ticks() // 100) % 2 == 0 else 255
             self.image.set_alpha(alpha)
         else:
             self.image.set_alpha(255)
     
-    def update_timers(self):
-        """Update timer dash dan invulnerability."""
-        current_time = pygame.time.get_ticks()
-        
-        if self.__is_dashing:
-            if current_time - self.__dash_time >= self.__dash_duration:
-                self.__is_dashing = False
-        
-        if self.__is_invulnerable:
-            if current_time - self.__invulnerable_time >= self.__invulnerable_duration:
-                self.__is_invulnerable = False
-
     def update(self, dt):
         """Update player setiap frame."""
         if self.__stats.is_alive:
             self.input()
             self.move(dt)
             self.animate(dt)
-            self.update_timers()
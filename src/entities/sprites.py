@@ -15,6 +15,7 @@ class Sprite(pygame.sprite.Sprite):
         self.image = surf
         self.rect = self.image.get_frect(topleft = pos)
         self.ground = True
+        self.static = True
 
 
 class CollisionSprite(pygame.sprite.Sprite):
@@ -25,3 +26,4 @@ class CollisionSprite(pygame.sprite.Sprite):
         super().__init__(groups)
         self.image = surf
         self.rect = self.image.get_frect(topleft = pos)
+        self.static = True
@@ -4,6 +4,10 @@ Mengelola semua deteksi collision.
 """
 import pygame
 import random
+from src.core.spatial import nearby
+
+# Mask frame animasi bisa sedikit lebih besar dari rect sprite (boss 5x), query grid diperlebar
+MASK_MARGIN = 40
 
 
 class CollisionManager:
@@ -25,8 +29,9 @@ class CollisionManager:
         
         if bullet_sprites:
             for bullet in bullet_sprites:
+                candidates = nearby(enemy_sprites, bullet.rect.inflate(MASK_MARGIN * 2, MASK_MARGIN * 2))
                 collision_sprites = pygame.sprite.spritecollide(
-                    bullet, enemy_sprites, False, pygame.sprite.collide_mask
+                    bullet, candidates, False, pygame.sprite.collide_mask
                 )
                 
                 if collision_sprites:
@@ -63,8 +68,9 @@ class CollisionManager:
         Returns: True jika player kena damage.
         """
         if player.stats.is_alive:
+            candidates = nearby(enemy_sprites, player.rect.inflate(MASK_MARGIN * 2, MASK_MARGIN * 2))
             collided_enemies = pygame.sprite.spritecollide(
-                player, enemy_sprites, False, pygame.sprite.collide_mask
+                player, candidates, False, pygame.sprite.collide_mask
             )
             
             if collided_enemies:
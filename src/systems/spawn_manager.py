@@ -5,6 +5,8 @@ Mengelola spawn enemy dan boss.
 import pygame
 from random import choice, randint
 from settings import ENEMY_SPAWN_INTERVAL, ENEMY_SPAWN_DISTANCE
+from src.core.clock import get_ticks
+from src.core.spatial import nearby
 
 # Konstanta spawn
 BOSS_SPAWN_INTERVAL = 180  # Spawn boss setiap 180 detik (3 menit)
@@ -23,7 +25,7 @@ class SpawnManager:
         
         # Timer dan difficulty
         self.__spawn_interval = ENEMY_SPAWN_INTERVAL
-        self.__last_spawn_time = pygame.time.get_ticks()
+        self.__last_spawn_time = get_ticks()
         self.__difficulty_multiplier = 1.0
         self.__enemies_spawned = 0
         
@@ -58,7 +60,7 @@ class SpawnManager:
     
     def should_spawn(self) -> bool:
         """Cek apakah waktunya spawn enemy."""
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
         
         # Boss langsung spawn tanpa menunggu interval
         if self.__spawn_boss_next:
@@ -95,11 +97,7 @@ class SpawnManager:
                 
             # Cek collision
             dummy_rect = pygame.Rect(x - half_size, y - half_size, check_size, check_size)
-            collision = False
-            for sprite in collision_sprites:
-                if sprite.rect.colliderect(dummy_rect):
-                    collision = True
-                    break
+            collision = any(sprite.rect.colliderect(dummy_rect) for sprite in nearby(collision_sprites, dummy_rect))
             
             if not collision:
                 spawn_pos = pos
@@ -143,7 +141,7 @@ class SpawnManager:
     
     def reset(self) -> None:
         """Reset spawn manager ke kondisi awal."""
-        self.__last_spawn_time = pygame.time.get_ticks()
+        self.__last_spawn_time = get_ticks()
         self.__difficulty_multiplier = 1.0
         self.__enemies_spawned = 0
         self.__boss_wave_counter = 1
@@ -2,8 +2,8 @@
 Upgrade Manager Module
 Database upgrade, kartu level up, dan GameState.
 """
-import pygame
 import random
+from src.core.clock import get_ticks
 
 
 class GameState:
@@ -13,7 +13,7 @@ class GameState:
         self.__is_running = True
         self.__is_paused = False
         self.__is_game_over = False
-        self.__start_time = pygame.time.get_ticks()
+        self.__start_time = get_ticks()
         self.__game_over_time = 0
         self.__pause_time = 0
         self.__last_pause_start = 0
@@ -37,7 +37,7 @@ class GameState:
         if self.__is_game_over and self.__game_over_time > 0:
             return (self.__game_over_time - self.__start_time) / 1000
         else:
-            return (pygame.time.get_ticks() - self.__start_time) / 1000
+            return (get_ticks() - self.__start_time) / 1000
     
     @property
     def score(self) -> int:
@@ -51,10 +51,10 @@ class GameState:
         """Toggle status pause."""
         self.__is_paused = not self.__is_paused
         if self.__is_paused:
-            self.__last_pause_start = pygame.time.get_ticks()
+            self.__last_pause_start = get_ticks()
         else:
             if self.__last_pause_start > 0:
-                self.__pause_time += pygame.time.get_ticks() - self.__last_pause_start
+                self.__pause_time += get_ticks() - self.__last_pause_start
     
     def pause(self) -> None:
         """Set game ke pause."""
@@ -70,7 +70,7 @@ class GameState:
         """Set status game over."""
         if not self.__is_game_over:
             self.__is_game_over = True
-            self.__game_over_time = pygame.time.get_ticks()
+            self.__game_over_time = get_ticks()
     
     def calculate_score(self, player_stats) -> int:
         """Hitung skor: (kills * 100) + (level * 500) + (time * 10)"""
@@ -5,6 +5,8 @@ Komponen UI seperti Button, HealthBar, ExperienceBar, TextLabel, dan UpgradeCard
 import pygame
 import random
 from settings import WHITE, BLACK, RED, GREEN, YELLOW, BLUE, DARK_GRAY
+from src.core.atlas import get_atlas
+from .text import get_font, render_text, wrap_text
 
 
 class UIElement:
@@ -27,6 +29,11 @@ class UIElement:
     def visible(self) -> bool:
         return self.__visible
     
+    @property
+    def bounds(self) -> pygame.Rect:
+        """Area layar yang ditempati elemen."""
+        return pygame.Rect(self.__pos, self.__size)
+    
     def set_visible(self, visible: bool) -> None:
         self.__visible = visible
     
@@ -49,15 +56,10 @@ class HealthBar(UIElement):
         self.__max_health = max_health
         self.__current_health = max_health
         
-        # Load overlay image (cached) dan scale 2x
+        # Overlay image dari atlas (sudah di-scale 2x)
         if HealthBar._overlay_cache is None:
-            try:
-                from os.path import join
-                img = pygame.image.load(join('images', 'ui', 'healthoverlay.png')).convert_alpha()
-                orig_w, orig_h = img.get_size()
-                HealthBar._overlay_cache = pygame.transform.scale(img, (orig_w * 2, orig_h * 2))
-            except:
-                HealthBar._overlay_cache = None
+            frames = get_atlas().frames('ui/healthoverlay')
+            HealthBar._overlay_cache = frames[0] if frames else None
         
         self.__overlay = HealthBar._overlay_cache
         
@@ -67,6 +69,10 @@ class HealthBar(UIElement):
         self.__bar_height = 18
         self.__bar_offset_y = 0
     
+    @property
+    def bounds(self) -> pygame.Rect:
+        return pygame.Rect(self.pos, self.__overlay.get_size() if self.__overlay else self.size)
+    
     def update_health(self, current_health: int) -> None:
         self.__current_health = max(0, min(current_health, self.__max_health))
     
@@ -102,9 +108,8 @@ class HealthBar(UIElement):
             surface.blit(self.__overlay, (x, y))
             
             # Text di dalam bar
-            font = pygame.font.Font(None, 20)
             text = f"{self.__current_health}/{self.__max_health}"
-            text_surf = font.render(text, True, WHITE)
+            text_surf = render_text(text, 20, WHITE)
             text_rect = text_surf.get_rect(center=(x + self.__bar_offset_x + self.__bar_width // 2, 
                                                     y + overlay_height // 2))
             surface.blit(text_surf, text_rect)
@@ -129,15 +134,10 @@ class ExperienceBar(UIElement):
         self.__current_exp = 0
         self.__exp_to_next = 100
         
-        # Load overlay image (cached) dan scale 2x
+        # Overlay image dari atlas (sudah di-scale 2x)
         if ExperienceBar._overlay_cache is None:
-            try:
-                from os.path import join
-                img = pygame.image.load(join('images', 'ui', 'expoverlay.png')).convert_alpha()
-                orig_w, orig_h = img.get_size()
-                ExperienceBar._overlay_cache = pygame.transform.scale(img, (orig_w * 2, orig_h * 2))
-            except:
-                ExperienceBar._overlay_cache = None
+            frames = get_atlas().frames('ui/expoverlay')
+            ExperienceBar._overlay_cache = frames[0] if frames else None
         
         self.__overlay = ExperienceBar._overlay_cache
         
@@ -146,6 +146,10 @@ class ExperienceBar(UIElement):
         self.__bar_width = 224
         self.__bar_height = 18
     
+    @property
+    def bounds(self) -> pygame.Rect:
+        return pygame.Rect(self.pos, self.__overlay.get_size() if self.__overlay else self.size)
+    
     def update_exp(self, current_exp: int, exp_to_next: int) -> None:
         self.__current_exp = current_exp
         self.__exp_to_next = exp_to_next
@@ -169,9 +173,8 @@ class ExperienceBar(UIElement):
             surface.blit(self.__overlay, (x, y))
             
             # Text di dalam bar
-            font = pygame.font.Font(None, 20)
             text = f"{self.__current_exp}/{self.__exp_to_next}"
-            text_surf = font.render(text, True, WHITE)
+            text_surf = render_text(text, 20, WHITE)
             text_rect = text_surf.get_rect(center=(x + self.__bar_offset_x + self.__bar_width // 2, 
                                                     y + overlay_height // 2))
             surface.blit(text_surf, text_rect)
@@ -193,7 +196,10 @@ class TextLabel(UIElement):
         self.__text = text
         self.__font_size = font_size
         self.__color = color
-        self.__font = pygame.font.Font(None, font_size)
+    
+    @property
+    def bounds(self) -> pygame.Rect:
+        return render_text(self.__text, self.__font_size, self.__color).get_rect(topleft=self.pos)
     
     def set_text(self, text: str) -> None:
         self.__text = text
@@ -202,7 +208,7 @@ class TextLabel(UIElement):
         self.__color = color
     
     def _render(self, surface: pygame.Surface) -> None:
-        text_surf = self.__font.render(self.__text, True, self.__color)
+        text_surf = render_text(self.__text, self.__font_size, self.__color)
         surface.blit(text_surf, self.pos)
 
 
@@ -212,12 +218,10 @@ class Button:
     _button_image_cache = None
     
     def __init__(self, text, pos, width, height, font):
-        # Load image (cached)
+        # Image dari atlas (cached)
         if Button._button_image_cache is None:
-            try:
-                Button._button_image_cache = pygame.image.load('images/ui/button.png').convert_alpha()
-            except:
-                Button._button_image_cache = None
+            frames = get_atlas().frames('ui/button')
+            Button._button_image_cache = frames[0] if frames else None
         
         # Scale dengan aspect ratio
         if Button._button_image_cache:
@@ -231,28 +235,39 @@ class Button:
         
         self.rect = self.image.get_rect(center=pos)
         self.text = text
-        self.font = pygame.font.Font(None, 36)
+        self.font_size = 36
+        self.font = get_font(self.font_size)
         
         self.is_hovered = False
         self.text_color = (255, 229, 180)
         self.shadow_color = (0, 0, 0)
         self.outline_color = (255, 255, 255)
+        
+        # Pre-render dua frame: normal dan hover
+        self.__frames = (self.__build_frame(False), self.__build_frame(True))
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def __build_frame(self, hovered: bool) -> pygame.Surface:
+        """Render image, outline hover, dan teks ber-shadow ke satu surface."""
+        frame = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        frame.blit(self.image, (0, 0))
+        local_rect = frame.get_rect()
         
         # Outline saat hover
-        if self.is_hovered:
-            pygame.draw.rect(surface, self.outline_color, self.rect, 3)
+        if hovered:
+            pygame.draw.rect(frame, self.outline_color, local_rect, 3)
         
         # Text dengan shadow
-        shadow_surf = self.font.render(self.text, False, self.shadow_color)
-        shadow_rect = shadow_surf.get_frect(center=(self.rect.centerx + 2, self.rect.centery + 2))
-        surface.blit(shadow_surf, shadow_rect)
+        shadow_surf = render_text(self.text, self.font_size, self.shadow_color, False)
+        shadow_rect = shadow_surf.get_frect(center=(local_rect.centerx + 2, local_rect.centery + 2))
+        frame.blit(shadow_surf, shadow_rect)
         
-        text_surf = self.font.render(self.text, False, self.text_color)
-        text_rect = text_surf.get_frect(center=self.rect.center)
-        surface.blit(text_surf, text_rect)
+        text_surf = render_text(self.text, self.font_size, self.text_color, False)
+        text_rect = text_surf.get_frect(center=local_rect.center)
+        frame.blit(text_surf, text_rect)
+        return frame
+
+    def draw(self, surface):
+        surface.blit(self.__frames[self.is_hovered], self.rect)
 
     def check_hover(self, mouse_pos):
         self.is_hovered = self.rect.collidepoint(mouse_pos)
@@ -281,24 +296,25 @@ class UpgradeCardUI:
         self.matrix_green = (100, 255, 100)
         self.glitch_white = (255, 240, 220)
         
-        # Fonts
-        self.font_title = pygame.font.Font(None, 36)
-        self.font_desc = pygame.font.Font(None, 24)
-        self.font_label = pygame.font.Font(None, 28)
+        # Ukuran font (font dan render di-cache oleh modul text)
+        self.font_title = 36
+        self.font_desc = 24
+        self.font_label = 28
         
         # Animasi
         self.shake_offset = 0
         self.shake_timer = 0
         self.glow_intensity = 0
         self.noise_offset = 0
+        self.__frames = {}
         
-        # Noise pattern
-        random.seed(hash(self.card.name))
+        # Noise pattern: RNG sendiri per kartu (seed string deterministik, RNG global tidak disentuh)
+        self.__rng = random.Random(self.card.name)
         self.noise_pattern = []
         for _ in range(30):
-            x = random.randint(0, size[0])
-            y = random.randint(0, size[1])
-            size_noise = random.randint(1, 3)
+            x = self.__rng.randint(0, size[0])
+            y = self.__rng.randint(0, size[1])
+            size_noise = self.__rng.randint(1, 3)
             self.noise_pattern.append((x, y, size_noise))
     
     def check_hover(self, mouse_pos: tuple) -> bool:
@@ -314,7 +330,7 @@ class UpgradeCardUI:
         if self.is_hovered:
             self.shake_timer += 1
             if self.shake_timer % 3 == 0:
-                self.shake_offset = random.choice([-3, -2, -1, 0, 1, 2, 3])
+                self.shake_offset = self.__rng.choice([-3, -2, -1, 0, 1, 2, 3])
             self.glow_intensity = min(255, self.glow_intensity + 15)
         else:
             self.shake_offset = 0
@@ -326,26 +342,38 @@ class UpgradeCardUI:
         self.noise_offset += 1
     
     def draw(self, surface: pygame.Surface):
+        # Frame kartu di-cache per state hover, render ulang hanya jika noise bergerak
+        cached = self.__frames.get(self.is_hovered)
+        if cached is None or cached[0] != self.noise_offset:
+            cached = (self.noise_offset, self.__build_frame())
+            self.__frames[self.is_hovered] = cached
+        surface.blit(cached[1], self.rect)
+    
+    def __build_frame(self) -> pygame.Surface:
+        """Render seluruh kartu untuk state hover dan noise saat ini."""
+        surface = pygame.Surface(self.rect.size).convert()
+        card_rect = surface.get_rect()
+        
         # Background
-        pygame.draw.rect(surface, self.dark_red, self.rect)
+        pygame.draw.rect(surface, self.dark_red, card_rect)
         
         # Digital noise
         for i, (x, y, sz) in enumerate(self.noise_pattern):
             animated_offset = (self.noise_offset + i * 10) % 255
             noise_val = (animated_offset % 40)
             noise_color = (80 + noise_val, 10 + noise_val // 4, 10 + noise_val // 4)
-            pygame.draw.rect(surface, noise_color, (self.rect.left + x, self.rect.top + y, sz, sz))
+            pygame.draw.rect(surface, noise_color, (card_rect.left + x, card_rect.top + y, sz, sz))
         
         # Border
         border_color = self.fire_orange if self.is_hovered else self.blood_red
-        pygame.draw.rect(surface, border_color, self.rect, 5)
-        inner_rect = self.rect.inflate(-10, -10)
+        pygame.draw.rect(surface, border_color, card_rect, 5)
+        inner_rect = card_rect.inflate(-10, -10)
         pygame.draw.rect(surface, self.hell_black, inner_rect, 2)
         
         # Icon
         icon_size = 70
-        icon_x = self.rect.left + 20
-        icon_y = self.rect.centery - icon_size // 2
+        icon_x = card_rect.left + 20
+        icon_y = card_rect.centery - icon_size // 2
         icon_rect = pygame.Rect(icon_x, icon_y, icon_size, icon_size)
         pygame.draw.rect(surface, self.hell_black, icon_rect)
         inner_icon = icon_rect.inflate(-8, -8)
@@ -355,43 +383,29 @@ class UpgradeCardUI:
         # Label
         label_text = self.card.get_label()
         label_color = self.neon_yellow if self.card.is_new else self.matrix_green
-        label_surf = self.font_label.render(label_text, False, label_color)
-        label_rect = label_surf.get_frect(topright=(self.rect.right - 15, self.rect.top + 15))
+        label_surf = render_text(label_text, self.font_label, label_color, False)
+        label_rect = label_surf.get_frect(topright=(card_rect.right - 15, card_rect.top + 15))
         stamp_bg = label_rect.inflate(12, 8)
         pygame.draw.rect(surface, self.hell_black, stamp_bg)
         pygame.draw.rect(surface, label_color, stamp_bg, 2)
         surface.blit(label_surf, label_rect)
         
         # Title
-        title_x = self.rect.left + 105
-        title_y = self.rect.top + 30
-        shadow_title = self.font_title.render(self.card.name, False, (0, 0, 0))
+        title_x = card_rect.left + 105
+        title_y = card_rect.top + 30
+        shadow_title = render_text(self.card.name, self.font_title, (0, 0, 0), False)
         surface.blit(shadow_title, (title_x + 2, title_y + 2))
-        title_surf = self.font_title.render(self.card.name, False, self.glitch_white)
+        title_surf = render_text(self.card.name, self.font_title, self.glitch_white, False)
         surface.blit(title_surf, (title_x, title_y))
         
         # Description dengan word wrap
-        desc_x = self.rect.left + 105
-        desc_y = self.rect.top + 65
-        words = self.card.description.split(' ')
-        lines = []
-        current_line = []
-        max_width = self.rect.width - 115
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_surf = self.font_desc.render(test_line, False, (255, 255, 255))
-            if test_surf.get_width() <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-        if current_line:
-            lines.append(' '.join(current_line))
+        desc_x = card_rect.left + 105
+        desc_y = card_rect.top + 65
+        lines = wrap_text(self.card.description, self.font_desc, card_rect.width - 115)
         
         for i, line in enumerate(lines[:3]):
-            shadow_desc = self.font_desc.render(line, False, (0, 0, 0))
+            shadow_desc = render_text(line, self.font_desc, (0, 0, 0), False)
             surface.blit(shadow_desc, (desc_x + 1, desc_y + i * 25 + 1))
-            desc_surf = self.font_desc.render(line, False, (200, 180, 160))
+            desc_surf = render_text(line, self.font_desc, (200, 180, 160), False)
             surface.blit(desc_surf, (desc_x, desc_y + i * 25))
+        return surface
@@ -5,6 +5,9 @@ GameUI Overlay untuk tampilan gameplay.
 import pygame
 from settings import WINDOW_WIDTH, WINDOW_HEIGHT, PLAYER_MAX_HEALTH, WHITE, YELLOW, DARK_GRAY
 from .components import HealthBar, ExperienceBar, TextLabel
+from src.core.render import RenderQueue
+from src.core.atlas import get_atlas
+from .text import render_text
 
 
 class GameUI:
@@ -13,6 +16,23 @@ class GameUI:
     def __init__(self, display_surface: pygame.Surface):
         self.__display_surface = display_surface
         self.__ui_elements = []
+        self.__labels = []
+        
+        # HUD di-composite ke surface sendiri dan hanya di-render ulang saat ada nilai berubah
+        self.__surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        self.__render_queue = RenderQueue(self.__surface)
+        self.__values = {}
+        self.__dirty = True
+        # Area yang berubah sejak dirty_rects() terakhir
+        self.__changed_rects = []
+        
+        # Overlay icon skill dari atlas
+        frames = get_atlas().frames('ui/skillbutton')
+        self.__skill_overlay = frames[0] if frames else None
+        self.__skill_rect = pygame.Rect((10, 100), self.__skill_overlay.get_size() if self.__skill_overlay else (40, 40))
+        # Bar boss beserta label BOSS di atasnya
+        self.__boss_rect = pygame.Rect(200, WINDOW_HEIGHT - 50 - 35, WINDOW_WIDTH - 400, 25 + 35)
+        
         self.__setup_ui()
     
     def __setup_ui(self) -> None:
@@ -27,96 +47,123 @@ class GameUI:
         
         # Info di kanan atas
         self.__level_label = TextLabel((WINDOW_WIDTH - 150, 20), "Level: 1", 32, YELLOW)
-        self.__ui_elements.append(self.__level_label)
+        self.__labels.append(self.__level_label)
         
         self.__kill_label = TextLabel((WINDOW_WIDTH - 150, 60), "Kills: 0", 28, WHITE)
-        self.__ui_elements.append(self.__kill_label)
+        self.__labels.append(self.__kill_label)
         
         self.__time_label = TextLabel((WINDOW_WIDTH - 150, 95), "Time: 0:00", 28, WHITE)
-        self.__ui_elements.append(self.__time_label)
+        self.__labels.append(self.__time_label)
         
         self.__score_label = TextLabel((WINDOW_WIDTH - 150, 130), "Score: 0", 28, (0, 255, 0))
-        self.__ui_elements.append(self.__score_label)
+        self.__labels.append(self.__score_label)
+    
+    def __bind(self, key: str, value) -> bool:
+        """Simpan nilai yang ditampilkan HUD. Return True (dan tandai dirty) jika nilainya berubah."""
+        if self.__values.get(key, self) == value:
+            return False
+        self.__values[key] = value
+        self.__dirty = True
+        return True
+    
+    def __set_label(self, label: TextLabel, text: str) -> None:
+        """Ganti teks label, area teks lama dan baru ditandai berubah."""
+        self.__changed_rects.append(label.bounds)
+        label.set_text(text)
+        self.__changed_rects.append(label.bounds)
+    
+    def dirty_rects(self) -> list[pygame.Rect]:
+        """Area HUD yang berubah sejak panggilan terakhir (untuk dirty-rect present)."""
+        rects = self.__changed_rects
+        self.__changed_rects = []
+        return rects
     
     def update_player_stats(self, player_stats) -> None:
         """Update UI berdasarkan stats player."""
-        self.__health_bar.update_max_health(player_stats.max_health)
-        self.__health_bar.update_health(player_stats.current_health)
-        self.__exp_bar.update_exp(player_stats.current_exp, player_stats.exp_to_next_level)
-        self.__level_label.set_text(f"Level: {player_stats.level}")
-        self.__kill_label.set_text(f"Kills: {player_stats.kills}")
+        if self.__bind('health', (player_stats.current_health, player_stats.max_health)):
+            self.__health_bar.update_max_health(player_stats.max_health)
+            self.__health_bar.update_health(player_stats.current_health)
+            self.__changed_rects.append(self.__health_bar.bounds)
+        if self.__bind('exp', (player_stats.current_exp, player_stats.exp_to_next_level)):
+            self.__exp_bar.update_exp(player_stats.current_exp, player_stats.exp_to_next_level)
+            self.__changed_rects.append(self.__exp_bar.bounds)
+        if self.__bind('level', player_stats.level):
+            self.__set_label(self.__level_label, f"Level: {player_stats.level}")
+        if self.__bind('kills', player_stats.kills):
+            self.__set_label(self.__kill_label, f"Kills: {player_stats.kills}")
     
     def update_time(self, seconds: float) -> None:
-        """Update tampilan waktu."""
-        minutes = int(seconds // 60)
-        secs = int(seconds % 60)
-        self.__time_label.set_text(f"Time: {minutes}:{secs:02d}")
+        """Update tampilan waktu (hanya berubah per detik)."""
+        if self.__bind('time', int(seconds)):
+            minutes = int(seconds // 60)
+            secs = int(seconds % 60)
+            self.__set_label(self.__time_label, f"Time: {minutes}:{secs:02d}")
     
     def update_score(self, score: int) -> None:
         """Update tampilan skor."""
-        self.__score_label.set_text(f"Score: {score}")
-        
-    def draw_skill_icon(self, skill) -> None:
+        if self.__bind('score', score):
+            self.__set_label(self.__score_label, f"Score: {score}")
+    
+    def update_skill_icon(self, skill) -> None:
+        """Update state icon skill: teks countdown (bucket 0.1 detik) atau fase kedip Ready."""
+        if not skill:
+            state = None
+        elif skill.cooldown_progress < 1.0:
+            remaining_time = (skill.cooldown * (1 - skill.cooldown_progress)) / 1000
+            suffix = "s" if self.__skill_overlay else ""
+            state = ('cooldown', f"{remaining_time:.1f}{suffix}")
+        else:
+            state = ('ready', (pygame.time.get_ticks() // 400) % 2)
+        if self.__bind('skill', state):
+            self.__changed_rects.append(self.__skill_rect)
+    
+    def update_boss_health(self, boss_sprite) -> None:
+        """Update health bar boss (None jika tidak ada boss hidup)."""
+        if not boss_sprite or boss_sprite.health_percentage <= 0:
+            fill_width = None
+        else:
+            fill_width = int((WINDOW_WIDTH - 400) * boss_sprite.health_percentage)
+        if self.__bind('boss', fill_width):
+            self.__changed_rects.append(self.__boss_rect)
+    
+    def __render_skill_icon(self, surface: pygame.Surface, state) -> None:
         """Gambar icon skill dengan cooldown."""
-        if not skill: 
+        if not state:
             return
         
-        # Load overlay (cached)
-        if not hasattr(self, '_skill_overlay'):
-            try:
-                from os.path import join
-                self._skill_overlay = pygame.image.load(join('images', 'ui', 'skillbutton.png')).convert_alpha()
-            except:
-                self._skill_overlay = None
-        
+        kind, value = state
         x, y = 10, 100
         
-        if self._skill_overlay:
-            overlay_w, overlay_h = self._skill_overlay.get_size()
+        if self.__skill_overlay:
+            overlay_w, overlay_h = self.__skill_overlay.get_size()
             rect = pygame.Rect(x, y, overlay_w, overlay_h)
             
-            self.__display_surface.blit(self._skill_overlay, (x, y))
+            surface.blit(self.__skill_overlay, (x, y))
             
-            progress = skill.cooldown_progress
-            if progress < 1.0:
+            if kind == 'cooldown':
                 # Tampilkan countdown
-                remaining_time = (skill.cooldown * (1 - progress)) / 1000
-                timer_font = pygame.font.Font(None, 28)
-                timer_text = timer_font.render(f"{remaining_time:.1f}s", True, WHITE)
-                timer_rect = timer_text.get_rect(center=rect.center)
-                self.__display_surface.blit(timer_text, timer_rect)
-            else:
+                timer_text = render_text(value, 28, WHITE)
+                surface.blit(timer_text, timer_text.get_rect(center=rect.center))
+            elif value:
                 # Text Ready berkedip
-                pulse = (pygame.time.get_ticks() // 400) % 2
-                if pulse:
-                    ready_font = pygame.font.Font(None, 24)
-                    ready_text = ready_font.render("Ready", True, YELLOW)
-                    ready_rect = ready_text.get_rect(center=rect.center)
-                    self.__display_surface.blit(ready_text, ready_rect)
+                ready_text = render_text("Ready", 24, YELLOW)
+                surface.blit(ready_text, ready_text.get_rect(center=rect.center))
         else:
             # Fallback tanpa overlay
             size = 40
             rect = pygame.Rect(x, y, size, size)
-            pygame.draw.rect(self.__display_surface, DARK_GRAY, rect)
+            pygame.draw.rect(surface, DARK_GRAY, rect)
             
-            progress = skill.cooldown_progress
-            if progress < 1.0:
-                remaining_time = (skill.cooldown * (1 - progress)) / 1000
-                timer_font = pygame.font.Font(None, 24)
-                timer_text = timer_font.render(f"{remaining_time:.1f}", True, WHITE)
-                timer_rect = timer_text.get_rect(center=rect.center)
-                self.__display_surface.blit(timer_text, timer_rect)
-            else:
-                pulse = (pygame.time.get_ticks() // 400) % 2
-                if pulse:
-                    ready_font = pygame.font.Font(None, 18)
-                    ready_text = ready_font.render("Ready", True, YELLOW)
-                    ready_rect = ready_text.get_rect(center=rect.center)
-                    self.__display_surface.blit(ready_text, ready_rect)
+            if kind == 'cooldown':
+                timer_text = render_text(value, 24, WHITE)
+                surface.blit(timer_text, timer_text.get_rect(center=rect.center))
+            elif value:
+                ready_text = render_text("Ready", 18, YELLOW)
+                surface.blit(ready_text, ready_text.get_rect(center=rect.center))
     
-    def draw_boss_health(self, boss_sprite) -> None:
+    def __render_boss_health(self, surface: pygame.Surface, fill_width) -> None:
         """Gambar health bar boss di bawah layar."""
-        if not boss_sprite or boss_sprite.health_percentage <= 0:
+        if fill_width is None:
             return
 
         bar_width = WINDOW_WIDTH - 400
@@ -125,22 +172,38 @@ class GameUI:
         y = WINDOW_HEIGHT - 50
         
         # Background
-        pygame.draw.rect(self.__display_surface, DARK_GRAY, (x, y, bar_width, bar_height), border_radius=5)
+        pygame.draw.rect(surface, DARK_GRAY, (x, y, bar_width, bar_height), border_radius=5)
         
         # Health fill
-        fill_width = int(bar_width * boss_sprite.health_percentage)
-        pygame.draw.rect(self.__display_surface, (200, 0, 0), (x, y, fill_width, bar_height), border_radius=5)
+        pygame.draw.rect(surface, (200, 0, 0), (x, y, fill_width, bar_height), border_radius=5)
         
         # Border
-        pygame.draw.rect(self.__display_surface, YELLOW, (x, y, bar_width, bar_height), 2, border_radius=5)
+        pygame.draw.rect(surface, YELLOW, (x, y, bar_width, bar_height), 2, border_radius=5)
         
         # Label BOSS
-        font = pygame.font.Font(None, 30)
-        text = font.render("BOSS", True, YELLOW)
+        text = render_text("BOSS", 30, YELLOW)
         text_rect = text.get_rect(center=(x + bar_width // 2, y - 15))
-        self.__display_surface.blit(text, text_rect)
+        surface.blit(text, text_rect)
+    
+    def __render(self) -> None:
+        """Render ulang semua elemen HUD ke surface cache."""
+        surface = self.__surface
+        surface.fill((0, 0, 0, 0))
+        
+        for element in self.__ui_elements:
+            element.draw(surface)
+        
+        # Label hanya blit teks, jadi di-batch dalam satu submit
+        for label in self.__labels:
+            label.draw(self.__render_queue)
+        self.__render_queue.flush()
+        
+        self.__render_boss_health(surface, self.__values.get('boss'))
+        self.__render_skill_icon(surface, self.__values.get('skill'))
+        self.__dirty = False
 
     def draw(self) -> None:
-        """Gambar semua elemen UI."""
-        for element in self.__ui_elements:
-            element.draw(self.__display_surface)
\ No newline at end of file
+        """Gambar HUD: render ulang hanya jika ada nilai yang berubah, lalu satu blit ke layar."""
+        if self.__dirty:
+            self.__render()
+        self.__display_surface.blit(self.__surface, (0, 0))
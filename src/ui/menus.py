@@ -7,40 +7,45 @@ import math
 from os.path import join
 from settings import WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, RED, YELLOW, BLACK
 from .components import Button, UpgradeCardUI
+from src.core.render import RenderQueue
+from src.core.atlas import get_atlas
+from .text import render_text
 
 
 class MainMenu:
     """Main Menu dengan tema neraka."""
     
+    # Jumlah frame pre-render untuk satu periode animasi pulse logo
+    PULSE_FRAMES = 32
+    
     def __init__(self, display_surface, score_manager=None):
         self.display_surface = display_surface
         self.score_manager = score_manager
 
-        # Load fonts
-        try:
-            self.font_button = pygame.font.Font(None, 40)
-            self.font_subtitle = pygame.font.Font(None, 24)
-            self.font_score = pygame.font.Font(None, 36)
-        except:
-            self.font_button = pygame.font.SysFont(None, 40)
-            self.font_subtitle = pygame.font.SysFont(None, 24)
-            self.font_score = pygame.font.SysFont(None, 36)
-        
-        # Load logo
-        self.logo = None
-        try:
-            logo_path = join('images', 'ui', 'inforhell.png')
-            self.logo = pygame.image.load(logo_path).convert_alpha()
-            logo_size = 450
-            self.logo = pygame.transform.scale(self.logo, (logo_size, logo_size))
-            
+        # Ukuran font (font dan render di-cache oleh modul text)
+        self.font_button = 40
+        self.font_subtitle = 24
+        self.font_score = 36
+        
+        # Logo dari atlas (sudah di-scale 450x450)
+        logo_frames = get_atlas().frames('ui/inforhell')
+        if logo_frames:
+            self.logo = logo_frames[0]
             self.logo_original = self.logo
             mask = pygame.mask.from_surface(self.logo)
             self.logo_shadow = mask.to_surface(setcolor=(240, 150, 55), unsetcolor=(0,0,0,0))
-        except:
+        else:
             self.logo = None
             self.logo_original = None
             self.logo_shadow = None
+        self.logo_frames = self.__build_logo_frames() if self.logo_original else []
+        # Area terbesar yang bisa ditempati logo selama pulse
+        self.__logo_rect = pygame.Rect(0, 0, 0, 0)
+        if self.logo_frames:
+            max_w = max(frame.get_width() for frame in self.logo_frames)
+            max_h = max(frame.get_height() for frame in self.logo_frames)
+            self.__logo_rect = pygame.Rect(0, 0, max_w, max_h)
+            self.__logo_rect.center = (WINDOW_WIDTH // 2, 50 + self.logo_original.get_height() // 2)
 
         # Load background
         self.background = None
@@ -59,59 +64,82 @@ class MainMenu:
         self.btn_exit = Button("EXIT", (cx, cy + 200), 200, 50, self.font_button)
         
         self.show_leaderboard = False
+        # Layer leaderboard di-render sekali saat dibuka
+        self.__leaderboard_layer = None
+        self.__presented_view = None
+
+    @property
+    def idle_fps(self) -> int:
+        """FPS yang dibutuhkan tanpa input: cukup untuk frame pulse logo, 0 untuk leaderboard (statis)."""
+        if self.show_leaderboard or not self.logo_frames:
+            return 0
+        return math.ceil(self.PULSE_FRAMES * 3 / (2 * math.pi))
+
+    def dirty_rects(self):
+        """Area yang bisa berubah tanpa ganti tampilan. None jika seluruh layar perlu di-present."""
+        if self.__presented_view != self.show_leaderboard:
+            self.__presented_view = self.show_leaderboard
+            return None
+        if self.show_leaderboard:
+            return []
+        return [self.__logo_rect, self.btn_start.rect, self.btn_leaderboard.rect, self.btn_exit.rect]
+
+    def __build_logo_frames(self) -> list[pygame.Surface]:
+        """Pre-render logo + outline 8 arah untuk setiap fase pulse (frame dengan ukuran sama di-share)."""
+        offsets = [(-3, -3), (0, -3), (3, -3), (-3, 0), (3, 0), (-3, 3), (0, 3), (3, 3)]
+        orig_w, orig_h = self.logo_original.get_size()
+        by_size = {}
+        frames = []
+        for i in range(self.PULSE_FRAMES):
+            scale = 1.0 + 0.05 * math.sin(2 * math.pi * i / self.PULSE_FRAMES)
+            size = (int(orig_w * scale), int(orig_h * scale))
+            if size not in by_size:
+                logo_surf = pygame.transform.scale(self.logo_original, size)
+                shadow_surf = pygame.transform.scale(self.logo_shadow, size)
+                frame = pygame.Surface((size[0] + 6, size[1] + 6), pygame.SRCALPHA)
+                for dx, dy in offsets:
+                    frame.blit(shadow_surf, (3 + dx, 3 + dy))
+                frame.blit(logo_surf, (3, 3))
+                by_size[size] = frame
+            frames.append(by_size[size])
+        return frames
 
     def draw(self):
-        # Background
-        if self.background:
-            self.display_surface.blit(self.background, (0, 0))
-        else:
-            self.display_surface.fill((15, 5, 5))
+        if self.show_leaderboard:
+            if self.__leaderboard_layer is None:
+                self.__leaderboard_layer = self.__build_leaderboard_layer()
+            self.display_surface.blit(self.__leaderboard_layer, (0, 0))
+            return
         
-        if not self.show_leaderboard:
-            # Logo dengan animasi pulsing
-            if self.logo_original:
-                time_now = pygame.time.get_ticks()
-                pulse = math.sin(time_now * 0.003)
-                scale = 1.0 + 0.05 * pulse
-                
-                orig_rect = self.logo_original.get_rect()
-                new_w = int(orig_rect.width * scale)
-                new_h = int(orig_rect.height * scale)
-                
-                logo_surf = pygame.transform.scale(self.logo_original, (new_w, new_h))
-                shadow_surf = pygame.transform.scale(self.logo_shadow, (new_w, new_h))
-                
-                center_x = WINDOW_WIDTH // 2
-                center_y = 50 + orig_rect.height // 2
-                logo_rect = logo_surf.get_rect(center=(center_x, center_y))
-                
-                # Outline 8 arah
-                offsets = [(-3, -3), (0, -3), (3, -3), (-3, 0), (3, 0), (-3, 3), (0, 3), (3, 3)]
-                for dx, dy in offsets:
-                    outline_rect = logo_rect.copy()
-                    outline_rect.x += dx
-                    outline_rect.y += dy
-                    self.display_surface.blit(shadow_surf, outline_rect)
-                
-                self.display_surface.blit(logo_surf, logo_rect)
+        self.__draw_background(self.display_surface)
+        
+        # Logo dengan animasi pulsing (frame sudah di-pre-render)
+        if self.logo_frames:
+            phase = (pygame.time.get_ticks() * 0.003 / (2 * math.pi)) % 1.0
+            logo_surf = self.logo_frames[int(phase * self.PULSE_FRAMES) % self.PULSE_FRAMES]
+            center_y = 50 + self.logo_original.get_height() // 2
+            self.display_surface.blit(logo_surf, logo_surf.get_rect(center=(WINDOW_WIDTH // 2, center_y)))
 
-            # Buttons
-            self.btn_start.draw(self.display_surface)
-            self.btn_leaderboard.draw(self.display_surface)
-            self.btn_exit.draw(self.display_surface)
+        # Buttons
+        self.btn_start.draw(self.display_surface)
+        self.btn_leaderboard.draw(self.display_surface)
+        self.btn_exit.draw(self.display_surface)
+
+    def __draw_background(self, surface: pygame.Surface) -> None:
+        if self.background:
+            surface.blit(self.background, (0, 0))
         else:
-            self._draw_leaderboard()
+            surface.fill((15, 5, 5))
 
-    def _draw_leaderboard(self):
-        """Draw leaderboard dengan top 5 + player rank."""
-        try:
-            title_font = pygame.font.Font(join('data', 'fonts', 'Oxanium-Bold.ttf'), 70)
-        except:
-            title_font = pygame.font.SysFont(None, 70)
+    def __build_leaderboard_layer(self) -> pygame.Surface:
+        """Render background dan leaderboard (top 5 + player rank) ke satu surface."""
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self.__draw_background(layer)
+        render_queue = RenderQueue(layer)
         
-        title_surf = title_font.render("LEADERBOARD", True, (255, 150, 0))
+        title_surf = render_text("LEADERBOARD", 70, (255, 150, 0), face=join('data', 'fonts', 'Oxanium-Bold.ttf'))
         title_rect = title_surf.get_frect(center=(WINDOW_WIDTH // 2, 80))
-        self.display_surface.blit(title_surf, title_rect)
+        render_queue.blit(title_surf, title_rect)
         
         if self.score_manager:
             top_scores = self.score_manager.get_leaderboard(5)
@@ -124,16 +152,16 @@ class MainMenu:
         y_spacing = 55
         
         # Header
-        header_surf = self.font_subtitle.render("RANK    NAME    SCORE", True, (150, 120, 100))
+        header_surf = render_text("RANK    NAME    SCORE", self.font_subtitle, (150, 120, 100), True)
         header_rect = header_surf.get_frect(center=(WINDOW_WIDTH // 2, y_start))
-        self.display_surface.blit(header_surf, header_rect)
+        render_queue.blit(header_surf, header_rect)
         
         y_offset = y_start + 40
         
         if not top_scores:
-            empty_surf = self.font_score.render("No scores yet!", True, (100, 80, 60))
+            empty_surf = render_text("No scores yet!", self.font_score, (100, 80, 60), True)
             empty_rect = empty_surf.get_frect(center=(WINDOW_WIDTH // 2, y_offset + 60))
-            self.display_surface.blit(empty_surf, empty_rect)
+            render_queue.blit(empty_surf, empty_rect)
         else:
             for entry in top_scores:
                 # Warna: gold, silver, bronze
@@ -152,38 +180,40 @@ class MainMenu:
                                   entry['name'] == last_player['name'])
                 if is_last_player:
                     highlight_rect = pygame.Rect(WINDOW_WIDTH // 2 - 200, y_offset - 15, 400, 45)
-                    pygame.draw.rect(self.display_surface, (80, 40, 20), highlight_rect)
-                    pygame.draw.rect(self.display_surface, (255, 150, 0), highlight_rect, 2)
+                    pygame.draw.rect(layer, (80, 40, 20), highlight_rect)
+                    pygame.draw.rect(layer, (255, 150, 0), highlight_rect, 2)
                 
                 score_text = f"{entry['rank']:2d}.  {entry['name']}  -  {entry['score']:,}"
-                score_surf = self.font_score.render(score_text, True, color)
+                score_surf = render_text(score_text, self.font_score, color, True)
                 score_rect = score_surf.get_frect(center=(WINDOW_WIDTH // 2, y_offset))
-                self.display_surface.blit(score_surf, score_rect)
+                render_queue.blit(score_surf, score_rect)
                 
                 y_offset += y_spacing
             
             # Player rank jika di luar top 5
             if last_player and last_player['rank'] > 5:
                 y_offset += 10
-                dots_surf = self.font_score.render(". . .", True, (100, 80, 60))
+                dots_surf = render_text(". . .", self.font_score, (100, 80, 60), True)
                 dots_rect = dots_surf.get_frect(center=(WINDOW_WIDTH // 2, y_offset))
-                self.display_surface.blit(dots_surf, dots_rect)
+                render_queue.blit(dots_surf, dots_rect)
                 
                 y_offset += y_spacing
                 
                 highlight_rect = pygame.Rect(WINDOW_WIDTH // 2 - 200, y_offset - 15, 400, 45)
-                pygame.draw.rect(self.display_surface, (80, 40, 20), highlight_rect)
-                pygame.draw.rect(self.display_surface, (255, 150, 0), highlight_rect, 2)
+                pygame.draw.rect(layer, (80, 40, 20), highlight_rect)
+                pygame.draw.rect(layer, (255, 150, 0), highlight_rect, 2)
                 
                 player_text = f"{last_player['rank']:2d}.  {last_player['name']}  -  {last_player['score']:,}"
-                player_surf = self.font_score.render(player_text, True, (255, 200, 100))
+                player_surf = render_text(player_text, self.font_score, (255, 200, 100), True)
                 player_rect = player_surf.get_frect(center=(WINDOW_WIDTH // 2, y_offset))
-                self.display_surface.blit(player_surf, player_rect)
+                render_queue.blit(player_surf, player_rect)
         
         # Back instruction
-        back_surf = self.font_button.render("[ ESC to Back ]", True, (150, 100, 80))
+        back_surf = render_text("[ ESC to Back ]", self.font_button, (150, 100, 80), True)
         back_rect = back_surf.get_frect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 60))
-        self.display_surface.blit(back_surf, back_rect)
+        render_queue.blit(back_surf, back_rect)
+        render_queue.flush()
+        return layer
 
     def update(self, event_list):
         mouse_pos = pygame.mouse.get_pos()
@@ -201,12 +231,17 @@ class MainMenu:
             for event in event_list:
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     self.show_leaderboard = False
+                    # Skor baru tampil saat leaderboard dibuka lagi
+                    self.__leaderboard_layer = None
         return None
 
 
 class NameInputScreen:
     """Screen untuk input 3-letter name setelah game over."""
     
+    # Warna dim untuk backdrop frame gameplay yang dibekukan
+    BACKDROP_DIM = (30, 15, 15, 220)
+    
     def __init__(self, display_surface: pygame.Surface):
         self.__display_surface = display_surface
         self.__active = False
@@ -215,14 +250,20 @@ class NameInputScreen:
         self.__final_score = 0
         self.__final_stats = {}
         
-        self.__font_title = pygame.font.Font(None, 64)
-        self.__font_letter = pygame.font.Font(None, 100)
-        self.__font_info = pygame.font.Font(None, 36)
-        self.__font_hint = pygame.font.Font(None, 28)
+        self.__font_title = 64
+        self.__font_letter = 100
+        self.__font_info = 36
+        self.__font_hint = 28
         
         self.__selected_color = (255, 200, 50)
         self.__unselected_color = (150, 130, 110)
-        self.__bg_color = (30, 15, 15)
+        
+        # Layer di-render ulang hanya saat input berubah
+        self.__layer = None
+        
+        # Area kotak huruf + panah, satu-satunya bagian yang berubah karena input
+        total_width = 100 * 3 + 30 * 2
+        self.__input_rect = pygame.Rect(WINDOW_WIDTH // 2 - total_width // 2, WINDOW_HEIGHT // 2 - 50 - 25, total_width, 100 + 50)
     
     def show(self, score: int, stats: dict) -> None:
         """Tampilkan layar input nama."""
@@ -231,6 +272,7 @@ class NameInputScreen:
         self.__current_index = 0
         self.__final_score = score
         self.__final_stats = stats
+        self.__layer = None
     
     def hide(self) -> None:
         self.__active = False
@@ -239,6 +281,14 @@ class NameInputScreen:
     def is_active(self) -> bool:
         return self.__active
     
+    @property
+    def idle_fps(self) -> int:
+        """Layar statis, hanya berubah karena input."""
+        return 0
+    
+    def dirty_rects(self) -> list[pygame.Rect]:
+        return [self.__input_rect]
+    
     def get_name(self) -> str:
         return ''.join(self.__letters)
     
@@ -249,28 +299,30 @@ class NameInputScreen:
         if not self.__active:
             return
         
-        # Overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(220)
-        overlay.fill(self.__bg_color)
-        self.__display_surface.blit(overlay, (0, 0))
+        if self.__layer is None:
+            self.__layer = self.__build_layer()
+        self.__display_surface.blit(self.__layer, (0, 0))
+    
+    def __build_layer(self) -> pygame.Surface:
+        """Render info skor dan kotak huruf ke satu surface (dim ada di backdrop)."""
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
         
         # Title
-        title_text = self.__font_title.render("ENTER YOUR NAME", False, (255, 150, 0))
+        title_text = render_text("ENTER YOUR NAME", self.__font_title, (255, 150, 0), False)
         title_rect = title_text.get_frect(center=(WINDOW_WIDTH // 2, 120))
-        self.__display_surface.blit(title_text, title_rect)
+        layer.blit(title_text, title_rect)
         
         # Score
-        score_text = self.__font_info.render(f"Final Score: {self.__final_score:,}", False, WHITE)
+        score_text = render_text(f"Final Score: {self.__final_score:,}", self.__font_info, WHITE, False)
         score_rect = score_text.get_frect(center=(WINDOW_WIDTH // 2, 180))
-        self.__display_surface.blit(score_text, score_rect)
+        layer.blit(score_text, score_rect)
         
         # Stats
         if self.__final_stats:
             stats_text = f"Level {self.__final_stats.get('level', 1)} | {self.__final_stats.get('kills', 0)} Kills | {self.__final_stats.get('time', '0:00')}"
-            stats_surf = self.__font_hint.render(stats_text, False, (150, 130, 110))
+            stats_surf = render_text(stats_text, self.__font_hint, (150, 130, 110), False)
             stats_rect = stats_surf.get_frect(center=(WINDOW_WIDTH // 2, 220))
-            self.__display_surface.blit(stats_surf, stats_rect)
+            layer.blit(stats_surf, stats_rect)
         
         # Letter boxes
         box_size = 100
@@ -290,12 +342,12 @@ class NameInputScreen:
                 box_color = self.__unselected_color
                 border_width = 2
             
-            pygame.draw.rect(self.__display_surface, (40, 20, 20), box_rect)
-            pygame.draw.rect(self.__display_surface, box_color, box_rect, border_width)
+            pygame.draw.rect(layer, (40, 20, 20), box_rect)
+            pygame.draw.rect(layer, box_color, box_rect, border_width)
             
-            letter_surf = self.__font_letter.render(letter, False, box_color)
+            letter_surf = render_text(letter, self.__font_letter, box_color, False)
             letter_rect = letter_surf.get_frect(center=box_rect.center)
-            self.__display_surface.blit(letter_surf, letter_rect)
+            layer.blit(letter_surf, letter_rect)
             
             # Arrows untuk selected box
             if i == self.__current_index:
@@ -305,19 +357,20 @@ class NameInputScreen:
                     (box_rect.centerx - 15, box_rect.top - 5),
                     (box_rect.centerx + 15, box_rect.top - 5)
                 ]
-                pygame.draw.polygon(self.__display_surface, arrow_color, up_points)
+                pygame.draw.polygon(layer, arrow_color, up_points)
                 
                 down_points = [
                     (box_rect.centerx, box_rect.bottom + 20),
                     (box_rect.centerx - 15, box_rect.bottom + 5),
                     (box_rect.centerx + 15, box_rect.bottom + 5)
                 ]
-                pygame.draw.polygon(self.__display_surface, arrow_color, down_points)
+                pygame.draw.polygon(layer, arrow_color, down_points)
         
         # Instructions
-        hint1 = self.__font_hint.render("↑↓ Change Letter  |  ←→ Move  |  ENTER Confirm", False, (120, 100, 80))
+        hint1 = render_text("↑↓ Change Letter  |  ←→ Move  |  ENTER Confirm", self.__font_hint, (120, 100, 80), False)
         hint1_rect = hint1.get_frect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 100))
-        self.__display_surface.blit(hint1, hint1_rect)
+        layer.blit(hint1, hint1_rect)
+        return layer
     
     def update(self, event_list):
         """Handle input untuk name entry."""
@@ -326,6 +379,7 @@ class NameInputScreen:
         
         for event in event_list:
             if event.type == pygame.KEYDOWN:
+                self.__layer = None
                 if event.key == pygame.K_LEFT:
                     self.__current_index = max(0, self.__current_index - 1)
                 elif event.key == pygame.K_RIGHT:
@@ -356,17 +410,14 @@ class NameInputScreen:
 class PauseMenu:
     """Pause Menu dengan warning tooltip."""
     
+    BACKDROP_DIM = (0, 0, 0, 128)
+    
     def __init__(self, display_surface: pygame.Surface):
         self.__display_surface = display_surface
         
-        try:
-            self.font_title = pygame.font.Font(None, 80)
-            self.font_button = pygame.font.Font(None, 36)
-            self.font_warning = pygame.font.Font(None, 24)
-        except:
-            self.font_title = pygame.font.SysFont(None, 80)
-            self.font_button = pygame.font.SysFont(None, 36)
-            self.font_warning = pygame.font.SysFont(None, 24)
+        self.font_title = 80
+        self.font_button = 36
+        self.font_warning = 24
         
         cx, cy = WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2
         self.btn_continue = Button("CONTINUE", (cx, cy), 200, 50, self.font_button)
@@ -375,22 +426,51 @@ class PauseMenu:
         self.__show_warning = False
         self.__warning_text = "Progress tidak akan di save"
         self.__warning_color = (255, 80, 80)
+        
+        # Layer statis di-render sekali
+        self.__layer = self.__build_layer()
+        self.__warning_surf, self.__warning_pos = self.__build_warning()
     
-    def draw(self):
-        # Overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.__display_surface.blit(overlay, (0, 0))
-        
-        # Title dengan shadow
-        paused_text = self.font_title.render("PAUSED", False, (255, 229, 180))
+    @property
+    def idle_fps(self) -> int:
+        """Layar statis, hover hanya berubah karena input mouse."""
+        return 0
+    
+    def dirty_rects(self) -> list[pygame.Rect]:
+        warning_rect = self.__warning_surf.get_rect(topleft=self.__warning_pos)
+        return [self.btn_continue.rect, self.btn_main_menu.rect, warning_rect]
+    
+    def __build_layer(self) -> pygame.Surface:
+        """Judul PAUSED dengan shadow."""
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        
+        paused_text = render_text("PAUSED", self.font_title, (255, 229, 180), False)
         paused_rect = paused_text.get_frect(center=(WINDOW_WIDTH // 2, 150))
         
-        shadow_text = self.font_title.render("PAUSED", False, (0, 0, 0))
+        shadow_text = render_text("PAUSED", self.font_title, (0, 0, 0), False)
         shadow_rect = shadow_text.get_frect(center=(WINDOW_WIDTH // 2 + 3, 150 + 3))
-        self.__display_surface.blit(shadow_text, shadow_rect)
-        self.__display_surface.blit(paused_text, paused_rect)
+        layer.blit(shadow_text, shadow_rect)
+        layer.blit(paused_text, paused_rect)
+        return layer
+    
+    def __build_warning(self) -> tuple[pygame.Surface, tuple]:
+        """Tooltip warning (box, border, teks) beserta posisinya di layar."""
+        warning_x = WINDOW_WIDTH // 2
+        warning_y = self.btn_main_menu.rect.bottom + 20
+        
+        warning_surf_text = render_text(self.__warning_text, self.font_warning, self.__warning_color, False)
+        warning_rect = warning_surf_text.get_rect(center=(warning_x, warning_y))
+        
+        box_padding = 10
+        box_rect = warning_rect.inflate(box_padding * 2, box_padding * 2)
+        box_surf = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
+        box_surf.fill((80, 0, 0, 180))
+        pygame.draw.rect(box_surf, self.__warning_color, box_surf.get_rect(), 2)
+        box_surf.blit(warning_surf_text, (box_padding, box_padding))
+        return box_surf, box_rect.topleft
+    
+    def draw(self):
+        self.__display_surface.blit(self.__layer, (0, 0))
         
         # Buttons
         self.btn_continue.draw(self.__display_surface)
@@ -398,20 +478,7 @@ class PauseMenu:
         
         # Warning tooltip
         if self.__show_warning:
-            warning_x = WINDOW_WIDTH // 2
-            warning_y = self.btn_main_menu.rect.bottom + 20
-            
-            warning_surf_text = self.font_warning.render(self.__warning_text, False, self.__warning_color)
-            warning_rect = warning_surf_text.get_rect(center=(warning_x, warning_y))
-            
-            box_padding = 10
-            box_rect = warning_rect.inflate(box_padding * 2, box_padding * 2)
-            box_surf = pygame.Surface((box_rect.width, box_rect.height), pygame.SRCALPHA)
-            box_surf.fill((80, 0, 0, 180))
-            self.__display_surface.blit(box_surf, box_rect.topleft)
-            
-            pygame.draw.rect(self.__display_surface, self.__warning_color, box_rect, 2)
-            self.__display_surface.blit(warning_surf_text, warning_rect)
+            self.__display_surface.blit(self.__warning_surf, self.__warning_pos)
     
     def update(self, event_list) -> str:
         mouse_pos = pygame.mouse.get_pos()
@@ -438,23 +505,42 @@ class PauseMenu:
 class GameOverScreen:
     """Layar Game Over dengan statistik."""
     
+    BACKDROP_DIM = (*BLACK, 200)
+    
     def __init__(self, display_surface: pygame.Surface):
         self.__display_surface = display_surface
-        self.__font_large = pygame.font.Font(None, 72)
-        self.__font_medium = pygame.font.Font(None, 48)
-        self.__font_small = pygame.font.Font(None, 32)
+        self.__font_large = 72
+        self.__font_medium = 48
+        self.__font_small = 32
+        
+        # Layer di-render ulang hanya jika statistik berubah
+        self.__layer = None
+        self.__layer_stats = None
+    
+    @property
+    def idle_fps(self) -> int:
+        """Layar statis."""
+        return 0
+    
+    def dirty_rects(self) -> list[pygame.Rect]:
+        return []
     
     def draw(self, final_stats: dict) -> None:
-        # Overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.__display_surface.blit(overlay, (0, 0))
+        stats_key = tuple(final_stats.items())
+        if stats_key != self.__layer_stats:
+            self.__layer = self.__build_layer(final_stats)
+            self.__layer_stats = stats_key
+        self.__display_surface.blit(self.__layer, (0, 0))
+    
+    def __build_layer(self, final_stats: dict) -> pygame.Surface:
+        """Render judul, statistik, dan instruksi ke satu surface."""
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        render_queue = RenderQueue(layer)
         
         # Title
-        game_over_text = self.__font_large.render("GAME OVER", True, RED)
+        game_over_text = render_text("GAME OVER", self.__font_large, RED, True)
         game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, 150))
-        self.__display_surface.blit(game_over_text, game_over_rect)
+        render_queue.blit(game_over_text, game_over_rect)
         
         # Stats
         y_offset = 250
@@ -466,15 +552,17 @@ class GameOverScreen:
         ]
         
         for stat_text in stats_to_show:
-            stat_surf = self.__font_medium.render(stat_text, True, WHITE)
+            stat_surf = render_text(stat_text, self.__font_medium, WHITE, True)
             stat_rect = stat_surf.get_rect(center=(WINDOW_WIDTH // 2, y_offset))
-            self.__display_surface.blit(stat_surf, stat_rect)
+            render_queue.blit(stat_surf, stat_rect)
             y_offset += 60
         
         # Instruction
-        restart_text = self.__font_small.render("Press R to Restart or ESC to Quit", True, YELLOW)
+        restart_text = render_text("Press R to Restart or ESC to Quit", self.__font_small, YELLOW, True)
         restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 100))
-        self.__display_surface.blit(restart_text, restart_rect)
+        render_queue.blit(restart_text, restart_rect)
+        render_queue.flush()
+        return layer
 
 
 class LevelUpNotification:
@@ -484,7 +572,12 @@ class LevelUpNotification:
         self.__active = False
         self.__start_time = 0
         self.__duration = 2000
-        self.__font = pygame.font.Font(None, 64)
+        self.__font = 64
+        self.__rect = None
+    
+    def dirty_rects(self) -> list[pygame.Rect]:
+        """Area teks notifikasi (fade alpha berubah setiap frame selama aktif)."""
+        return [self.__rect] if self.__active and self.__rect else []
     
     def trigger(self, level: int) -> None:
         self.__active = True
@@ -503,26 +596,49 @@ class LevelUpNotification:
             if elapsed > self.__duration - 500:
                 alpha = int(255 * (1 - (elapsed - (self.__duration - 500)) / 500))
             
-            text = self.__font.render(f"LEVEL UP! Level {self.__level}", True, YELLOW)
+            text = render_text(f"LEVEL UP! Level {self.__level}", self.__font, YELLOW, True)
             text.set_alpha(alpha)
             text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
             surface.blit(text, text_rect)
+            self.__rect = text_rect
 
 
 class LevelUpSelectionMenu:
     """Menu pemilihan upgrade saat level up."""
     
+    BACKDROP_DIM = (0, 0, 0, 180)
+    
     def __init__(self, display_surface: pygame.Surface):
         self.__display_surface = display_surface
         self.__active = False
         self.__cards = []
         self.__selected_card = None
         
-        self.font_title = pygame.font.Font(None, 64)
+        self.font_title = 64
         
         self.card_width = 450
         self.card_height = 140
         self.card_spacing = 20
+        
+        # Judul statis di-render sekali
+        self.__layer = self.__build_layer()
+    
+    def __build_layer(self) -> pygame.Surface:
+        """Judul dengan shadow dan subtitle."""
+        layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        
+        title_text = render_text("LEVEL UP!", self.font_title, (255, 220, 100), False)
+        title_rect = title_text.get_frect(center=(WINDOW_WIDTH // 2, 80))
+        
+        shadow_text = render_text("LEVEL UP!", self.font_title, (0, 0, 0), False)
+        shadow_rect = shadow_text.get_frect(center=(WINDOW_WIDTH // 2 + 3, 83))
+        layer.blit(shadow_text, shadow_rect)
+        layer.blit(title_text, title_rect)
+        
+        subtitle_text = render_text("Choose an upgrade", 28, (200, 200, 200), False)
+        subtitle_rect = subtitle_text.get_rect(center=(WINDOW_WIDTH // 2, 130))
+        layer.blit(subtitle_text, subtitle_rect)
+        return layer
     
     def show(self, upgrade_cards):
         """Tampilkan menu dengan kartu upgrade."""
@@ -547,30 +663,25 @@ class LevelUpSelectionMenu:
     def is_active(self) -> bool:
         return self.__active
     
+    @property
+    def upgrade_ids(self) -> list[str]:
+        """Id upgrade pada kartu yang sedang ditampilkan (urutan atas ke bawah)."""
+        return [card.card.id for card in self.__cards]
+    
+    @property
+    def idle_fps(self) -> int:
+        """Kartu hanya berubah karena hover (input mouse)."""
+        return 0
+    
+    def dirty_rects(self) -> list[pygame.Rect]:
+        # Margin untuk efek shake kartu
+        return [card.base_rect.inflate(8, 0) for card in self.__cards]
+    
     def draw(self):
         if not self.__active:
             return
         
-        # Overlay
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.__display_surface.blit(overlay, (0, 0))
-        
-        # Title dengan shadow
-        title_text = self.font_title.render("LEVEL UP!", False, (255, 220, 100))
-        title_rect = title_text.get_frect(center=(WINDOW_WIDTH // 2, 80))
-        
-        shadow_text = self.font_title.render("LEVEL UP!", False, (0, 0, 0))
-        shadow_rect = shadow_text.get_frect(center=(WINDOW_WIDTH // 2 + 3, 83))
-        self.__display_surface.blit(shadow_text, shadow_rect)
-        self.__display_surface.blit(title_text, title_rect)
-        
-        # Subtitle
-        subtitle_font = pygame.font.Font(None, 28)
-        subtitle_text = subtitle_font.render("Choose an upgrade", False, (200, 200, 200))
-        subtitle_rect = subtitle_text.get_rect(center=(WINDOW_WIDTH // 2, 130))
-        self.__display_surface.blit(subtitle_text, subtitle_rect)
+        self.__display_surface.blit(self.__layer, (0, 0))
         
         # Cards
         for card in self.__cards:
@@ -0,0 +1,83 @@
+"""
+UI Text Module
+Font registry, cache render string (LRU), dan cache layout word wrap.
+Semua UI di src/ui render teks lewat modul ini.
+"""
+import pygame
+from collections import OrderedDict
+
+TEXT_CACHE_SIZE = 512
+
+# Cache font per (face, size), surface per (face, size, text, color, antialias), dan layout wrap
+_fonts = {}
+_rendered = OrderedDict()
+_layouts = {}
+
+
+def _color_key(color) -> tuple:
+    """pygame.Color tidak hashable, jadi normalisasi ke tuple."""
+    return color if isinstance(color, tuple) else tuple(pygame.Color(color))
+
+
+def get_font(size: int, face: str = None) -> pygame.font.Font:
+    """Ambil font dari registry, dibuat sekali per (face, size)."""
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        try:
+            font = pygame.font.Font(face, size)
+        except (FileNotFoundError, OSError, pygame.error):
+            # Fallback ke font default jika file font tidak ada
+            font = pygame.font.Font(None, size)
+        _fonts[key] = font
+    return font
+
+
+def render_text(text: str, size: int, color, antialias: bool = True, face: str = None) -> pygame.Surface:
+    """
+    Render string dengan LRU cache.
+    Surface di-share antar pemanggil, jangan dimodifikasi (kecuali set_alpha sebelum blit).
+    """
+    key = (face, size, text, _color_key(color), antialias)
+    surf = _rendered.get(key)
+    if surf is not None:
+        _rendered.move_to_end(key)
+        return surf
+
+    surf = get_font(size, face).render(text, antialias, color)
+    _rendered[key] = surf
+    if len(_rendered) > TEXT_CACHE_SIZE:
+        _rendered.popitem(last=False)
+    return surf
+
+
+def wrap_text(text: str, size: int, max_width: int, face: str = None) -> tuple[str, ...]:
+    """Pecah teks per kata menjadi baris yang muat di max_width (hasil di-cache)."""
+    key = (face, size, text, max_width)
+    lines = _layouts.get(key)
+    if lines is not None:
+        return lines
+
+    font = get_font(size, face)
+    lines = []
+    current_line = []
+    for word in text.split(' '):
+        test_line = ' '.join(current_line + [word])
+        if font.size(test_line)[0] <= max_width:
+            current_line.append(word)
+        else:
+            if current_line:
+                lines.append(' '.join(current_line))
+            current_line = [word]
+    if current_line:
+        lines.append(' '.join(current_line))
+
+    lines = tuple(lines)
+    _layouts[key] = lines
+    return lines
+
+
+def clear_text_cache() -> None:
+    """Kosongkan cache surface dan layout (font tetap di registry)."""
+    _rendered.clear()
+    _layouts.clear()